@@ -0,0 +1,7 @@
+"""
+Benchmark Harness Package
+
+This package contains the measurement machinery used by the benchmark tool.
+"""
+
+# This file makes the 'bench' directory a Python package
@@ -0,0 +1,264 @@
+"""
+Result History Module
+
+This module contains the machine-readable side of a benchmark run. Every
+run becomes one record: the results, the environment they were measured
+in (Python, platform, CPU) and the run settings (dataset fingerprint,
+run counts). Records are exported as JSON or CSV and appended to a local
+JSON Lines history that is never rewritten, so earlier results stay
+available as baselines.
+"""
+
+import csv
+import json
+import math
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+# Version of the record layout, bumped when fields change meaning
+SCHEMA_VERSION = 1
+
+# Default history file for --history
+DEFAULT_HISTORY_FILE = "benchmark_history.jsonl"
+
+# Export formats by file suffix
+EXPORT_FORMATS = (".json", ".csv")
+
+
+def cpu_model() -> str:
+    """
+    Find a human-readable CPU name.
+
+    Returns:
+        The model name from /proc/cpuinfo on Linux, platform.processor()
+        elsewhere, or the machine type if neither is known
+    """
+    import platform
+
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as file:
+            for line in file:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def environment_metadata() -> Dict[str, Any]:
+    """
+    Describe the interpreter and machine the results were measured on.
+
+    Returns:
+        Dictionary of Python, platform and CPU details
+    """
+    # platform is slow to import and only needed when results are recorded
+    import platform
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "executable": sys.executable,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu": cpu_model(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def json_ready(value: Any) -> Any:
+    """
+    Convert results to values the json module writes as standard JSON.
+
+    Non-finite floats (e.g. an infinite break-even point) become null,
+    tuples become lists and other objects their string form.
+
+    Args:
+        value: Result value, possibly nested
+
+    Returns:
+        JSON-compatible copy of the value
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if value is None or isinstance(value, (str, int)):
+        return value
+    if isinstance(value, dict):
+        return {str(key): json_ready(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [json_ready(item) for item in value]
+    return str(value)
+
+
+def result_record(
+    mode: str, results: List[Dict], settings: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Bundle results with the environment and settings of the run.
+
+    Args:
+        mode: Benchmark mode, e.g. "single" or "batch"
+        results: Benchmark results
+        settings: Run settings such as the dataset fingerprint and run counts
+
+    Returns:
+        JSON-compatible record
+    """
+    return json_ready(
+        {
+            "schema": SCHEMA_VERSION,
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "mode": mode,
+            "environment": environment_metadata(),
+            "settings": settings,
+            "results": results,
+        }
+    )
+
+
+def _csv_rows(record: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Flatten a record to one row per result.
+
+    Nested values (the raw timing samples) are left out; every row repeats
+    the run's timestamp, environment and settings.
+
+    Args:
+        record: Record from result_record
+
+    Returns:
+        Rows with the same columns, in a stable order
+    """
+    context = {
+        "timestamp": record["timestamp"],
+        "mode": record["mode"],
+        **record["environment"],
+        **record["settings"],
+    }
+    columns: Dict[str, None] = {}
+    rows = []
+    for result in record["results"]:
+        row = {
+            key: value
+            for key, value in result.items()
+            if not isinstance(value, (list, dict))
+        }
+        columns.update(dict.fromkeys(row))
+        rows.append(row)
+
+    return [{**{key: row.get(key) for key in columns}, **context} for row in rows]
+
+
+def export_record(record: Dict[str, Any], path: Union[str, Path]) -> None:
+    """
+    Write a record to a file, as JSON or CSV depending on the suffix.
+
+    Args:
+        record: Record from result_record
+        path: Output file ending in .json or .csv
+
+    Raises:
+        ValueError: If the suffix is not one of EXPORT_FORMATS
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Cannot export to {path}: use one of {', '.join(EXPORT_FORMATS)}"
+        )
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if suffix == ".json":
+        path.write_text(json.dumps(record, indent=2) + "\n", encoding="utf-8")
+        return
+
+    rows = _csv_rows(record)
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0]) if rows else [])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def append_history(record: Dict[str, Any], path: Union[str, Path]) -> None:
+    """
+    Append a record to the history as one JSON line.
+
+    Args:
+        record: Record from result_record
+        path: History file, created if missing
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as file:
+        file.write(json.dumps(record) + "\n")
+
+
+def load_history(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """
+    Read every record from a history file.
+
+    Lines that are not valid JSON (e.g. a write cut short) are skipped.
+
+    Args:
+        path: History file
+
+    Returns:
+        Records, oldest first; none if the file does not exist yet
+    """
+    if not Path(path).exists():
+        return []
+
+    records = []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records
+
+
+def load_baseline(
+    path: Union[str, Path], mode: str, fingerprint: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Load the record to compare a run against.
+
+    A .json file is a single exported record. Any other file is read as a
+    history, and its latest record of the same mode is used, preferring
+    records measured on the same dataset; a history without one (or not
+    created yet) has no baseline, so a first run can start it.
+
+    Args:
+        path: Exported record or history file
+        mode: Mode of the current run
+        fingerprint: Dataset fingerprint of the current run
+
+    Returns:
+        Baseline record, or None if the history holds none of the same mode
+
+    Raises:
+        ValueError: If an exported record is of a different mode
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        record = json.loads(path.read_text(encoding="utf-8"))
+        if record.get("mode") != mode:
+            raise ValueError(
+                f"Baseline {path} is a {record.get('mode')} run, not a {mode} run"
+            )
+        return record
+
+    candidates = [record for record in load_history(path) if record.get("mode") == mode]
+    if not candidates:
+        return None
+
+    same_data = [
+        record
+        for record in candidates
+        if record.get("settings", {}).get("dataset_fingerprint") == fingerprint
+    ]
+    return (same_data or candidates)[-1]
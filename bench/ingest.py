@@ -0,0 +1,174 @@
+"""
+Ingest Benchmark Module
+
+This module contains the mixed insert/lookup benchmark for growing
+datasets. One part of the dataset is bulk-loaded, the rest arrives as
+inserts in file order, interleaved with lookups of records that have
+already arrived. The same operation stream is replayed against an
+LSMSortedIndex per search algorithm and against a single sorted list kept
+up to date with insort, the baseline an append-and-re-sort loop reduces to.
+"""
+
+import gc
+import random
+import time
+from bisect import insort
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from bench.timing import timer_overhead
+
+# Default fraction of operations that are inserts
+DEFAULT_INSERT_RATIO = 0.5
+
+INSERT = "insert"
+LOOKUP = "lookup"
+
+
+class SortedListIndex:
+    """One sorted list updated in place with insort; the baseline."""
+
+    def __init__(self, records: Sequence[str]):
+        """
+        Bulk-load the initial records.
+
+        Args:
+            records: Initial records, in any order
+        """
+        self._records = sorted(records)
+
+    def insert(self, value: str) -> None:
+        """
+        Add a record at its sorted position.
+
+        Time complexity: O(n) for shifting the tail of the list
+
+        Args:
+            value: Record to add
+        """
+        insort(self._records, value)
+
+    def search(self, target: str, algorithm: Callable) -> int:
+        """
+        Search the sorted list.
+
+        Args:
+            target: Element to search for
+            algorithm: Sorted-input search function
+
+        Returns:
+            Index of the element if found, -1 otherwise
+        """
+        return algorithm(self._records, target)
+
+    def stats(self) -> Dict[str, float]:
+        """Report the (single) run."""
+        return {"runs": 1}
+
+
+def ingest_operations(
+    data: Sequence[str],
+    count: int,
+    insert_ratio: float = DEFAULT_INSERT_RATIO,
+    seed: int = 0,
+) -> Tuple[List[str], List[Tuple[str, str]]]:
+    """
+    Split a dataset into initial records and an interleaved operation stream.
+
+    Inserts take the last records of the dataset in file order, capped at
+    half of it; lookups pick uniformly among the records present so far.
+
+    Args:
+        data: Dataset in its original order
+        count: Number of operations
+        insert_ratio: Fraction of operations that are inserts
+        seed: Random seed
+
+    Returns:
+        Tuple containing (initial records, list of (operation, record))
+
+    Raises:
+        ValueError: If insert_ratio is outside [0, 1] or data is empty
+    """
+    if not 0 <= insert_ratio <= 1:
+        raise ValueError("Insert ratio must be between 0 and 1")
+    if not len(data):
+        raise ValueError("Cannot build an ingest stream from an empty dataset")
+
+    rng = random.Random(seed)
+    inserts = min(round(count * insert_ratio), len(data) // 2)
+    split = len(data) - inserts
+    initial = list(data[:split])
+    arrivals = iter(data[split:])
+
+    kinds = [INSERT] * inserts + [LOOKUP] * (count - inserts)
+    rng.shuffle(kinds)
+
+    present = split
+    operations = []
+    for kind in kinds:
+        if kind == INSERT:
+            operations.append((INSERT, next(arrivals)))
+            present += 1
+        else:
+            operations.append((LOOKUP, data[rng.randrange(present)]))
+
+    return initial, operations
+
+
+def run_ingest(
+    index, algorithm: Callable, operations: List[Tuple[str, str]]
+) -> Dict[str, float]:
+    """
+    Replay an operation stream, timing every insert and lookup on its own.
+
+    The garbage collector is disabled and the cost of reading the timer is
+    subtracted from every sample.
+
+    Args:
+        index: dataset.lsm.LSMSortedIndex or SortedListIndex holding the
+               initial records
+        algorithm: Sorted-input search function used for lookups
+        operations: Stream from ingest_operations
+
+    Returns:
+        Dictionary with insert throughput, per-lookup latencies and the
+        index's stats
+    """
+    overhead = timer_overhead()
+    counter = time.perf_counter
+    insert_times = []
+    latencies = []
+    found = 0
+
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for kind, value in operations:
+            if kind == INSERT:
+                start_time = counter()
+                index.insert(value)
+                end_time = counter()
+                insert_times.append(max(end_time - start_time - overhead, 0.0))
+            else:
+                start_time = counter()
+                result = index.search(value, algorithm)
+                end_time = counter()
+                latencies.append(max(end_time - start_time - overhead, 0.0))
+                if result != -1:
+                    found += 1
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    insert_total = sum(insert_times)
+    result = {
+        "inserts": len(insert_times),
+        "inserts_per_second": (
+            len(insert_times) / insert_total if insert_total > 0 else 0.0
+        ),
+        "lookups": len(latencies),
+        "found": found,
+        "latencies": latencies,
+    }
+    result.update(index.stats())
+    return result
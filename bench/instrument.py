@@ -0,0 +1,199 @@
+"""
+Probe Instrumentation Module
+
+This module contains the counting pass behind --instrument. The dataset is
+wrapped in a Sequence proxy that records every element access and where it
+landed, and each target in a str subclass that counts every comparison made
+against it, whichever side of the operator it is on. The algorithms run
+unchanged on both, so the counts explain their timings in terms of probes
+and memory locality.
+
+The timed runs never see the proxies: instrumentation is a separate pass
+over the same queries, so it adds no overhead when it is off.
+"""
+
+from collections.abc import Sequence
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class ProbeCounter:
+    """
+    Running totals of element accesses, comparisons and probe distances.
+
+    Reading the element that was just read again (binary search reads
+    arr[mid] once per comparison) is counted as a re-read, not as another
+    access, so accesses count probes and the distance averages the jumps
+    between them.
+    """
+
+    def __init__(self):
+        """Start with all counts at zero."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero every count."""
+        self.accesses = 0
+        self.rereads = 0
+        self.comparisons = 0
+        self.distance = 0
+        self.steps = 0
+        self._last: Optional[int] = None
+
+    def new_query(self) -> None:
+        """Forget the last probe, so distances never span two queries."""
+        self._last = None
+
+    def access(self, index: int) -> None:
+        """
+        Record an access to one element.
+
+        Args:
+            index: Non-negative index of the element
+        """
+        if index == self._last:
+            self.rereads += 1
+            return
+
+        self.accesses += 1
+        if self._last is not None:
+            self.distance += abs(index - self._last)
+            self.steps += 1
+        self._last = index
+
+
+class CountingKey(str):
+    """A target string that counts every comparison made against it."""
+
+    __hash__ = str.__hash__
+
+    def __new__(cls, value: str, counter: ProbeCounter) -> "CountingKey":
+        key = super().__new__(cls, value)
+        key._counter = counter
+        return key
+
+    def __reduce__(self):
+        # Other processes receive the plain string and count nothing
+        return str, (str(self),)
+
+    def __eq__(self, other: Any) -> bool:
+        self._counter.comparisons += 1
+        return str.__eq__(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        self._counter.comparisons += 1
+        return str.__ne__(self, other)
+
+    def __lt__(self, other: Any) -> bool:
+        self._counter.comparisons += 1
+        return str.__lt__(self, other)
+
+    def __le__(self, other: Any) -> bool:
+        self._counter.comparisons += 1
+        return str.__le__(self, other)
+
+    def __gt__(self, other: Any) -> bool:
+        self._counter.comparisons += 1
+        return str.__gt__(self, other)
+
+    def __ge__(self, other: Any) -> bool:
+        self._counter.comparisons += 1
+        return str.__ge__(self, other)
+
+
+class CountingSequence(Sequence):
+    """
+    Read-through proxy that records the index of every element access.
+
+    copy() and append() are supported so that sentinel linear search works;
+    the copy reports to the same counter.
+    """
+
+    def __init__(self, data: Sequence, counter: ProbeCounter):
+        """
+        Wrap a dataset.
+
+        Args:
+            data: Dataset to wrap
+            counter: Counter to record accesses in
+        """
+        self._data = data
+        self._counter = counter
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            for i in range(*index.indices(len(self._data))):
+                self._counter.access(i)
+            return self._data[index]
+        if index < 0:
+            index += len(self._data)
+        self._counter.access(index)
+        return self._data[index]
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        self._data[index] = value
+
+    def __iter__(self) -> Iterator:
+        access = self._counter.access
+        for i, value in enumerate(self._data):
+            access(i)
+            yield value
+
+    def copy(self) -> "CountingSequence":
+        """Copy the wrapped data into a new proxy on the same counter."""
+        return CountingSequence(list(self._data), self._counter)
+
+    def append(self, value: Any) -> None:
+        """
+        Append to the wrapped data.
+
+        Args:
+            value: Element to append
+        """
+        self._data.append(value)
+
+
+def count_probes(
+    algorithm, data: Sequence[str], targets: List[str]
+) -> Dict[str, float]:
+    """
+    Run every target once through the proxies and average the counts.
+
+    Prepared engines are rebuilt over the proxy before counting starts, so
+    their build is not counted; the caller's next timed run rebuilds them
+    over the real data. Accesses inside an engine's own structures are not
+    dataset accesses and are not counted, and neither is work done in other
+    processes; comparisons against the target are counted everywhere else.
+
+    Args:
+        algorithm: Search function or engine called as algorithm(arr, target)
+        data: Dataset to search in
+        targets: Queries
+
+    Returns:
+        Per-query accesses (re-reads of the element just read counted
+        separately) and comparisons, and the mean distance between
+        consecutive accesses within a query
+    """
+    counter = ProbeCounter()
+    proxy = CountingSequence(data, counter)
+    keys = [CountingKey(target, counter) for target in targets]
+
+    engine = getattr(algorithm, "__self__", algorithm)
+    if hasattr(engine, "prepare"):
+        engine.prepare(proxy)
+    counter.reset()
+
+    for key in keys:
+        counter.new_query()
+        algorithm(proxy, key)
+
+    queries = max(len(keys), 1)
+    return {
+        "accesses": counter.accesses / queries,
+        "rereads": counter.rereads / queries,
+        "comparisons": counter.comparisons / queries,
+        "probe_distance": counter.distance / counter.steps if counter.steps else 0.0,
+    }
@@ -0,0 +1,190 @@
+"""
+Algorithm Planner Module
+
+This module contains the planner behind --algorithm auto. It profiles the
+dataset, drops candidates that cannot win on data of that shape, times the
+rest on a short calibration stream and remembers the winner per dataset
+fingerprint, so later runs on the same file skip the calibration.
+"""
+
+import json
+from pathlib import Path
+from typing import Callable, Collection, Dict, List, NamedTuple, Optional, Sequence
+
+from bench.sweep import claimed_complexity, run_queries
+from bench.timing import calibrated_timing
+from bench.workload import WorkloadProfile, generate_workload
+from dataset.profile import DatasetProfile, profile_dataset
+
+# File in the cache directory holding decisions per dataset fingerprint
+PLAN_FILE = "plans.json"
+
+# Query stream the candidates are timed on
+CALIBRATION_PROFILE = WorkloadProfile("calibration", hit_ratio=0.8)
+CALIBRATION_QUERIES = 64
+CALIBRATION_TIME = 0.01
+CALIBRATION_REPEAT = 3
+
+# Largest dataset on which an O(n) scan is worth calibrating
+SCAN_LIMIT = 2048
+
+# Smallest key uniformity at which interpolation is worth calibrating
+UNIFORMITY_THRESHOLD = 0.5
+
+# Algorithms whose probes depend on the key distribution
+INTERPOLATING = ("interpolation", "string_interpolation")
+
+
+class Plan(NamedTuple):
+    """Algorithm chosen for a dataset, with the evidence behind the choice."""
+
+    algorithm: str
+    profile: DatasetProfile
+    timings: Dict[str, float]
+    cached: bool
+
+
+def candidate_names(
+    algorithms: Dict[str, Callable], profile: DatasetProfile
+) -> List[str]:
+    """
+    Select the algorithms worth calibrating for a dataset profile.
+
+    Scans (algorithms whose docstring claims linear time) are dropped on
+    large datasets, interpolation on clustered keys, and parallel scans
+    always, since starting their worker processes costs more than the
+    calibration itself.
+
+    Args:
+        algorithms: Registered algorithms by name
+        profile: Profile of the dataset
+
+    Returns:
+        Candidate algorithm names
+    """
+    candidates = []
+    for name, algorithm in algorithms.items():
+        if name.startswith("parallel_linear"):
+            continue
+        scan = claimed_complexity(algorithm).startswith("O(n")
+        if scan and profile.size > SCAN_LIMIT:
+            continue
+        if name in INTERPOLATING and profile.uniformity < UNIFORMITY_THRESHOLD:
+            continue
+        candidates.append(name)
+    return candidates
+
+
+def calibrate(
+    candidates: Dict[str, Callable],
+    data: Sequence[str],
+    sorted_data: Sequence[str],
+    need_sorted: Collection[str],
+    seed: int = 0,
+) -> Dict[str, float]:
+    """
+    Time every candidate on the same short query stream.
+
+    Args:
+        candidates: Candidate algorithms by name
+        data: Dataset in its original order
+        sorted_data: Sorted dataset
+        need_sorted: Names of algorithms that require sorted input
+        seed: Random seed of the calibration stream
+
+    Returns:
+        Best per-query time in seconds for each candidate
+    """
+    stream = generate_workload(
+        sorted_data, CALIBRATION_PROFILE, CALIBRATION_QUERIES, seed
+    )
+    timings = {}
+
+    for name, algorithm in candidates.items():
+        dataset = sorted_data if name in need_sorted else data
+        engine = getattr(algorithm, "__self__", algorithm)
+        if hasattr(engine, "prepare"):
+            engine.prepare(dataset)
+
+        timing = calibrated_timing(
+            run_queries,
+            (algorithm, dataset, stream),
+            CALIBRATION_REPEAT,
+            CALIBRATION_TIME,
+        )
+        timings[name] = min(timing.per_call_times) / max(len(stream), 1)
+
+    return timings
+
+
+def load_plans(cache_dir: Path) -> Dict[str, Dict]:
+    """
+    Read the stored decisions.
+
+    Args:
+        cache_dir: Directory holding the plan file
+
+    Returns:
+        Decisions by dataset fingerprint, empty if none are stored
+    """
+    path = cache_dir / PLAN_FILE
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def plan_algorithm(
+    data: Sequence[str],
+    sorted_data: Sequence[str],
+    algorithms: Dict[str, Callable],
+    need_sorted: Collection[str],
+    fingerprint: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+) -> Plan:
+    """
+    Choose the fastest algorithm for a dataset.
+
+    A stored decision is reused when it was made for the same dataset
+    fingerprint and the same candidate set; otherwise the candidates are
+    calibrated and the decision is stored.
+
+    Args:
+        data: Dataset in its original order
+        sorted_data: Sorted dataset (data itself when it is presorted)
+        algorithms: Registered algorithms by name
+        need_sorted: Names of algorithms that require sorted input
+        fingerprint: Content hash of the dataset file, None to skip the cache
+        cache_dir: Directory for the decision cache, None to skip the cache
+
+    Returns:
+        The chosen Plan
+    """
+    profile = profile_dataset(data, sorted_data)
+    names = candidate_names(algorithms, profile)
+
+    use_cache = fingerprint is not None and cache_dir is not None
+    plans = load_plans(Path(cache_dir)) if use_cache else {}
+    stored = plans.get(fingerprint)
+    if stored is not None and stored.get("candidates") == names:
+        return Plan(stored["algorithm"], profile, stored["timings"], True)
+
+    timings = calibrate(
+        {name: algorithms[name] for name in names}, data, sorted_data, need_sorted
+    )
+    algorithm = min(timings, key=timings.get)
+
+    if use_cache:
+        plans[fingerprint] = {
+            "algorithm": algorithm,
+            "candidates": names,
+            "timings": timings,
+            "profile": profile._asdict(),
+        }
+        path = Path(cache_dir) / PLAN_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(plans, indent=2), encoding="utf-8")
+
+    return Plan(algorithm, profile, timings, False)
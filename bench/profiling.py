@@ -0,0 +1,176 @@
+"""
+Profiling Module
+
+This module contains the passes behind --profile and --trace-memory. Each
+runs the queries again after the timed runs, so neither cProfile nor
+tracemalloc ever distorts a timing:
+
+- The profile pass records the calls under cProfile and writes a pstats
+  dump plus a collapsed-stack file that flamegraph tools read directly.
+- The memory pass runs every query under tracemalloc and reports the
+  largest peak a single call allocated. tracemalloc only tracks live
+  blocks, so allocations freed before a call returns are visible in the
+  peak but cannot be counted.
+"""
+
+import cProfile
+import pstats
+import re
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple
+
+# Minimum number of calls recorded by the profile pass
+PROFILE_CALLS = 1000
+
+# pstats function key: (filename, line, function name)
+FunctionKey = Tuple[str, int, str]
+
+
+def _slug(label: str) -> str:
+    """
+    Turn a result label into a file name.
+
+    Args:
+        label: Result label, e.g. "binary (numpy)"
+
+    Returns:
+        Label with runs of other characters replaced by underscores
+    """
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", label).strip("_")
+
+
+def _frame_name(key: FunctionKey) -> str:
+    """
+    Format a pstats function key as a flamegraph frame.
+
+    Args:
+        key: pstats function key
+
+    Returns:
+        "name (file:line)" for Python functions, the bare name for builtins
+    """
+    filename, line, name = key
+    frame = name if filename == "~" else f"{name} ({Path(filename).name}:{line})"
+    return frame.replace(";", ",")
+
+
+def collapsed_stacks(stats: pstats.Stats) -> List[str]:
+    """
+    Rebuild collapsed stacks ("root;caller;callee self_time") from a profile.
+
+    cProfile keeps caller/callee edges rather than whole stacks, so deeper
+    frames are split between their callers in proportion to the time each
+    edge accounts for. Self times are in microseconds.
+
+    Args:
+        stats: Loaded profile
+
+    Returns:
+        One line per distinct stack
+    """
+    totals: Dict[FunctionKey, Tuple[float, float]] = {}
+    children: Dict[FunctionKey, Dict[FunctionKey, float]] = defaultdict(dict)
+    roots = []
+
+    for func, (_, _, tt, ct, callers) in stats.stats.items():
+        totals[func] = (tt, ct)
+        # The profiler's own disable() call is recorded as a root too
+        if not callers and "_lsprof.Profiler" not in func[2]:
+            roots.append(func)
+        for caller, edge in callers.items():
+            children[caller][func] = edge[3]
+
+    lines: Dict[str, float] = defaultdict(float)
+
+    def visit(func: FunctionKey, path: List[FunctionKey], scale: float) -> None:
+        tt, _ = totals[func]
+        lines[";".join(_frame_name(frame) for frame in path)] += tt * scale
+        for child, edge_time in children[func].items():
+            child_time = totals[child][1]
+            # Recursive calls are already part of the frame's own time
+            if child in path or child_time <= 0:
+                continue
+            visit(child, [*path, child], scale * min(edge_time / child_time, 1.0))
+
+    for root in roots:
+        visit(root, [root], 1.0)
+
+    return [
+        f"{stack} {round(seconds * 1e6)}"
+        for stack, seconds in lines.items()
+        if round(seconds * 1e6) > 0
+    ]
+
+
+def profile_calls(
+    label: str,
+    algorithm: Callable,
+    data: Sequence[str],
+    targets: List[str],
+    directory: str,
+) -> Path:
+    """
+    Profile the queries and write the pstats dump and collapsed stacks.
+
+    The targets are replayed until at least PROFILE_CALLS calls are made.
+
+    Args:
+        label: Result label, used for the file names
+        algorithm: Search function called as algorithm(data, target)
+        data: Dataset to search in
+        targets: Queries
+        directory: Directory for the output files
+
+    Returns:
+        Path of the pstats dump; the collapsed stacks are next to it
+    """
+    rounds = -(-PROFILE_CALLS // max(len(targets), 1))
+    profiler = cProfile.Profile()
+
+    profiler.enable()
+    for _ in range(rounds):
+        for target in targets:
+            algorithm(data, target)
+    profiler.disable()
+
+    output = Path(directory)
+    output.mkdir(parents=True, exist_ok=True)
+    path = output / f"{_slug(label)}.prof"
+    profiler.dump_stats(path)
+
+    stacks = collapsed_stacks(pstats.Stats(profiler))
+    path.with_suffix(".collapsed").write_text(
+        "\n".join(stacks) + "\n", encoding="utf-8"
+    )
+    return path
+
+
+def trace_memory(
+    algorithm: Callable, data: Sequence[str], targets: List[str]
+) -> Dict[str, int]:
+    """
+    Run every query once under tracemalloc.
+
+    Args:
+        algorithm: Search function called as algorithm(data, target)
+        data: Dataset to search in
+        targets: Queries
+
+    Returns:
+        Dictionary with the largest per-call peak in bytes
+    """
+    peak = 0
+
+    tracemalloc.start()
+    try:
+        for target in targets:
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            algorithm(data, target)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - current)
+    finally:
+        tracemalloc.stop()
+
+    return {"peak_memory": peak}
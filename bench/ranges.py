@@ -0,0 +1,240 @@
+"""
+Range Query Benchmark Module
+
+This module contains the benchmark behind --ranges. Each range query of
+search.ranges (duplicate counts, equal ranges, prefix ranges and value
+ranges) is timed on the sorted dataset against the linear filter it
+replaces, once per query and once batched, on the same seeded queries.
+Bisection answers with a view of the sorted list, the filters with a
+list of the matching records; both answers are checked to agree.
+"""
+
+import random
+import statistics
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from bench.timing import DEFAULT_MIN_TIME, calibrated_timing
+from search.ranges import (
+    RangeView,
+    count_equal,
+    count_equal_many,
+    equal_range,
+    equal_range_many,
+    prefix_range,
+    prefix_range_many,
+    value_range,
+    value_range_many,
+)
+
+# Queries the linear filters are timed on; they cost O(n) each
+LINEAR_QUERIES = 50
+
+# Prefix lengths drawn for prefix queries
+PREFIX_LENGTHS = (1, 2, 3)
+
+LINEAR = "linear filter"
+BISECTION = "bisection"
+BATCHED = "batched bisection"
+
+
+class RangeOperation(NamedTuple):
+    """A range query with its linear filter and bisection variants."""
+
+    name: str
+    linear: Callable[[Sequence[str], Any], Any]
+    single: Callable[[Sequence[str], Any], Any]
+    batch: Callable[[Sequence[str], Sequence[Any]], List[Any]]
+
+
+def range_queries(
+    sorted_data: Sequence[str], count: int, seed: int = 0
+) -> Dict[str, List[Any]]:
+    """
+    Draw seeded queries for every range operation from the dataset.
+
+    Args:
+        sorted_data: Sorted dataset
+        count: Number of queries per operation
+        seed: Random seed
+
+    Returns:
+        Targets for "count" and "equal range", short prefixes of records for
+        "prefix" and ordered (low, high) record pairs for "value range"
+
+    Raises:
+        ValueError: If the dataset is empty
+    """
+    if not len(sorted_data):
+        raise ValueError("Cannot draw range queries from an empty dataset")
+
+    rng = random.Random(seed)
+
+    def record() -> str:
+        return sorted_data[rng.randrange(len(sorted_data))]
+
+    targets = [record() for _ in range(count)]
+    prefixes = [record()[: rng.choice(PREFIX_LENGTHS)] for _ in range(count)]
+    ranges = [tuple(sorted((record(), record()))) for _ in range(count)]
+
+    return {
+        "count": targets,
+        "equal range": targets,
+        "prefix": prefixes,
+        "value range": ranges,
+    }
+
+
+def linear_count(data: Sequence[str], target: str) -> int:
+    """Count copies of target by scanning every record."""
+    return sum(1 for value in data if value == target)
+
+
+def linear_equal(data: Sequence[str], target: str) -> List[str]:
+    """Collect copies of target by scanning every record."""
+    return [value for value in data if value == target]
+
+
+def linear_prefix(data: Sequence[str], prefix: str) -> List[str]:
+    """Collect records starting with prefix by scanning every record."""
+    return [value for value in data if value.startswith(prefix)]
+
+
+def linear_value_range(data: Sequence[str], bounds: Tuple[str, str]) -> List[str]:
+    """Collect records in [low, high] by scanning every record."""
+    low, high = bounds
+    return [value for value in data if low <= value <= high]
+
+
+OPERATIONS = [
+    RangeOperation("count", linear_count, count_equal, count_equal_many),
+    RangeOperation(
+        "equal range",
+        linear_equal,
+        lambda data, target: RangeView(data, equal_range(data, target)),
+        lambda data, targets: [
+            RangeView(data, span) for span in equal_range_many(data, targets)
+        ],
+    ),
+    RangeOperation(
+        "prefix",
+        linear_prefix,
+        lambda data, prefix: RangeView(data, prefix_range(data, prefix)),
+        lambda data, prefixes: [
+            RangeView(data, span) for span in prefix_range_many(data, prefixes)
+        ],
+    ),
+    RangeOperation(
+        "value range",
+        linear_value_range,
+        lambda data, bounds: RangeView(data, value_range(data, *bounds)),
+        lambda data, ranges: [
+            RangeView(data, span) for span in value_range_many(data, ranges)
+        ],
+    ),
+]
+
+
+def _run_each(func: Callable, data: Sequence[str], queries: List[Any]) -> List[Any]:
+    """Answer every query with one call each."""
+    return [func(data, query) for query in queries]
+
+
+def _matches(answer: Any) -> int:
+    """Number of records in an answer: a count, a list or a view."""
+    return answer if isinstance(answer, int) else len(answer)
+
+
+def _same_answer(expected: Any, answer: Any) -> bool:
+    """Whether a bisection answer holds the same records as a filter's."""
+    if isinstance(expected, int):
+        return expected == answer
+    return expected == list(answer)
+
+
+def _span(answer: Any) -> Any:
+    """Comparable form of a bisection answer: a count or (start, stop)."""
+    return answer if isinstance(answer, int) else (answer.start, answer.stop)
+
+
+def benchmark_ranges(
+    sorted_data: Sequence[str],
+    queries: Dict[str, List[Any]],
+    runs: int = 5,
+    min_time: float = DEFAULT_MIN_TIME,
+    on_step: Optional[Callable[[str], None]] = None,
+) -> List[Dict]:
+    """
+    Time every range operation as a linear filter, per query and batched.
+
+    The linear filter only runs on the first LINEAR_QUERIES queries; all
+    times are reported per query, so the rows stay comparable.
+
+    Args:
+        sorted_data: Sorted dataset
+        queries: Queries per operation, from range_queries
+        runs: Number of timed batches per method
+        min_time: Minimum duration of one timed batch in seconds
+        on_step: Called with a label after each measured method
+
+    Returns:
+        One result per operation and method
+
+    Raises:
+        RuntimeError: If bisection and the linear filter disagree
+    """
+    results = []
+
+    for operation in OPERATIONS:
+        stream = queries[operation.name]
+        sample = stream[:LINEAR_QUERIES]
+        methods = [
+            (LINEAR, _run_each, (operation.linear, sorted_data, sample)),
+            (BISECTION, _run_each, (operation.single, sorted_data, stream)),
+            (BATCHED, operation.batch, (sorted_data, stream)),
+        ]
+
+        answers = {}
+        operation_results = []
+        for method, func, args in methods:
+            timing = calibrated_timing(func, args, runs, min_time)
+            answered = len(args[-1])
+            samples = [time / answered for time in timing.per_call_times]
+            answers[method] = timing.result
+
+            operation_results.append(
+                {
+                    "algorithm": f"{operation.name} ({method})",
+                    "operation": operation.name,
+                    "method": method,
+                    "queries": answered,
+                    "median_time": statistics.median(samples),
+                    "matches": sum(map(_matches, timing.result)) / answered,
+                    "samples": samples,
+                }
+            )
+            if on_step is not None:
+                on_step(f"{operation.name} ({method})")
+
+        # The filters check the single-query answers on the sample, which
+        # in turn check the batched answers on the whole stream
+        agrees = all(
+            _same_answer(expected, answer)
+            for expected, answer in zip(answers[LINEAR], answers[BISECTION])
+        )
+        if not agrees:
+            raise RuntimeError(f"{operation.name} disagrees with the linear filter")
+        if list(map(_span, answers[BATCHED])) != list(map(_span, answers[BISECTION])):
+            raise RuntimeError(
+                f"Batched {operation.name} disagrees with single queries"
+            )
+
+        linear_time = operation_results[0]["median_time"]
+        for result in operation_results:
+            result["speedup"] = (
+                linear_time / result["median_time"]
+                if result["median_time"] > 0
+                else float("inf")
+            )
+        results.extend(operation_results)
+
+    return results
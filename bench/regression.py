@@ -0,0 +1,196 @@
+"""
+Regression Gating Module
+
+This module contains the comparison behind --compare-baseline. Per-run
+timing samples of every algorithm are compared with those of a stored
+baseline run using a one-sided Mann-Whitney U test, which makes no
+normality assumption and is not pulled around by a single outlier run.
+An algorithm only counts as regressed when the slowdown of its median is
+both larger than the threshold and statistically significant, so noise
+between runs is not reported as a regression however large the raw
+average delta happens to be.
+"""
+
+import math
+import statistics
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+# Default slowdown of the median, as a fraction, that counts as a regression
+DEFAULT_THRESHOLD = 0.05
+
+# Default significance level of the test
+DEFAULT_ALPHA = 0.05
+
+# Largest m * n for which the exact U distribution is computed
+EXACT_LIMIT = 400
+
+REGRESSION = "regression"
+IMPROVEMENT = "improvement"
+UNCHANGED = "unchanged"
+NEW = "new"
+NO_SAMPLES = "no samples"
+
+
+class Comparison(NamedTuple):
+    """Outcome of comparing one algorithm with its baseline."""
+
+    algorithm: str
+    verdict: str
+    baseline_median: Optional[float]
+    current_median: Optional[float]
+    change: Optional[float]
+    p_value: Optional[float]
+
+
+def _midranks(values: Sequence[float]) -> List[float]:
+    """
+    Rank values from 1, giving tied values the mean of their ranks.
+
+    Args:
+        values: Values to rank
+
+    Returns:
+        Rank of each value, in input order
+    """
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 + 1
+        i = j + 1
+    return ranks
+
+
+def _exact_upper_tail(m: int, n: int, u: float) -> float:
+    """
+    P(U >= u) under the null hypothesis, without ties.
+
+    Counts the orderings of m + n values by U, the number of (x, y) pairs
+    with x from the first sample above y from the second: the largest
+    value either comes from the first sample and beats all n values of
+    the second, or from the second and beats none.
+
+    Args:
+        m: Size of the first sample
+        n: Size of the second sample
+        u: Observed U statistic
+
+    Returns:
+        Upper tail probability
+    """
+    # counts[j][k]: orderings of (i, j) values with U = k, for the current i
+    counts = [[1] for _ in range(n + 1)]
+    for i in range(1, m + 1):
+        row = [[1]]
+        for j in range(1, n + 1):
+            poly = [0] * (i * j + 1)
+            for k, count in enumerate(row[j - 1]):
+                poly[k] += count
+            for k, count in enumerate(counts[j]):
+                poly[k + j] += count
+            row.append(poly)
+        counts = row
+
+    distribution = counts[n]
+    return sum(distribution[math.ceil(u) :]) / sum(distribution)
+
+
+def mann_whitney_greater(first: Sequence[float], second: Sequence[float]) -> float:
+    """
+    One-sided Mann-Whitney U test that the first sample tends to be larger.
+
+    Small samples without ties use the exact distribution of U; otherwise
+    the normal approximation with tie and continuity corrections.
+
+    Args:
+        first: First sample, e.g. current timings
+        second: Second sample, e.g. baseline timings
+
+    Returns:
+        p-value; 1.0 if either sample is empty
+    """
+    m, n = len(first), len(second)
+    if not m or not n:
+        return 1.0
+
+    ranks = _midranks([*first, *second])
+    u = sum(ranks[:m]) - m * (m + 1) / 2
+
+    ties = len(set(first) | set(second)) < m + n
+    if not ties and m * n <= EXACT_LIMIT:
+        return _exact_upper_tail(m, n, u)
+
+    total = m + n
+    tie_term = sum(
+        count**3 - count
+        for count in (ranks.count(rank) for rank in set(ranks))
+        if count > 1
+    )
+    variance = m * n / 12 * ((total + 1) - tie_term / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - m * n / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare_results(
+    current: List[Dict],
+    baseline: List[Dict],
+    threshold: float = DEFAULT_THRESHOLD,
+    alpha: float = DEFAULT_ALPHA,
+) -> List[Comparison]:
+    """
+    Compare every current result with the baseline result of the same label.
+
+    Both need per-run "samples" (seconds per query). An algorithm regressed
+    if its median is more than threshold slower and the test against the
+    baseline samples is significant at alpha; improvements are found the
+    same way in the other direction.
+
+    Args:
+        current: Results of this run
+        baseline: Results of the baseline run
+        threshold: Smallest relative change of the median that counts
+        alpha: Significance level
+
+    Returns:
+        One comparison per current result, in the same order
+    """
+    baseline_by_label = {result["algorithm"]: result for result in baseline}
+    comparisons = []
+
+    for result in current:
+        label = result["algorithm"]
+        reference = baseline_by_label.get(label)
+        if reference is None:
+            comparisons.append(Comparison(label, NEW, None, None, None, None))
+            continue
+
+        samples = result.get("samples") or []
+        reference_samples = reference.get("samples") or []
+        if not samples or not reference_samples:
+            comparisons.append(Comparison(label, NO_SAMPLES, None, None, None, None))
+            continue
+
+        current_median = statistics.median(samples)
+        baseline_median = statistics.median(reference_samples)
+        change = current_median / baseline_median - 1 if baseline_median > 0 else 0.0
+
+        if change > 0:
+            p_value = mann_whitney_greater(samples, reference_samples)
+            significant = change > threshold and p_value < alpha
+            verdict = REGRESSION if significant else UNCHANGED
+        else:
+            p_value = mann_whitney_greater(reference_samples, samples)
+            significant = -change > threshold and p_value < alpha
+            verdict = IMPROVEMENT if significant else UNCHANGED
+
+        comparisons.append(
+            Comparison(label, verdict, baseline_median, current_median, change, p_value)
+        )
+
+    return comparisons
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark Module
+
+This module measures how long the tool takes to start, which dominates
+when it is invoked many times from scripts. Every command runs in a fresh
+interpreter, several times, on a tiny generated data file:
+
+- the bare interpreter, the floor nothing can go below
+- main.py --help, i.e. argument parsing only
+- a headless --format json lookup, the path scripts should use
+- the same lookup with rich table output
+
+The headless run is repeated once under -X importtime to report the
+slowest imports and to check that rich is never imported on that path;
+the exit status is non-zero if it is.
+
+Run from the repository root:
+
+    python3 -m bench.startup --repeat 20
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Default number of launches per command
+DEFAULT_REPEAT = 10
+
+# Number of slowest imports reported
+TOP_IMPORTS = 10
+
+# main.py, run by path so the measurement includes its own compilation cache
+MAIN = Path(__file__).resolve().parents[1] / "main.py"
+
+# Records in the generated data file
+SAMPLE_RECORDS = 100
+
+
+def startup_commands(data_file: str) -> Dict[str, List[str]]:
+    """
+    Build the measured command lines.
+
+    Args:
+        data_file: Data file for the lookup runs
+
+    Returns:
+        Command line for each measurement name
+    """
+    lookup = [
+        sys.executable,
+        str(MAIN),
+        "-f",
+        data_file,
+        "-a",
+        "binary",
+        "-t",
+        "record42",
+        "--runs",
+        "1",
+        "--min-time",
+        "0.001",
+        "--no-cache",
+    ]
+    return {
+        "interpreter": [sys.executable, "-c", "pass"],
+        "help": [sys.executable, str(MAIN), "--help"],
+        "headless json": [*lookup, "--format", "json"],
+        "rich table": lookup,
+    }
+
+
+def time_command(command: List[str], repeat: int) -> List[float]:
+    """
+    Launch a command repeatedly and time each launch until it exits.
+
+    Args:
+        command: Command line
+        repeat: Number of launches
+
+    Returns:
+        Wall time of every launch in seconds
+
+    Raises:
+        RuntimeError: If the command fails
+    """
+    times = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        completed = subprocess.run(command, capture_output=True)
+        times.append(time.perf_counter() - start_time)
+
+        if completed.returncode != 0:
+            raise RuntimeError(
+                f"{' '.join(command)} failed: {completed.stderr.decode().strip()}"
+            )
+    return times
+
+
+def import_times(command: List[str]) -> List[Tuple[str, float, float]]:
+    """
+    Run a Python command once under -X importtime.
+
+    Args:
+        command: Command line starting with the interpreter
+
+    Returns:
+        (module, self seconds, cumulative seconds) for every import, in the
+        order the imports finished
+    """
+    completed = subprocess.run(
+        [command[0], "-X", "importtime", *command[1:]], capture_output=True
+    )
+    imports = []
+    for line in completed.stderr.decode().splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header line
+        imports.append((fields[2].strip(), int(fields[0]) / 1e6, int(fields[1]) / 1e6))
+    return imports
+
+
+def main() -> int:
+    """
+    Parse arguments, time every command and report the slowest imports.
+    """
+    parser = argparse.ArgumentParser(description="Measure the tool's startup time")
+    parser.add_argument(
+        "-n",
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help=f"Launches per command (default: {DEFAULT_REPEAT})",
+    )
+    args = parser.parse_args()
+
+    if args.repeat < 1:
+        parser.error("--repeat must be positive")
+
+    # Imported here so that the harness itself is not what gets measured
+    from rich.table import Table
+
+    from main import console, format_time
+
+    with tempfile.TemporaryDirectory() as directory:
+        data_file = Path(directory) / "startup.txt"
+        data_file.write_text(
+            "\n".join(f"record{i}" for i in range(SAMPLE_RECORDS)) + "\n"
+        )
+        commands = startup_commands(str(data_file))
+
+        try:
+            timings = {
+                name: time_command(command, args.repeat)
+                for name, command in commands.items()
+            }
+            imports = import_times(commands["headless json"])
+        except Exception as e:
+            console.print(f"[bold red]An error occurred:[/] {str(e)}")
+            return 1
+
+    baseline = min(timings["interpreter"])
+    table = Table(title=f"Startup Time ({args.repeat} launches each)")
+
+    table.add_column("Command", style="green")
+    table.add_column("Best", style="magenta")
+    table.add_column("Median", style="magenta")
+    table.add_column("Over Interpreter", style="yellow")
+
+    for name, times in timings.items():
+        table.add_row(
+            name,
+            format_time(min(times)),
+            format_time(statistics.median(times)),
+            format_time(min(times) - baseline) if name != "interpreter" else "-",
+        )
+
+    console.print(table)
+
+    table = Table(title="Slowest Imports (headless json)")
+
+    table.add_column("Module", style="green")
+    table.add_column("Self", style="magenta")
+    table.add_column("Cumulative", style="magenta")
+
+    for module, own, cumulative in sorted(imports, key=lambda x: -x[1])[:TOP_IMPORTS]:
+        table.add_row(module, format_time(own), format_time(cumulative))
+
+    console.print(table)
+
+    rich_modules = [
+        module for module, _, _ in imports if module.split(".")[0] == "rich"
+    ]
+    if rich_modules:
+        console.print(
+            f"[bold red]The headless path imported rich ({len(rich_modules)} "
+            "modules).[/]"
+        )
+        return 1
+
+    console.print("[bold green]The headless path does not import rich.[/]")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,102 @@
+"""
+Substring Benchmark Module
+
+This module contains the benchmark behind --mode substring. A suffix array
+is built once over the records and timed on the given patterns against the
+linear scan that tests every record with `in`. Both report the same record
+indices for every pattern, which is checked; the suffix array additionally
+reports its build time and the memory held by the index.
+"""
+
+import statistics
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+from bench.timing import DEFAULT_MIN_TIME, calibrated_timing, query_latencies
+from search.linear import linear_substring_search
+from search.suffix_array import SuffixArraySearcher
+
+
+def _run_each(func: Callable, data: Sequence[str], patterns: List[str]) -> List:
+    """Answer every pattern with one call each."""
+    return [func(data, pattern) for pattern in patterns]
+
+
+def benchmark_substring(
+    data: Sequence[str],
+    patterns: List[str],
+    runs: int = 5,
+    min_time: float = DEFAULT_MIN_TIME,
+    on_step: Optional[Callable[[str], None]] = None,
+) -> List[Dict]:
+    """
+    Time substring queries on a suffix array and as a linear scan.
+
+    Throughput comes from calibrated batches of all patterns; the latency
+    distribution from timing every pattern of one more pass.
+
+    Args:
+        data: Dataset in its original order
+        patterns: Substrings to search for
+        runs: Number of timed batches per method
+        min_time: Minimum duration of one timed batch in seconds
+        on_step: Called with a label after each measured method
+
+    Returns:
+        One result per method, suffix array first, each with per-query
+        latencies under "latencies"
+
+    Raises:
+        ValueError: If a record contains the suffix array's separator
+        RuntimeError: If the suffix array and the scan disagree
+    """
+    engine = SuffixArraySearcher()
+    start_time = time.perf_counter()
+    engine.prepare(data)
+    build_time = time.perf_counter() - start_time
+
+    methods = [
+        (engine.__name__, engine),
+        ("linear_substring_search", linear_substring_search),
+    ]
+    results = []
+    answers = []
+
+    for label, func in methods:
+        timing = calibrated_timing(_run_each, (func, data, patterns), runs, min_time)
+        samples = [elapsed / len(patterns) for elapsed in timing.per_call_times]
+        latencies, _ = query_latencies(func, data, patterns)
+        answers.append(timing.result)
+
+        results.append(
+            {
+                "algorithm": label,
+                "queries": len(patterns),
+                "found": sum(1 for records in timing.result if records),
+                "matches": sum(map(len, timing.result)) / len(patterns),
+                "median_time": statistics.median(samples),
+                "samples": samples,
+                "latencies": latencies,
+            }
+        )
+        if on_step is not None:
+            on_step(label)
+
+    if answers[0] != answers[1]:
+        raise RuntimeError("Suffix array and linear scan disagree")
+
+    scan_time = results[1]["median_time"]
+    for result in results:
+        result["speedup"] = (
+            scan_time / result["median_time"]
+            if result["median_time"] > 0
+            else float("inf")
+        )
+
+    # Queries after which building the index has paid for itself
+    saving = scan_time - results[0]["median_time"]
+    results[0]["build_time"] = build_time
+    results[0]["pays_off_after"] = build_time / saving if saving > 0 else float("inf")
+    results[0].update(engine.stats())
+
+    return results
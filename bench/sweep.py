@@ -0,0 +1,253 @@
+"""
+Scaling Sweep Module
+
+This module contains the pieces of the dataset-size sweep: geometric sample
+sizes, sorted subsamples of a dataset, least-squares fitting of measured
+times to candidate complexity curves, and detection of the sizes where one
+algorithm overtakes another.
+"""
+
+import math
+import random
+import re
+from itertools import combinations
+from typing import Callable, Dict, List, NamedTuple, Sequence
+
+# Smallest dataset size in a sweep
+SWEEP_START = 1000
+
+# Number of lookups timed at each sweep size
+SWEEP_QUERIES = 32
+
+# Relative difference below which two measurements count as a tie
+NOISE_MARGIN = 0.1
+
+# Candidate growth curves, from the cheapest to the most expensive
+COMPLEXITY_MODELS: Dict[str, Callable[[int], float]] = {
+    "O(1)": lambda n: 1.0,
+    "O(log log n)": lambda n: math.log2(max(math.log2(n), 2)),
+    "O(log n)": lambda n: math.log2(n),
+    "O(sqrt n)": lambda n: math.sqrt(n),
+    "O(n)": lambda n: float(n),
+    "O(n log n)": lambda n: n * math.log2(n),
+}
+
+
+# Complexity stated in a docstring, e.g. "Time complexity: O(sqrt(n))"
+CLAIM_PATTERN = re.compile(r"Time complexity:\s*(O\((?:[^()]|\([^()]*\))*\))")
+
+
+class ComplexityFit(NamedTuple):
+    """Best-fitting growth curve for a series of measurements."""
+
+    model: str
+    intercept: float
+    coefficient: float
+    error: float
+
+
+class Crossover(NamedTuple):
+    """Size at which one algorithm overtakes another."""
+
+    slower: str
+    faster: str
+    size: float
+
+
+def sweep_sizes(total: int, start: int = SWEEP_START) -> List[int]:
+    """
+    Build geometric dataset sizes from start up to the full dataset.
+
+    Sizes follow the 1-2-5 series (1000, 2000, 5000, 10000, ...) and the
+    full size is always the last entry.
+
+    Args:
+        total: Number of records in the full dataset
+        start: Smallest size
+
+    Returns:
+        Increasing list of sizes
+    """
+    sizes = []
+    scale = start
+    while scale < total:
+        for factor in (1, 2, 5):
+            if scale * factor < total:
+                sizes.append(scale * factor)
+        scale *= 10
+    sizes.append(total)
+    return sizes
+
+
+def subsample(sorted_data: Sequence[str], size: int) -> List[str]:
+    """
+    Take evenly spaced records from a sorted dataset.
+
+    The sample stays sorted and covers the whole key range, so its key
+    distribution matches the full dataset at every size.
+
+    Args:
+        sorted_data: Sorted dataset
+        size: Number of records to take (at most len(sorted_data))
+
+    Returns:
+        Sorted list of size records
+    """
+    n = len(sorted_data)
+    if size >= n:
+        return list(sorted_data)
+    return [sorted_data[i * n // size] for i in range(size)]
+
+
+def sweep_targets(
+    sample: Sequence[str], count: int = SWEEP_QUERIES, seed: int = 0
+) -> List[str]:
+    """
+    Draw lookup targets uniformly from a sample.
+
+    Args:
+        sample: Dataset the targets are drawn from
+        count: Number of targets
+        seed: Random seed, so every algorithm sees the same targets
+
+    Returns:
+        List of targets present in the sample
+    """
+    rng = random.Random(seed)
+    return [sample[rng.randrange(len(sample))] for _ in range(count)]
+
+
+def claimed_complexity(algorithm: Callable) -> str:
+    """
+    Read the time complexity an algorithm's docstring claims.
+
+    Args:
+        algorithm: Search function, or an engine whose search method
+                   carries the claim
+
+    Returns:
+        The claimed complexity, or "-" if the docstring states none
+    """
+    engine = getattr(algorithm, "__self__", algorithm)
+    method = getattr(engine, "search", algorithm)
+    match = CLAIM_PATTERN.search(method.__doc__ or "")
+    return match.group(1) if match else "-"
+
+
+def run_queries(algorithm: Callable, data: Sequence[str], targets: List[str]) -> int:
+    """
+    Look up every target once.
+
+    Args:
+        algorithm: Search algorithm function
+        data: Dataset to search in
+        targets: Items to search for
+
+    Returns:
+        Number of targets found
+    """
+    found = 0
+    for target in targets:
+        if algorithm(data, target) != -1:
+            found += 1
+    return found
+
+
+def _least_squares(xs: List[float], ys: List[float]) -> tuple:
+    """
+    Fit ys = intercept + coefficient * xs with a non-negative coefficient.
+
+    Args:
+        xs: Model values
+        ys: Measured values
+
+    Returns:
+        Tuple containing (intercept, coefficient)
+    """
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if spread == 0:
+        return mean_y, 0.0
+
+    coefficient = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+    if coefficient < 0:
+        return mean_y, 0.0
+    return mean_y - coefficient * mean_x, coefficient
+
+
+def fit_complexity(sizes: List[int], times: List[float]) -> ComplexityFit:
+    """
+    Fit measured times to the candidate curves in COMPLEXITY_MODELS.
+
+    Each curve is fitted as time = a + b * f(n) by least squares and scored
+    by the root-mean-square relative error, so small and large sizes weigh
+    the same. A more expensive curve only wins if it lowers the error by
+    more than NOISE_MARGIN, since neighbouring curves are hard to tell apart
+    over a few decades of n.
+
+    Args:
+        sizes: Dataset sizes
+        times: Measured time at each size
+
+    Returns:
+        The best ComplexityFit
+    """
+    best = None
+    for model, curve in COMPLEXITY_MODELS.items():
+        xs = [curve(n) for n in sizes]
+        intercept, coefficient = _least_squares(xs, times)
+
+        squared = 0.0
+        for x, y in zip(xs, times):
+            predicted = intercept + coefficient * x
+            squared += ((predicted - y) / y) ** 2 if y > 0 else 0.0
+        error = math.sqrt(squared / len(sizes))
+
+        if best is None or error < best.error * (1 - NOISE_MARGIN):
+            best = ComplexityFit(model, intercept, coefficient, error)
+    return best
+
+
+def find_crossovers(
+    sizes: List[int], series: Dict[str, List[float]]
+) -> List[Crossover]:
+    """
+    Find the sizes where one algorithm overtakes another.
+
+    A crossover is reported where the faster of a pair changes. Sizes where
+    the pair is within NOISE_MARGIN of each other are treated as ties and
+    skipped, so timing noise between algorithms of the same order does not
+    show up as crossovers. The crossover size is interpolated on a log-log
+    scale, where the time ratio of the pair is closest to linear.
+
+    Args:
+        sizes: Dataset sizes
+        series: Measured time per size for each algorithm
+
+    Returns:
+        Crossovers ordered by size
+    """
+    threshold = math.log(1 + NOISE_MARGIN)
+    crossovers = []
+
+    for first, second in combinations(series, 2):
+        # (log size, log time ratio) at sizes where the pair clearly differs
+        points = [
+            (math.log(n), math.log(a / b))
+            for n, a, b in zip(sizes, series[first], series[second])
+            if a > 0 and b > 0 and abs(math.log(a / b)) > threshold
+        ]
+        for (low, before), (high, after) in zip(points, points[1:]):
+            if (before > 0) == (after > 0):
+                continue
+
+            # Log-space interpolation of where the ratio crosses 1
+            size = math.exp(low + (high - low) * before / (before - after))
+
+            if after > 0:
+                crossovers.append(Crossover(first, second, size))
+            else:
+                crossovers.append(Crossover(second, first, size))
+
+    return sorted(crossovers, key=lambda crossover: crossover.size)
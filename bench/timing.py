@@ -0,0 +1,190 @@
+"""
+Calibrated Timing Module
+
+This module contains a low-overhead timing engine for very fast calls.
+Instead of timing every call separately, calls are executed in batches
+whose size is calibrated like timeit's autorange, the cost of an empty
+call is measured and subtracted, warmup calls run first, and the garbage
+collector is disabled while measuring.
+"""
+
+import gc
+import itertools
+import time
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+# Minimum duration of one timed batch in seconds
+DEFAULT_MIN_TIME = 0.1
+
+# Upper bound on the calibrated batch size
+MAX_NUMBER = 10**7
+
+
+class TimingResult(NamedTuple):
+    """Outcome of a calibrated measurement."""
+
+    per_call_times: List[float]
+    number: int
+    overhead: float
+    result: Any
+
+
+def _empty_call(*args: Any) -> None:
+    """Stand-in with the same call shape as a search function."""
+    return None
+
+
+def _time_batch(func: Callable, args: tuple, number: int) -> float:
+    """
+    Time `number` back-to-back calls of func(*args).
+
+    Args:
+        func: Function to call
+        args: Positional arguments
+        number: Number of calls
+
+    Returns:
+        Total elapsed time in seconds
+    """
+    loop = itertools.repeat(None, number)
+    start_time = time.perf_counter()
+    for _ in loop:
+        func(*args)
+    return time.perf_counter() - start_time
+
+
+def autorange(func: Callable, args: tuple, min_time: float = DEFAULT_MIN_TIME) -> int:
+    """
+    Find a batch size whose total run time reaches min_time.
+
+    Tries 1, 2, 5, 10, 20, 50, ... calls, like timeit.Timer.autorange.
+
+    Args:
+        func: Function to call
+        args: Positional arguments
+        min_time: Target batch duration in seconds
+
+    Returns:
+        Number of calls per batch
+    """
+    for exponent in itertools.count():
+        for factor in (1, 2, 5):
+            number = factor * 10**exponent
+            if number >= MAX_NUMBER or _time_batch(func, args, number) >= min_time:
+                return min(number, MAX_NUMBER)
+
+
+def call_overhead(args: tuple, number: int, repeat: int = 3) -> float:
+    """
+    Measure the per-call cost of the batch loop with an empty call.
+
+    Args:
+        args: Positional arguments passed on each call
+        number: Batch size to measure with
+        repeat: Number of measurements (the minimum is kept)
+
+    Returns:
+        Overhead per call in seconds
+    """
+    return min(_time_batch(_empty_call, args, number) for _ in range(repeat)) / number
+
+
+def timer_overhead(samples: int = 1000) -> float:
+    """
+    Measure the cost of one back-to-back perf_counter pair.
+
+    Args:
+        samples: Number of timer pairs to sample (the minimum is kept)
+
+    Returns:
+        Overhead of a single timed section in seconds
+    """
+    counter = time.perf_counter
+    return min(-counter() + counter() for _ in range(samples))
+
+
+def query_latencies(
+    func: Callable, data: Any, targets: List[Any]
+) -> Tuple[List[float], int]:
+    """
+    Time each lookup of a query stream on its own, in stream order.
+
+    The garbage collector is disabled and the cost of reading the timer is
+    subtracted from every sample.
+
+    Args:
+        func: Search function called as func(data, target)
+        data: Dataset to search in
+        targets: Query stream
+
+    Returns:
+        Tuple containing (per-query latencies, number of hits)
+    """
+    overhead = timer_overhead()
+    counter = time.perf_counter
+    latencies = []
+    found = 0
+
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for target in targets:
+            start_time = counter()
+            result = func(data, target)
+            end_time = counter()
+
+            latencies.append(max(end_time - start_time - overhead, 0.0))
+            if result != -1:
+                found += 1
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return latencies, found
+
+
+def calibrated_timing(
+    func: Callable,
+    args: tuple,
+    repeat: int = 5,
+    min_time: float = DEFAULT_MIN_TIME,
+    warmup: int = 1,
+    on_batch: Optional[Callable[[int], None]] = None,
+) -> TimingResult:
+    """
+    Measure the per-call time of func(*args) from calibrated batches.
+
+    Args:
+        func: Function to measure
+        args: Positional arguments
+        repeat: Number of timed batches
+        min_time: Minimum duration of one batch in seconds
+        warmup: Number of untimed warmup batches
+        on_batch: Called with the batch number after each timed batch,
+                  e.g. to advance a progress bar outside the timed region
+
+    Returns:
+        TimingResult with one overhead-corrected per-call time per batch
+    """
+    # The first call also yields the result reported to the caller
+    result = func(*args)
+    number = autorange(func, args, min_time)
+
+    for _ in range(warmup):
+        _time_batch(func, args, number)
+
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        overhead = call_overhead(args, number)
+        per_call_times = []
+        for batch in range(repeat):
+            elapsed = _time_batch(func, args, number)
+            per_call_times.append(max(elapsed / number - overhead, 0.0))
+            if on_batch is not None:
+                on_batch(batch)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return TimingResult(per_call_times, number, overhead, result)
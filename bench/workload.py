@@ -0,0 +1,175 @@
+"""
+Query Workload Module
+
+This module contains a generator for synthetic query streams drawn from a
+loaded dataset. A workload profile sets the fraction of hits, where in the
+sorted key space the queries land, how skewed key popularity is (Zipf) and
+how many misses fall outside the key range rather than between keys.
+"""
+
+import itertools
+import random
+from bisect import bisect_left
+from typing import Callable, Dict, List, NamedTuple, Sequence
+
+# Where queries land in the sorted key space
+POSITIONS = ["uniform", "front", "middle", "back"]
+
+# Number of distinct keys Zipf popularity is spread over
+ZIPF_KEYS = 100_000
+
+# Upper bound on a key, greater than any record
+MAX_CHAR = chr(0x10FFFF)
+
+
+class WorkloadProfile(NamedTuple):
+    """Parameters of a synthetic query stream."""
+
+    name: str
+    hit_ratio: float = 1.0
+    position: str = "uniform"
+    zipf: float = 0.0
+    out_of_range: float = 0.0
+
+    def describe(self) -> str:
+        """Summarize the profile in one line."""
+        parts = [f"{self.hit_ratio:.0%} hits", self.position]
+        if self.zipf > 0:
+            parts.append(f"zipf {self.zipf:g}")
+        if self.hit_ratio < 1:
+            parts.append(f"{self.out_of_range:.0%} of misses out of range")
+        return ", ".join(parts)
+
+
+# Named profiles selectable with --workload
+PRESETS: Dict[str, WorkloadProfile] = {
+    "uniform": WorkloadProfile("uniform"),
+    "front": WorkloadProfile("front", position="front"),
+    "middle": WorkloadProfile("middle", position="middle"),
+    "back": WorkloadProfile("back", position="back"),
+    "zipf": WorkloadProfile("zipf", zipf=1.1),
+    "misses": WorkloadProfile("misses", hit_ratio=0.5),
+    "out_of_range": WorkloadProfile("out_of_range", hit_ratio=0.0, out_of_range=1.0),
+}
+
+# Keys accepted in a custom profile spec, e.g. "hit=0.9,position=front"
+SPEC_KEYS = {
+    "hit": ("hit_ratio", float),
+    "position": ("position", str),
+    "zipf": ("zipf", float),
+    "out": ("out_of_range", float),
+}
+
+
+def parse_profile(spec: str) -> WorkloadProfile:
+    """
+    Resolve a preset name or a custom "key=value,..." spec to a profile.
+
+    Args:
+        spec: Preset name from PRESETS, or comma-separated settings with
+              keys hit, position, zipf and out
+
+    Returns:
+        The workload profile
+
+    Raises:
+        ValueError: If the preset or a setting is unknown or out of range
+    """
+    if spec in PRESETS:
+        return PRESETS[spec]
+    if "=" not in spec:
+        raise ValueError(f"Unknown workload '{spec}' (presets: {', '.join(PRESETS)})")
+
+    settings = {}
+    for item in spec.split(","):
+        key, _, value = item.partition("=")
+        if key not in SPEC_KEYS:
+            raise ValueError(f"Unknown workload setting '{key}'")
+        field, convert = SPEC_KEYS[key]
+        settings[field] = convert(value)
+
+    profile = WorkloadProfile(spec, **settings)
+    if profile.position not in POSITIONS:
+        raise ValueError(f"Unknown position '{profile.position}'")
+    if not (0 <= profile.hit_ratio <= 1 and 0 <= profile.out_of_range <= 1):
+        raise ValueError("hit and out must be between 0 and 1")
+    if profile.zipf < 0:
+        raise ValueError("zipf must not be negative")
+    return profile
+
+
+def position_sampler(rng: random.Random, n: int, position: str) -> Callable[[], int]:
+    """
+    Build a function drawing indexes into a sorted dataset of size n.
+
+    Args:
+        rng: Random number generator
+        n: Dataset size
+        position: One of POSITIONS
+
+    Returns:
+        Function returning an index in [0, n)
+    """
+    if position == "front":
+        return lambda: int(n * rng.random() ** 3)
+    if position == "back":
+        return lambda: n - 1 - int(n * rng.random() ** 3)
+    if position == "middle":
+        return lambda: min(int(rng.triangular(0, n, n / 2)), n - 1)
+    return lambda: rng.randrange(n)
+
+
+def generate_workload(
+    sorted_data: Sequence[str], profile: WorkloadProfile, count: int, seed: int = 0
+) -> List[str]:
+    """
+    Generate a query stream from a sorted dataset.
+
+    Hits are records of the dataset. In-range misses fall just after a
+    record, between it and its successor, and follow the position bias like
+    hits; out-of-range misses fall below the smallest or above the largest
+    key. With Zipf skew, ZIPF_KEYS keys are drawn with the position bias and the
+    hits pick among them with probability proportional to 1 / rank**zipf.
+
+    Args:
+        sorted_data: Sorted dataset
+        profile: Workload profile
+        count: Number of queries
+        seed: Random seed; the same seed gives the same stream
+
+    Returns:
+        List of query strings in stream order
+    """
+    rng = random.Random(seed)
+    n = len(sorted_data)
+    pick = position_sampler(rng, n, profile.position)
+
+    if n == 0:
+        return []
+
+    hits = round(count * profile.hit_ratio)
+    outside = round((count - hits) * profile.out_of_range)
+
+    if profile.zipf > 0:
+        keys = [pick() for _ in range(min(n, ZIPF_KEYS))]
+        weights = itertools.accumulate(
+            1 / rank**profile.zipf for rank in range(1, len(keys) + 1)
+        )
+        indexes = rng.choices(keys, cum_weights=list(weights), k=hits)
+    else:
+        indexes = [pick() for _ in range(hits)]
+    queries = [sorted_data[i] for i in indexes]
+
+    for _ in range(outside):
+        queries.append("" if rng.random() < 0.5 else sorted_data[-1] + MAX_CHAR)
+
+    # Appending the smallest character places a miss right after a record
+    while len(queries) < count:
+        i = pick()
+        candidate = sorted_data[i] + "\0"
+        position = bisect_left(sorted_data, candidate, i)
+        if position == n or sorted_data[position] != candidate:
+            queries.append(candidate)
+
+    rng.shuffle(queries)
+    return queries
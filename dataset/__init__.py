@@ -0,0 +1,7 @@
+"""
+Dataset Package
+
+This package contains loaders and storage formats for benchmark datasets.
+"""
+
+# This file makes the 'dataset' directory a Python package
@@ -0,0 +1,135 @@
+"""
+Compact String Store Module
+
+This module contains a contiguous string container. All records live in one
+UTF-8 blob with an array('Q') of offsets, instead of one Python str object
+per record scattered across the heap.
+"""
+
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Any, Iterable, Iterator, Optional
+
+
+class CompactStringArray(Sequence):
+    """
+    Sequence of strings stored in one bytearray blob plus an offsets array.
+
+    Records are decoded on access, so the search algorithms run on it
+    directly. copy() and append() are supported so that sentinel linear
+    search works too; copying duplicates two flat buffers rather than a
+    list of object pointers.
+    """
+
+    __slots__ = ("_blob", "_offsets")
+
+    def __init__(self, strings: Iterable[str] = ()):
+        """
+        Build the store from an iterable of strings.
+
+        Args:
+            strings: Records to store, in order
+        """
+        blob = bytearray()
+        offsets = array("Q", [0])
+        for string in strings:
+            blob += string.encode("utf-8")
+            offsets.append(len(blob))
+
+        self._blob = blob
+        self._offsets = offsets
+
+    @classmethod
+    def from_buffers(cls, blob: bytearray, offsets: array) -> "CompactStringArray":
+        """
+        Wrap an existing blob and offsets array without copying.
+
+        Args:
+            blob: Concatenated UTF-8 records
+            offsets: len(records) + 1 offsets into blob, starting at 0
+
+        Returns:
+            CompactStringArray backed by the given buffers
+        """
+        store = cls.__new__(cls)
+        store._blob = blob
+        store._offsets = offsets
+        return store
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CompactStringArray index out of range")
+        offsets = self._offsets
+        return self._blob[offsets[index] : offsets[index + 1]].decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        blob, offsets = self._blob, self._offsets
+        for i in range(len(offsets) - 1):
+            yield blob[offsets[i] : offsets[i + 1]].decode("utf-8")
+
+    def append(self, value: str) -> None:
+        """
+        Append a record at the end of the store.
+
+        Args:
+            value: Record to append
+        """
+        self._blob += value.encode("utf-8")
+        self._offsets.append(len(self._blob))
+
+    def copy(self) -> "CompactStringArray":
+        """
+        Return an independent copy of the store.
+
+        Returns:
+            New CompactStringArray with copied buffers
+        """
+        return CompactStringArray.from_buffers(
+            bytearray(self._blob), array("Q", self._offsets)
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the store, including both buffers."""
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self._blob)
+            + sys.getsizeof(self._offsets)
+        )
+
+
+def memory_footprint(data: Any, seen: Optional[set] = None) -> int:
+    """
+    Estimate the memory held by a dataset container and its records.
+
+    Args:
+        data: List of strings, or any container exposing an nbytes attribute
+              (CompactStringArray, MappedRecords, NumPy arrays)
+        seen: Ids of containers and records already counted, so anything
+              shared between calls counts once
+
+    Returns:
+        Approximate size in bytes
+    """
+    seen = set() if seen is None else seen
+    if id(data) in seen:
+        return 0
+    seen.add(id(data))
+
+    if hasattr(data, "nbytes"):
+        return data.nbytes
+
+    total = sys.getsizeof(data)
+    for item in data:
+        if id(item) not in seen:
+            seen.add(id(item))
+            total += sys.getsizeof(item)
+    return total
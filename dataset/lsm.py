@@ -0,0 +1,194 @@
+"""
+Updatable Sorted Index Module
+
+This module contains an LSM-style sorted container for datasets that keep
+growing. New records go into a small sorted write buffer; a full buffer is
+frozen into an immutable sorted run, and runs of similar size are merged so
+their number stays logarithmic. An append costs a short insort instead of a
+full re-sort, and every component stays sorted, so the sorted-input search
+algorithms run on each component unchanged.
+"""
+
+import heapq
+import time
+from bisect import bisect_left, insort
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, TypeVar
+
+from search.binary import binary_search
+
+T = TypeVar("T")
+
+# Default number of records held in the write buffer before it is frozen
+DEFAULT_BUFFER_SIZE = 1024
+
+# A run is merged into its older neighbour until that is this many times larger
+GROWTH_FACTOR = 4
+
+
+class LSMSortedIndex:
+    """
+    Sorted write buffer plus immutable sorted runs, oldest (largest) first.
+
+    Records may repeat. search() returns the rank of a match in the sorted
+    order of all records, i.e. its index in list(self), so results compare
+    directly with a search over one fully sorted list. `version` counts
+    inserts, which lets caches detect that the contents changed.
+    """
+
+    def __init__(
+        self,
+        records: Iterable[T] = (),
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        growth: int = GROWTH_FACTOR,
+    ):
+        """
+        Bulk-load the initial records as one run.
+
+        Args:
+            records: Initial records, in any order
+            buffer_size: Records held in the write buffer before it is frozen
+            growth: Size ratio at which neighbouring runs stop being merged
+
+        Raises:
+            ValueError: If buffer_size is not positive or growth is below 2
+        """
+        if buffer_size < 1:
+            raise ValueError("Write buffer size must be positive")
+        if growth < 2:
+            raise ValueError("Growth factor must be at least 2")
+
+        self.buffer_size = buffer_size
+        self.growth = growth
+        initial = sorted(records)
+        self._runs: List[List[T]] = [initial] if initial else []
+        self._buffer: List[T] = []
+        self.version = 0
+        self.merges = 0
+        self.merged_records = 0
+        self.merge_time = 0.0
+
+    def __len__(self) -> int:
+        return sum(len(run) for run in self._runs) + len(self._buffer)
+
+    def __iter__(self) -> Iterator[T]:
+        return heapq.merge(*self.components())
+
+    def __contains__(self, value: T) -> bool:
+        return self.search(value) != -1
+
+    def components(self) -> List[List[T]]:
+        """
+        List the sorted components that a lookup has to search.
+
+        Returns:
+            Non-empty runs, oldest first, followed by the write buffer
+        """
+        if self._buffer:
+            return [*self._runs, self._buffer]
+        return list(self._runs)
+
+    def insert(self, value: T) -> None:
+        """
+        Add a record, freezing the write buffer when it is full.
+
+        Time complexity: O(buffer_size) plus amortized O(log n) merge work
+
+        Args:
+            value: Record to add
+        """
+        insort(self._buffer, value)
+        self.version += 1
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def extend(self, values: Iterable[T]) -> None:
+        """
+        Add records one by one.
+
+        Args:
+            values: Records to add
+        """
+        for value in values:
+            self.insert(value)
+
+    def flush(self) -> None:
+        """Freeze the write buffer into a run and merge runs of similar size."""
+        if not self._buffer:
+            return
+
+        self._runs.append(self._buffer)
+        self._buffer = []
+
+        runs = self._runs
+        while len(runs) > 1 and len(runs[-2]) < self.growth * len(runs[-1]):
+            start_time = time.perf_counter()
+            newer = runs.pop()
+            older = runs.pop()
+            # Timsort finds the two sorted halves and merges them in C
+            merged = older + newer
+            merged.sort()
+            runs.append(merged)
+            self.merge_time += time.perf_counter() - start_time
+            self.merges += 1
+            self.merged_records += len(merged)
+
+    def search(self, target: T, algorithm: Callable = binary_search) -> int:
+        """
+        Search every component with a sorted-input search algorithm.
+
+        The newest component is searched first. On a match the rank is the
+        position inside that component plus the number of smaller records
+        in each of the others.
+
+        Time complexity: O(r log n) for r components, r = O(log n)
+
+        Args:
+            target: Element to search for
+            algorithm: Search function called as algorithm(component, target)
+
+        Returns:
+            Index of the element in the sorted order of all records if
+            found, -1 otherwise
+        """
+        components = self.components()
+        for i in range(len(components) - 1, -1, -1):
+            position = algorithm(components[i], target)
+            if position != -1:
+                return position + sum(
+                    bisect_left(other, target)
+                    for j, other in enumerate(components)
+                    if j != i
+                )
+        return -1
+
+    def search_many(
+        self, targets: Sequence[T], algorithm: Callable = binary_search
+    ) -> List[int]:
+        """
+        Search for every target.
+
+        Args:
+            targets: Elements to search for
+            algorithm: Search function called as algorithm(component, target)
+
+        Returns:
+            List of indices (or -1) in the same order as targets
+        """
+        return [self.search(target, algorithm) for target in targets]
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Report the run count and the merge work done so far.
+
+        Write amplification is the number of records copied by merges per
+        inserted record.
+
+        Returns:
+            Dictionary of statistics
+        """
+        return {
+            "runs": len(self.components()),
+            "merges": self.merges,
+            "merge_time": self.merge_time,
+            "write_amplification": self.merged_records / max(self.version, 1),
+        }
@@ -0,0 +1,190 @@
+"""
+Memory-Mapped Record Loader Module
+
+This module contains a lazy, read-only view over a line-oriented data file.
+The file is memory-mapped and only the byte spans of its records are kept in
+compact arrays; a record is decoded to str only when it is accessed.
+"""
+
+import mmap
+import re
+import sys
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Iterator, List, Optional, Union
+
+# ASCII whitespace stripped by str.strip()
+WHITESPACE = frozenset(b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f")
+
+# A line between the line breaks recognized by universal newlines mode
+LINE = re.compile(rb"[^\r\n]+")
+
+
+class MappedRecords(Sequence):
+    """
+    Read-only sequence of the non-empty, stripped lines of a file.
+
+    Matches the records produced by load_data, but holds only two
+    array('Q') span tables in memory. Binary, jump and fibonacci search
+    decode only the O(log n) or O(sqrt n) records they probe.
+    """
+
+    def __init__(
+        self,
+        buffer: Union[mmap.mmap, bytes],
+        starts: array,
+        ends: array,
+        owner: Optional["MappedRecords"] = None,
+    ):
+        """
+        Create a view over already-indexed spans; use open_mapped to build one.
+
+        Args:
+            buffer: Memory-mapped file contents
+            starts: Start offset of every record
+            ends: End offset (exclusive) of every record
+            owner: View that owns the mapping, if this is a derived view
+        """
+        self._buffer = buffer
+        self._starts = starts
+        self._ends = ends
+        self._owner = owner
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("MappedRecords index out of range")
+        return self._buffer[self._starts[index] : self._ends[index]].decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        buffer = self._buffer
+        for start, end in zip(self._starts, self._ends):
+            yield buffer[start:end].decode("utf-8")
+
+    def __enter__(self) -> "MappedRecords":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def nbytes(self) -> int:
+        """Resident memory of the view: its span tables (the file is mapped)."""
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self._starts)
+            + sys.getsizeof(self._ends)
+        )
+
+    def copy(self) -> List[str]:
+        """
+        Materialize the records as a list, for algorithms that mutate a copy.
+
+        Returns:
+            List of decoded records
+        """
+        return list(self)
+
+    def reorder(self, order: Sequence) -> "MappedRecords":
+        """
+        Return a view of the same mapping with records in the given order.
+
+        Args:
+            order: Permutation of record indices
+
+        Returns:
+            New MappedRecords sharing this view's mapping
+        """
+        starts = array("Q", (self._starts[i] for i in order))
+        ends = array("Q", (self._ends[i] for i in order))
+        return MappedRecords(self._buffer, starts, ends, self._owner or self)
+
+    def sorted_view(self) -> "MappedRecords":
+        """
+        Return a view with records in sorted order.
+
+        UTF-8 byte order equals code point order, so records are sorted by
+        their raw bytes without decoding them.
+
+        Returns:
+            New MappedRecords sharing this view's mapping
+        """
+        buffer, starts, ends = self._buffer, self._starts, self._ends
+        order = sorted(range(len(self)), key=lambda i: buffer[starts[i] : ends[i]])
+        return self.reorder(order)
+
+    def close(self) -> None:
+        """Close the underlying mapping (views derived from it become invalid)."""
+        if self._owner is None and isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+
+def _record_spans(buffer: Union[mmap.mmap, bytes]) -> tuple:
+    """
+    Find the stripped span of every non-empty line in a buffer.
+
+    Lines end at LF, CRLF or a lone CR, like the text mode load_data reads
+    files in.
+
+    Args:
+        buffer: File contents
+
+    Returns:
+        Tuple of (starts, ends) arrays
+    """
+    starts = array("Q")
+    ends = array("Q")
+
+    for line in LINE.finditer(buffer):
+        start, stop = line.span()
+        while start < stop and buffer[start] in WHITESPACE:
+            start += 1
+        while stop > start and buffer[stop - 1] in WHITESPACE:
+            stop -= 1
+
+        if start < stop and (buffer[start] >= 0x80 or buffer[stop - 1] >= 0x80):
+            # Non-ASCII edges may be Unicode whitespace; strip like str.strip()
+            text = buffer[start:stop].decode("utf-8")
+            stripped = text.strip()
+            if stripped:
+                start += len(text[: len(text) - len(text.lstrip())].encode("utf-8"))
+                stop = start + len(stripped.encode("utf-8"))
+            else:
+                stop = start
+
+        if start < stop:
+            starts.append(start)
+            ends.append(stop)
+
+    return starts, ends
+
+
+def open_mapped(filepath: Union[str, Path]) -> MappedRecords:
+    """
+    Memory-map a data file and index its records.
+
+    Args:
+        filepath: Path to the data file
+
+    Returns:
+        MappedRecords view over the file
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    with open(filepath, "rb") as file:
+        try:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            buffer = b""
+
+    starts, ends = _record_spans(buffer)
+    return MappedRecords(buffer, starts, ends)
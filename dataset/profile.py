@@ -0,0 +1,109 @@
+"""
+Dataset Profile Module
+
+This module contains cheap inspections of a loaded dataset: whether it is
+already sorted, and a profile of its size, key distribution, duplicate rate
+and record width that the algorithm planner bases its choice on.
+"""
+
+from typing import NamedTuple, Sequence
+
+from search.interpolation import PrefixKeyEncoder
+
+# Number of evenly spaced records the key distribution is measured on
+PROFILE_SAMPLE = 1024
+
+
+class DatasetProfile(NamedTuple):
+    """Summary of the properties that decide which search algorithm is fastest."""
+
+    size: int
+    presorted: bool
+    uniformity: float
+    duplicate_rate: float
+    mean_width: float
+
+
+def is_sorted(data: Sequence[str]) -> bool:
+    """
+    Check whether a dataset is in non-decreasing order.
+
+    Time complexity: O(n), stopping at the first inversion
+
+    Args:
+        data: Dataset to check
+
+    Returns:
+        True if every record is <= its successor
+    """
+    previous = None
+    for record in data:
+        if previous is not None and record < previous:
+            return False
+        previous = record
+    return True
+
+
+def key_uniformity(sorted_data: Sequence[str], samples: int = PROFILE_SAMPLE) -> float:
+    """
+    Measure how evenly the records spread over their key range.
+
+    Evenly spaced records are mapped to order-preserving integer keys (as
+    string interpolation search does) and compared with a straight line
+    from the smallest to the largest key. The score is one minus the largest
+    gap between the two (a Kolmogorov-Smirnov distance): 1.0 means perfectly
+    uniform keys, where interpolation lands next to the target, and values
+    near 0 mean the keys are clustered.
+
+    Args:
+        sorted_data: Sorted dataset
+        samples: Number of records to measure on
+
+    Returns:
+        Uniformity score between 0 and 1
+    """
+    n = len(sorted_data)
+    count = min(n, samples)
+    if count < 2:
+        return 1.0
+
+    sample = [sorted_data[i * (n - 1) // (count - 1)] for i in range(count)]
+    encoder = PrefixKeyEncoder(sample)
+    keys = [encoder.key(record) for record in sample]
+    span = keys[-1] - keys[0]
+    if span == 0:
+        return 0.0
+
+    distance = max(
+        abs((key - keys[0]) / span - i / (count - 1)) for i, key in enumerate(keys)
+    )
+    return 1.0 - distance
+
+
+def profile_dataset(data: Sequence[str], sorted_data: Sequence[str]) -> DatasetProfile:
+    """
+    Profile a dataset for the algorithm planner.
+
+    Args:
+        data: Dataset in its original order
+        sorted_data: Sorted dataset (data itself when it is presorted)
+
+    Returns:
+        DatasetProfile of the data
+    """
+    n = len(data)
+    if n == 0:
+        return DatasetProfile(0, True, 1.0, 0.0, 0.0)
+
+    # Duplicates are adjacent in sorted order
+    duplicates = sum(1 for i in range(1, n) if sorted_data[i] == sorted_data[i - 1])
+    step = max(n // PROFILE_SAMPLE, 1)
+    widths = [len(data[i]) for i in range(0, n, step)]
+
+    return DatasetProfile(
+        size=n,
+        presorted=sorted_data is data or is_sorted(data),
+        uniformity=key_uniformity(sorted_data),
+        duplicate_rate=duplicates / n,
+        mean_width=sum(widths) / len(widths),
+    )
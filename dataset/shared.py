@@ -0,0 +1,200 @@
+"""
+Shared-Memory Dataset Module
+
+This module contains helpers for publishing a dataset to worker processes
+through multiprocessing.shared_memory instead of pickling it per worker.
+The records are stored as one UTF-8 blob, with a newline before and after
+every record, plus an array('Q') of record offsets. Workers either read the segments in place
+through SharedRecordsView or copy a range out with attach_records.
+"""
+
+import re
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+from multiprocessing import shared_memory
+from typing import Iterable, List, NamedTuple, Optional
+
+# Size of one array('Q') item in bytes
+OFFSET_SIZE = array("Q").itemsize
+
+
+class SharedRecordsHandle(NamedTuple):
+    """Picklable reference to a dataset published in shared memory."""
+
+    blob_name: str
+    offsets_name: str
+    count: int
+
+
+class SharedRecords:
+    """
+    Owner of a dataset published in shared memory.
+
+    The owning process creates the segments and unlinks them on close();
+    workers only receive the small handle and attach to the segments.
+    """
+
+    def __init__(self, records: Iterable[str]):
+        """
+        Publish records to shared memory.
+
+        Args:
+            records: Records to publish, in order
+        """
+        # Record i spans [offsets[i], offsets[i + 1] - 1); the leading
+        # newline lets every record be matched as "\n" + record + "\n"
+        offsets = array("Q", [1])
+        encoded = [b""]
+        for record in records:
+            data = record.encode("utf-8")
+            encoded.append(data)
+            # +1 accounts for the newline separator in the blob
+            offsets.append(offsets[-1] + len(data) + 1)
+        encoded.append(b"")
+        blob = b"\n".join(encoded)
+
+        self._blob = shared_memory.SharedMemory(create=True, size=len(blob))
+        self._blob.buf[: len(blob)] = blob
+        self._offsets = shared_memory.SharedMemory(
+            create=True, size=len(offsets) * OFFSET_SIZE
+        )
+        self._offsets.buf[: len(offsets) * OFFSET_SIZE] = offsets.tobytes()
+
+        self.handle = SharedRecordsHandle(
+            self._blob.name, self._offsets.name, len(offsets) - 1
+        )
+
+    def __enter__(self) -> "SharedRecords":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release and unlink the shared segments."""
+        for segment in (self._blob, self._offsets):
+            segment.close()
+            segment.unlink()
+
+
+class SharedRecordsView(Sequence):
+    """
+    Read-only sequence over a range of a shared dataset, without copying it.
+
+    The view maps the segments and decodes a record only when it is
+    accessed; find() compares the encoded target against the blob without
+    decoding at all. Close the view before the process exits.
+    """
+
+    def __init__(
+        self, handle: SharedRecordsHandle, start: int = 0, stop: Optional[int] = None
+    ):
+        """
+        Attach to the records [start, stop) of a shared dataset.
+
+        Args:
+            handle: Handle created by SharedRecords
+            start: First record index of the view
+            stop: Record index the view ends at (exclusive), defaults to the end
+        """
+        stop = handle.count if stop is None else min(stop, handle.count)
+        start = min(start, stop)
+
+        self._blob_segment = shared_memory.SharedMemory(name=handle.blob_name)
+        self._offsets_segment = shared_memory.SharedMemory(name=handle.offsets_name)
+        self._blob = self._blob_segment.buf
+        self._all_offsets = self._offsets_segment.buf.cast("Q")
+        self._offsets = self._all_offsets[start : stop + 1]
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SharedRecordsView index out of range")
+        # Every record is followed by a separator, counted in the next offset
+        start, stop = self._offsets[index], self._offsets[index + 1] - 1
+        return bytes(self._blob[start:stop]).decode("utf-8")
+
+    def __enter__(self) -> "SharedRecordsView":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def find(self, target: str, start: int = 0, stop: Optional[int] = None) -> int:
+        """
+        Find the first record equal to target, searching the blob in place.
+
+        Args:
+            target: Record to search for
+            start: First index to check
+            stop: Index to stop at (exclusive), defaults to the end
+
+        Returns:
+            Index of the first matching record in [start, stop), -1 if none
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        if start >= stop:
+            return -1
+
+        offsets = self._offsets
+        # A literal pattern is searched with a fast substring scan
+        pattern = re.compile(re.escape(b"\n" + target.encode("utf-8") + b"\n"))
+        match = pattern.search(self._blob, offsets[start] - 1, offsets[stop])
+        if match is None:
+            return -1
+        return bisect_right(offsets, match.start() + 1, start, stop) - 1
+
+    def close(self) -> None:
+        """Release the buffers and detach from the segments."""
+        for view in (self._offsets, self._all_offsets, self._blob):
+            view.release()
+        self._blob_segment.close()
+        self._offsets_segment.close()
+
+
+def attach_records(
+    handle: SharedRecordsHandle, start: int = 0, stop: Optional[int] = None
+) -> List[str]:
+    """
+    Read records from a shared dataset into a local list.
+
+    Only the requested range is decoded. Unlike SharedRecordsView this
+    copies the records, for workers that must measure algorithms on a list
+    exactly like a run in a single process.
+
+    Args:
+        handle: Handle created by SharedRecords
+        start: First record index to read
+        stop: Record index to stop at (exclusive), defaults to the end
+
+    Returns:
+        List of records in [start, stop)
+    """
+    stop = handle.count if stop is None else min(stop, handle.count)
+    if start >= stop:
+        return []
+
+    offsets_segment = shared_memory.SharedMemory(name=handle.offsets_name)
+    try:
+        offsets = array("Q")
+        offsets.frombytes(
+            offsets_segment.buf[start * OFFSET_SIZE : (stop + 1) * OFFSET_SIZE]
+        )
+    finally:
+        offsets_segment.close()
+
+    blob_segment = shared_memory.SharedMemory(name=handle.blob_name)
+    try:
+        # Leave out the separator after the last record of the range
+        text = bytes(blob_segment.buf[offsets[0] : offsets[-1] - 1]).decode("utf-8")
+    finally:
+        blob_segment.close()
+
+    return text.split("\n")
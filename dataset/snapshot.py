@@ -0,0 +1,200 @@
+"""
+Dataset Snapshot Module
+
+This module contains an on-disk cache of preprocessed datasets. A snapshot
+holds the stripped records and their sorted order, so later runs can skip
+both parsing the text file and sorting it.
+
+Snapshot layout (all integers little-endian unsigned 64-bit):
+    magic | record count | blob length | order[count] | blob
+The blob holds the UTF-8 records joined by newlines.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import time
+from array import array
+from pathlib import Path
+from typing import Callable, List, NamedTuple, Optional, Tuple, Union
+
+from dataset.profile import is_sorted
+
+MAGIC = b"SABSNAP2"
+HEADER = struct.Struct("<8sQQ")
+INDEX_FILE = "index.json"
+CHUNK_SIZE = 1 << 20
+
+
+class Snapshot(NamedTuple):
+    """Preprocessed dataset: records in file order plus their sorted order."""
+
+    records: List[str]
+    order: array
+    # Seconds spent computing order; 0.0 for snapshots read from disk
+    sort_time: float = 0.0
+
+
+def file_fingerprint(
+    filepath: Union[str, Path], cache_dir: Optional[Path] = None
+) -> str:
+    """
+    Compute the SHA-256 content hash of a file.
+
+    When a cache directory is given, hashes are memoized there by absolute
+    path, size and mtime, so an unchanged file is not re-read on every run.
+
+    Args:
+        filepath: Path to the file
+        cache_dir: Optional directory holding the hash memo
+
+    Returns:
+        Hex digest of the file content
+    """
+    path = Path(filepath).resolve()
+    stat = path.stat()
+    key = f"{path}|{stat.st_size}|{stat.st_mtime_ns}"
+
+    index = {}
+    index_path = cache_dir / INDEX_FILE if cache_dir is not None else None
+    if index_path is not None and index_path.exists():
+        try:
+            index = json.loads(index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            index = {}
+        if key in index:
+            return index[key]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    fingerprint = digest.hexdigest()
+
+    if index_path is not None:
+        # Drop stale entries for the same path
+        index = {k: v for k, v in index.items() if not k.startswith(f"{path}|")}
+        index[key] = fingerprint
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        index_path.write_text(json.dumps(index), encoding="utf-8")
+
+    return fingerprint
+
+
+def build_snapshot(records: List[str]) -> Snapshot:
+    """
+    Build a snapshot from loaded records.
+
+    Args:
+        records: Stripped records in file order
+
+    Returns:
+        Snapshot with the sorted order computed, and the time the sort took
+    """
+    # Presorted files keep the identity order without paying for a sort
+    start_time = time.perf_counter()
+    if is_sorted(records):
+        order = array("Q", range(len(records)))
+    else:
+        order = array("Q", sorted(range(len(records)), key=records.__getitem__))
+    sort_time = time.perf_counter() - start_time
+
+    return Snapshot(records, order, sort_time)
+
+
+def write_snapshot(path: Union[str, Path], snapshot: Snapshot) -> None:
+    """
+    Write a snapshot to disk atomically.
+
+    Args:
+        path: Destination file
+        snapshot: Snapshot to write
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    blob = "\n".join(snapshot.records).encode("utf-8")
+
+    temp_path = path.with_suffix(".tmp")
+    with open(temp_path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, len(snapshot.records), len(blob)))
+        snapshot.order.tofile(file)
+        file.write(blob)
+    os.replace(temp_path, path)
+
+
+def read_snapshot(path: Union[str, Path]) -> Snapshot:
+    """
+    Read a snapshot from disk.
+
+    Args:
+        path: Snapshot file
+
+    Returns:
+        The stored snapshot
+
+    Raises:
+        ValueError: If the file is not a valid snapshot
+    """
+    with open(path, "rb") as file:
+        magic, count, blob_length = HEADER.unpack(file.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a dataset snapshot")
+
+        order = array("Q")
+        order.fromfile(file, count)
+        blob = file.read(blob_length)
+
+    if len(blob) != blob_length:
+        raise ValueError(f"{path} is truncated")
+
+    # Records never contain newlines, so one decode and split restores them all
+    records = blob.decode("utf-8").split("\n") if count else []
+
+    return Snapshot(records, order)
+
+
+def sorted_records(snapshot: Snapshot) -> List[str]:
+    """
+    Return the records in sorted order using the stored permutation.
+
+    Args:
+        snapshot: Snapshot to read
+
+    Returns:
+        Sorted list of records, gathered without any comparisons
+    """
+    records = snapshot.records
+    return [records[i] for i in snapshot.order]
+
+
+def load_snapshot(
+    filepath: Union[str, Path],
+    cache_dir: Union[str, Path],
+    loader: Callable[[Union[str, Path]], List[str]],
+) -> Tuple[Snapshot, bool]:
+    """
+    Load a dataset through the snapshot cache.
+
+    Args:
+        filepath: Path to the source text file
+        cache_dir: Directory holding snapshots
+        loader: Function that parses the source file into records on a miss
+
+    Returns:
+        Tuple containing (snapshot, cache_hit)
+    """
+    cache_dir = Path(cache_dir)
+    snapshot_path = cache_dir / f"{file_fingerprint(filepath, cache_dir)}.snap"
+
+    if snapshot_path.exists():
+        try:
+            return read_snapshot(snapshot_path), True
+        except (OSError, ValueError, struct.error, EOFError):
+            # A corrupt snapshot is rebuilt below
+            pass
+
+    snapshot = build_snapshot(loader(filepath))
+    write_snapshot(snapshot_path, snapshot)
+
+    return snapshot, False
@@ -6,261 +6,2422 @@ This script benchmarks various search algorithms on a given dataset and
 provides performance metrics for comparison.
 """
 
+import gc
+import math
+import os
+import re
+import sys
 import time
 import argparse
+import collections.abc
+import json
 import statistics
-from typing import List, Dict, Tuple, Union, Callable
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    List,
+    Dict,
+    Tuple,
+    Union,
+    Callable,
+    Iterator,
+    Sequence,
+    Optional,
+)
 from pathlib import Path
 
-from rich.console import Console
-from rich.progress import Progress, TextColumn, BarColumn, TimeElapsedColumn
-from rich.table import Table
+from bench.instrument import count_probes
+from bench.timing import (
+    DEFAULT_MIN_TIME,
+    calibrated_timing,
+    query_latencies,
+    timer_overhead,
+)
+
+# Other search modules are imported by the registry on first use
+from search.binary import binary_search
+from search.registry import (
+    LazyRegistry,
+    batch_function,
+    engine_loader,
+    function_loader,
+    load_plugin,
+    plugin_entry_points,
+)
+
+if TYPE_CHECKING:
+    from bench.planner import Plan
+    from bench.regression import Comparison
+    from bench.workload import WorkloadProfile
+    from dataset.shared import SharedRecordsHandle
+
+
+class LazyConsole:
+    """
+    Console that imports rich on first use, or prints plain text when headless.
+
+    Headless output goes to stderr with markup stripped, so stdout carries
+    nothing but the machine-readable results.
+    """
+
+    def __init__(self):
+        """Start with no rich console and headless mode off."""
+        self.headless = False
+        self._console = None
+
+    @property
+    def rich(self):
+        """The rich Console, created on first access."""
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return self._console
+
+    def print(self, *objects, **kwargs) -> None:
+        """
+        Print objects, like rich.console.Console.print.
+
+        Args:
+            *objects: Objects to print
+            **kwargs: Options passed on to rich
+        """
+        if self.headless:
+            text = " ".join(str(obj) for obj in objects)
+            print(re.sub(r"\[/?[a-z ]*\]", "", text), file=sys.stderr)
+        else:
+            self.rich.print(*objects, **kwargs)
+
+
+class NullProgress:
+    """Stand-in for rich.progress.Progress that displays nothing."""
+
+    def __enter__(self) -> "NullProgress":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+    def add_task(self, description: str, **kwargs) -> int:
+        return 0
+
+    def update(self, task: int, **kwargs) -> None:
+        pass
 
-# Import search algorithms
-from search.linear import linear_search, sentinel_linear_search
-from search.binary import binary_search, ubiquitous_binary, meta_binary_search
-from search.jump import jump_search
-from search.interpolation import interpolation_search
-from search.exponential import exponential_search
-from search.ternary import ternary_search
-from search.fibonacci import fibonacci_search
 
 # Initialize console
-console = Console()
-
-# Define algorithm mapping
-ALGORITHMS = {
-    "linear": linear_search,
-    "binary": binary_search,
-    "jump": jump_search,
-    "interpolation": interpolation_search,
-    "exponential": exponential_search,
-    "ternary": ternary_search,
-    "sentinel": sentinel_linear_search,
-    "meta_binary": meta_binary_search,
-    "ubiquitous_binary": ubiquitous_binary,
-    "fibonacci": fibonacci_search,
-    "all": None,
-}
+console = LazyConsole()
+
+
+def _batch_of(name: str) -> Callable:
+    """
+    Loader for the batch variant of an engine or plugin in ALGORITHMS.
+
+    Args:
+        name: Algorithm name
+
+    Returns:
+        Batch search function of the same instance
+    """
+    return batch_function(ALGORITHMS[name])
+
+
+def _load_plugin(name: str) -> Callable:
+    """
+    Load a plugin and record whether it requires sorted input.
+
+    Args:
+        name: Plugin name
+
+    Returns:
+        Search function or engine
+    """
+    algorithm = load_plugin(name)
+    if getattr(algorithm, "needs_sorted", False) and name not in NEED_SORTED:
+        NEED_SORTED.append(name)
+    return algorithm
+
+
+# Define algorithm mapping; entries are imported or built on first use
+ALGORITHMS = LazyRegistry(
+    {
+        "linear": function_loader("search.linear", "linear_search"),
+        "binary": function_loader("search.binary", "binary_search"),
+        "jump": function_loader("search.jump", "jump_search"),
+        "interpolation": function_loader(
+            "search.interpolation", "interpolation_search"
+        ),
+        "exponential": function_loader("search.exponential", "exponential_search"),
+        "ternary": function_loader("search.ternary", "ternary_search"),
+        "sentinel": function_loader("search.linear", "sentinel_linear_search"),
+        "meta_binary": function_loader("search.binary", "meta_binary_search"),
+        "ubiquitous_binary": function_loader("search.binary", "ubiquitous_binary"),
+        "fibonacci": function_loader("search.fibonacci", "fibonacci_search"),
+        "sentinel_prepared": engine_loader("search.linear", "SentinelSearcher"),
+        "string_interpolation": engine_loader(
+            "search.interpolation", "StringInterpolationSearcher"
+        ),
+        "parallel_linear": engine_loader(
+            "search.parallel_linear", "ParallelLinearSearcher"
+        ),
+        "hash_index": engine_loader("search.hash_index", "HashIndexSearcher"),
+        "hash_index_compact": engine_loader(
+            "search.hash_index", "HashIndexSearcher", compact=True
+        ),
+        "eytzinger": engine_loader("search.layout", "EytzingerSearcher"),
+        "btree": engine_loader("search.layout", "BTreeSearcher"),
+        "learned": engine_loader("search.learned", "LearnedIndexSearcher"),
+        "all": lambda: None,
+    },
+    discover=lambda: {
+        name: partial(_load_plugin, name) for name in plugin_entry_points()
+    },
+)
+
+# Batch (multi-target) variants of each algorithm; engines and plugins
+# share their instance with ALGORITHMS
+BATCH_ALGORITHMS = LazyRegistry(
+    {
+        "linear": function_loader("search.linear", "linear_search_many"),
+        "binary": function_loader("search.binary", "binary_search_many"),
+        "jump": function_loader("search.jump", "jump_search_many"),
+        "interpolation": function_loader(
+            "search.interpolation", "interpolation_search_many"
+        ),
+        "exponential": function_loader("search.exponential", "exponential_search_many"),
+        "ternary": function_loader("search.ternary", "ternary_search_many"),
+        "sentinel": function_loader("search.linear", "sentinel_linear_search_many"),
+        "meta_binary": function_loader("search.binary", "meta_binary_search_many"),
+        "ubiquitous_binary": function_loader("search.binary", "ubiquitous_binary_many"),
+        "fibonacci": function_loader("search.fibonacci", "fibonacci_search_many"),
+        **{
+            name: partial(_batch_of, name)
+            for name in [
+                "sentinel_prepared",
+                "string_interpolation",
+                "parallel_linear",
+                "hash_index",
+                "hash_index_compact",
+                "eytzinger",
+                "btree",
+                "learned",
+            ]
+        },
+    },
+    discover=lambda: {name: partial(_batch_of, name) for name in plugin_entry_points()},
+)
+
+# Algorithms that require sorted input; plugins are added when loaded
+NEED_SORTED = [
+    "binary",
+    "interpolation",
+    "exponential",
+    "ternary",
+    "meta_binary",
+    "ubiquitous_binary",
+    "fibonacci",
+    "jump",
+    "string_interpolation",
+    "eytzinger",
+    "btree",
+    "learned",
+]
+
+# Layout engines and the plain sorted-list search they are compared with
+LAYOUT_ENGINES = ["eytzinger", "btree"]
+LAYOUT_BASELINE = "meta_binary"
+
+# Latency percentiles reported for batch runs
+LATENCY_PERCENTILES = (50, 90, 99)
+
+# Available search backends
+BACKENDS = ["python", "numpy", "both"]
+
+# Default directory for preprocessed dataset snapshots
+DEFAULT_CACHE_DIR = ".snapshots"
+
+# Available dataset loaders
+LOADERS = ["text", "mmap"]
+
+# Available in-memory storage layouts
+STORAGES = ["list", "compact", "both"]
+
+# Output formats: rich tables, or JSON on stdout without importing rich
+FORMATS = ["table", "json"]
+
+# Query modes: exact lookups, or records containing the target as a substring
+MODES = ["exact", "substring"]
+
+# Result cache policies measured next to every algorithm, see register_cache
+CACHES: List[str] = []
+CACHE_CAPACITY: Optional[int] = None
+
+# Whether every benchmark ends with a probe counting pass, see --instrument
+INSTRUMENT = False
+
+# Profiling passes after every benchmark, see enable_profiling
+PROFILE_DIR: Optional[str] = None
+TRACE_MEMORY = False
+
+# Registry overrides, see register_parallel_workers and register_node_width
+PARALLEL_WORKERS: Optional[List[int]] = None
+NODE_WIDTH: Optional[int] = None
+
+# Default directory for --profile output
+DEFAULT_PROFILE_DIR = "profiles"
+
+# Exit status when --compare-baseline finds a regression; 1 is any error
+# and 2 a usage error
+REGRESSION_EXIT_CODE = 3
+
+# Baseline fields that should match for a comparison to be meaningful
+BASELINE_CONTEXT = [
+    ("environment", "python"),
+    ("environment", "cpu"),
+    ("settings", "dataset_fingerprint"),
+    ("settings", "backend"),
+    ("settings", "storage"),
+]
+
+
+def format_time(seconds: float) -> str:
+    """
+    Format execution time into appropriate units.
+
+    Args:
+        seconds: Time in seconds
+
+    Returns:
+        Formatted time string with appropriate unit
+    """
+    if seconds < 1e-6:  # Less than 1 microsecond
+        return f"{seconds * 1e9:.2f} ns"
+    elif seconds < 1e-3:  # Less than 1 millisecond
+        return f"{seconds * 1e6:.2f} μs"
+    elif seconds < 1:  # Less than 1 second
+        return f"{seconds * 1e3:.2f} ms"
+    elif seconds < 60:  # Less than 1 minute
+        return f"{seconds:.2f} s"
+    else:  # Minutes or more
+        return f"{seconds / 60:.2f} min"
+
+
+def format_bytes(size: float) -> str:
+    """
+    Format a byte count into appropriate units.
+
+    Args:
+        size: Size in bytes
+
+    Returns:
+        Formatted size string with appropriate unit
+    """
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(size) < 1024 or unit == "GiB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.2f} {unit}"
+        size /= 1024
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Compute a percentile using the nearest-rank method.
+
+    Args:
+        values: Measured values (need not be sorted)
+        pct: Percentile in the range 0-100
+
+    Returns:
+        The value at the requested percentile
+    """
+    ordered = sorted(values)
+    # The smallest value with at least pct% of the values at or below it;
+    # multiplying first keeps whole-number ranks exact
+    rank = max(math.ceil(pct * len(ordered) / 100) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def progress_bar(show: bool = True, auto_refresh: bool = False):
+    """
+    Create the progress display used by every benchmark loop.
+
+    rich is imported here rather than at startup; headless runs get a
+    display that does nothing.
+
+    Args:
+        show: Whether to display the bar
+        auto_refresh: Refresh from a background thread instead of only on
+                      update(refresh=True)
+
+    Returns:
+        A rich Progress, or a NullProgress when headless
+    """
+    if console.headless:
+        return NullProgress()
+
+    from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn
+
+    return Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TimeElapsedColumn(),
+        console=console.rich,
+        disable=not show,
+        auto_refresh=auto_refresh,
+    )
+
+
+def print_json(payload: Dict) -> None:
+    """
+    Write results to stdout as one JSON document.
+
+    Args:
+        payload: Results and their context
+    """
+    from bench.history import json_ready
+
+    json.dump(json_ready(payload), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+def enable_headless() -> None:
+    """Send messages to stderr as plain text and never import rich."""
+    console.headless = True
+
+
+def load_numpy_backend() -> Tuple[Dict[str, Callable], Dict[str, Callable], Callable]:
+    """
+    Import the NumPy backend lazily, since numpy is an optional dependency.
+
+    Returns:
+        Tuple containing (algorithms, batch_algorithms, array_converter)
+
+    Raises:
+        ImportError: If numpy is not installed
+    """
+    try:
+        from search import numpy_backend
+    except ImportError:
+        console.print(
+            "[bold red]Error:[/] The numpy backend requires numpy (pip install numpy)."
+        )
+        raise
+
+    algorithms = {
+        "linear": numpy_backend.numpy_linear_search,
+        "binary": numpy_backend.numpy_binary_search,
+    }
+    batch_algorithms = {
+        "linear": numpy_backend.numpy_linear_search_many,
+        "binary": numpy_backend.numpy_binary_search_many,
+    }
+
+    return algorithms, batch_algorithms, numpy_backend.to_numpy_array
+
+
+def base_variants(
+    names: Sequence[str],
+    data: List[str],
+    sorted_data: List[str],
+    backend: str = "python",
+) -> Iterator[Tuple[str, str, Callable, Callable, Sequence]]:
+    """
+    Resolve the uncached algorithm variants for the selected backend.
+
+    The NumPy arrays are built once here so that every variant runs on the
+    same converted data and conversion is never part of the measured time.
+
+    Args:
+        names: Algorithm names from ALGORITHMS
+        data: Dataset in its original order
+        sorted_data: Sorted dataset for algorithms that require it
+        backend: One of BACKENDS
+
+    Yields:
+        Tuples of (label, name, algorithm, batch_algorithm, dataset)
+    """
+    if backend in ("python", "both"):
+        for name in names:
+            current_data = sorted_data if needs_sorted([name]) else data
+            yield name, name, ALGORITHMS[name], BATCH_ALGORITHMS[name], current_data
+
+    if backend in ("numpy", "both"):
+        algorithms, batch_algorithms, to_array = load_numpy_backend()
+        array = to_array(data)
+        sorted_array = array if sorted_data is data else to_array(sorted_data)
+
+        for name in names:
+            if name not in algorithms:
+                if len(names) == 1:
+                    console.print(f"[yellow]No numpy variant for {name}.[/]")
+                continue
+
+            current_data = sorted_array if name in NEED_SORTED else array
+            yield (
+                f"{name} (numpy)",
+                name,
+                algorithms[name],
+                batch_algorithms[name],
+                current_data,
+            )
+
+
+def backend_variants(
+    names: Sequence[str],
+    data: List[str],
+    sorted_data: List[str],
+    backend: str = "python",
+) -> Iterator[Tuple[str, str, Callable, Callable, Sequence]]:
+    """
+    Resolve the algorithm variants to benchmark for the selected backend.
+
+    Every variant from base_variants is followed by one cached copy per
+    registered cache policy, each with a fresh cache, so cached and
+    uncached runs land in the same table.
+
+    Args:
+        names: Algorithm names from ALGORITHMS
+        data: Dataset in its original order
+        sorted_data: Sorted dataset for algorithms that require it
+        backend: One of BACKENDS
+
+    Yields:
+        Tuples of (label, name, algorithm, batch_algorithm, dataset)
+    """
+    if CACHES:
+        from search.cache import CachedSearch
+
+    for label, name, func, batch_func, dataset in base_variants(
+        names, data, sorted_data, backend
+    ):
+        yield label, name, func, batch_func, dataset
+
+        for policy in CACHES:
+            cached = CachedSearch(func, policy, CACHE_CAPACITY)
+            yield f"{label} ({policy} cache)", name, cached, cached.batch, dataset
+
+
+def register_parallel_workers(worker_counts: List[int]) -> None:
+    """
+    Replace the parallel_linear entry with one entry per worker count.
+
+    This lets a single run benchmark how parallel linear search scales,
+    e.g. parallel_linear_1, parallel_linear_2 and parallel_linear_4.
+
+    Args:
+        worker_counts: Worker counts to register
+    """
+    global PARALLEL_WORKERS
+    PARALLEL_WORKERS = list(worker_counts)
+
+    del ALGORITHMS["parallel_linear"]
+    del BATCH_ALGORITHMS["parallel_linear"]
+
+    for workers in worker_counts:
+        name = f"parallel_linear_{workers}"
+        ALGORITHMS.register(
+            name,
+            engine_loader("search.parallel_linear", "ParallelLinearSearcher", workers),
+        )
+        BATCH_ALGORITHMS.register(name, partial(_batch_of, name))
+
+    # Keep "all" as the last entry
+    ALGORITHMS["all"] = ALGORITHMS.pop("all")
+
+
+def register_node_width(width: int) -> None:
+    """
+    Replace the btree entry with an engine of the given node width.
+
+    Args:
+        width: Number of keys per B+-tree node
+    """
+    global NODE_WIDTH
+    NODE_WIDTH = width
+
+    ALGORITHMS.register("btree", engine_loader("search.layout", "BTreeSearcher", width))
+    BATCH_ALGORITHMS.register("btree", partial(_batch_of, "btree"))
+
+
+def register_cache(policies: List[str], capacity: int) -> None:
+    """
+    Measure every algorithm also behind a result cache of each policy.
+
+    Args:
+        policies: Eviction policies from search.cache.POLICIES
+        capacity: Maximum number of cached results
+    """
+    global CACHE_CAPACITY
+    CACHES[:] = policies
+    CACHE_CAPACITY = capacity
+
+
+def enable_instrumentation() -> None:
+    """Add a probe counting pass after the timed runs of every benchmark."""
+    global INSTRUMENT
+    INSTRUMENT = True
+
+
+def enable_profiling(directory: Optional[str], memory: bool) -> None:
+    """
+    Add cProfile and tracemalloc passes after the timed runs of every benchmark.
+
+    Args:
+        directory: Directory for profile dumps, None to skip the profile pass
+        memory: Whether to run the tracemalloc pass
+    """
+    global PROFILE_DIR, TRACE_MEMORY
+    PROFILE_DIR = directory
+    TRACE_MEMORY = memory
+
+
+def worker_settings() -> Dict:
+    """
+    Collect the settings made by the register_* and enable_* functions.
+
+    Worker processes started with spawn or forkserver import this module
+    afresh, so they only see these settings when given them explicitly.
+
+    Returns:
+        Dictionary for apply_worker_settings
+    """
+    return {
+        "caches": list(CACHES),
+        "cache_capacity": CACHE_CAPACITY,
+        "instrument": INSTRUMENT,
+        "profile_dir": PROFILE_DIR,
+        "trace_memory": TRACE_MEMORY,
+        "parallel_workers": PARALLEL_WORKERS,
+        "node_width": NODE_WIDTH,
+    }
+
+
+def apply_worker_settings(settings: Dict) -> None:
+    """
+    Apply settings collected by worker_settings in this process.
+
+    Settings this process already has (e.g. inherited through fork) are
+    left alone, so the registries are not rewritten twice.
+
+    Args:
+        settings: Dictionary from worker_settings
+    """
+    register_cache(settings["caches"], settings["cache_capacity"])
+    if settings["instrument"]:
+        enable_instrumentation()
+    enable_profiling(settings["profile_dir"], settings["trace_memory"])
+
+    if settings["node_width"] is not None and settings["node_width"] != NODE_WIDTH:
+        register_node_width(settings["node_width"])
+    if (
+        settings["parallel_workers"]
+        and settings["parallel_workers"] != PARALLEL_WORKERS
+    ):
+        register_parallel_workers(settings["parallel_workers"])
+
+
+def selected_algorithms(algorithm: str) -> List[str]:
+    """
+    Resolve the --algorithm choice to the registered algorithm names.
+
+    Args:
+        algorithm: Value of --algorithm
+
+    Returns:
+        List of algorithm names from ALGORITHMS
+    """
+    if algorithm == "all":
+        return [name for name in ALGORITHMS if name != "all"]
+    if algorithm not in ALGORITHMS:
+        # parallel_linear expanded into one entry per worker count
+        return [name for name in ALGORITHMS if name.startswith(f"{algorithm}_")]
+    return [algorithm]
+
+
+def needs_sorted(names: Sequence[str]) -> bool:
+    """
+    Check whether any of the given algorithms requires sorted input.
+
+    Plugins are loaded first, since they declare it themselves.
+
+    Args:
+        names: Algorithm names from ALGORITHMS
+
+    Returns:
+        True if a sorted copy of the dataset is needed
+    """
+    for name in names:
+        if name in ALGORITHMS.discovered:
+            ALGORITHMS[name]
+    return any(name in NEED_SORTED for name in names)
+
+
+def load_data(filepath: Union[str, Path]) -> List[str]:
+    """
+    Load data from a text file.
+
+    Args:
+        filepath: Path to the data file
+
+    Returns:
+        List of strings from the file
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        IOError: If there's an issue reading the file
+    """
+    try:
+        with open(filepath, "r", encoding="utf-8") as file:
+            # Read lines and strip whitespace
+            data = [line.strip() for line in file if line.strip()]
+        return data
+    except FileNotFoundError:
+        console.print(f"[bold red]Error:[/] File {filepath} not found.")
+        raise
+    except IOError as e:
+        console.print(f"[bold red]Error:[/] Could not read file {filepath}: {e}")
+        raise
+
+
+def load_dataset(
+    filepath: Union[str, Path],
+    need_sorted: bool,
+    cache_dir: Optional[str] = None,
+    loader: str = "text",
+) -> Tuple[Sequence[str], Sequence[str]]:
+    """
+    Load a dataset and its sorted copy, timing each phase separately.
+
+    With a cache directory, the dataset goes through the snapshot cache so
+    that later runs skip both parsing and sorting. The mmap loader bypasses
+    the cache and returns lazy views that decode records on access.
+
+    Args:
+        filepath: Path to the data file
+        need_sorted: Whether any selected algorithm requires sorted data
+        cache_dir: Snapshot directory, or None to disable the cache
+        loader: One of LOADERS
+
+    Returns:
+        Tuple containing (data, sorted_data); sorted_data is data itself
+        when sorting is not needed
+    """
+    console.print(f"\n[bold]Loading data from {filepath}...[/]")
+
+    start_time = time.perf_counter()
+    snapshot = None
+    if loader == "mmap":
+        from dataset.mmap_loader import open_mapped
+
+        data = open_mapped(filepath)
+        source = "memory-mapped"
+    elif cache_dir is None:
+        data = load_data(filepath)
+        source = "text file"
+    else:
+        from dataset.snapshot import load_snapshot
+
+        snapshot, cache_hit = load_snapshot(filepath, cache_dir, load_data)
+        data = snapshot.records
+        source = "snapshot" if cache_hit else "text file, snapshot written"
+    # A snapshot built on a miss sorted the records too; that is sort time
+    presort_time = 0.0 if snapshot is None else snapshot.sort_time
+    load_time = time.perf_counter() - start_time - presort_time
+
+    console.print(
+        f"[green]Loaded {len(data)} items in {format_time(load_time)} ({source}).[/]"
+    )
+
+    if not need_sorted:
+        return data, data
+
+    from dataset.profile import is_sorted
+
+    start_time = time.perf_counter()
+    if is_sorted(data):
+        sorted_data = data
+        source = "already sorted"
+    elif snapshot is not None:
+        from dataset.snapshot import sorted_records
+
+        sorted_data = sorted_records(snapshot)
+        source = "sorted for the snapshot" if presort_time else "snapshot order"
+    elif loader == "mmap":
+        sorted_data = data.sorted_view()
+        source = "sorted view"
+    else:
+        sorted_data = sorted(data)
+        source = "sorted()"
+    sort_time = time.perf_counter() - start_time + presort_time
+
+    console.print(f"[green]Sorted data in {format_time(sort_time)} ({source}).[/]")
+
+    return data, sorted_data
+
+
+def storage_variants(
+    data: Sequence[str], sorted_data: Sequence[str], storage: str = "list"
+) -> List[Tuple[str, Sequence[str], Sequence[str]]]:
+    """
+    Build the storage layouts to benchmark for a loaded dataset.
+
+    Args:
+        data: Dataset as loaded
+        sorted_data: Sorted dataset (or data itself when sorting is not needed)
+        storage: One of STORAGES
+
+    Returns:
+        List of (storage_name, data, sorted_data) tuples
+    """
+    variants = []
+
+    if storage in ("list", "both"):
+        variants.append(("list", data, sorted_data))
+
+    if storage in ("compact", "both"):
+        from dataset.compact import CompactStringArray
+
+        compact = CompactStringArray(data)
+        compact_sorted = (
+            compact if sorted_data is data else CompactStringArray(sorted_data)
+        )
+        variants.append(("compact", compact, compact_sorted))
+
+    return variants
+
+
+def storage_footprint(data: Sequence[str], sorted_data: Sequence[str]) -> int:
+    """
+    Estimate the memory held by one storage layout.
+
+    The sorted copy is counted too. Records it shares with the dataset (the
+    list layout) count once, while a separate sorted blob (the compact
+    layout) counts in full.
+
+    Args:
+        data: Dataset in the layout
+        sorted_data: Sorted dataset in the same layout, possibly data itself
+
+    Returns:
+        Approximate size in bytes
+    """
+    from dataset.compact import memory_footprint
+
+    seen: set = set()
+    return memory_footprint(data, seen) + memory_footprint(sorted_data, seen)
+
+
+def tag_results(
+    results: List[Dict], storage_name: str, footprint: int, suffix: bool
+) -> List[Dict]:
+    """
+    Attach storage information to benchmark results.
+
+    Args:
+        results: Benchmark results to update in place
+        storage_name: Storage layout the results were measured on
+        footprint: Memory footprint of that layout in bytes
+        suffix: Whether to append the storage name to the algorithm label
+
+    Returns:
+        The updated results
+    """
+    for result in results:
+        result["memory"] = footprint
+        if suffix:
+            result["algorithm"] = f"{result['algorithm']} ({storage_name})"
+    return results
+
+
+def prepare_algorithm(algorithm: Callable, data: Sequence[str]) -> Optional[float]:
+    """
+    Build a prepared engine for a dataset outside of the timed runs.
+
+    Plain search functions need no preparation. Engines (objects with a
+    prepare method, or bound methods of one) are prepared here so that the
+    one-off build cost is reported separately from per-query time.
+
+    Args:
+        algorithm: Search function or engine
+        data: Dataset the engine will search
+
+    Returns:
+        Build time in seconds, or None if the algorithm needs no preparation
+    """
+    engine = getattr(algorithm, "__self__", algorithm)
+    if not hasattr(engine, "prepare"):
+        return None
+
+    start_time = time.perf_counter()
+    engine.prepare(data)
+    return time.perf_counter() - start_time
+
+
+def cold_start(algorithm: Callable) -> None:
+    """
+    Drop the state an algorithm carried over from earlier passes.
+
+    A result cache left warm by the previous pass over the same queries
+    would answer nearly all of them as hits, so every pass starts from an
+    empty cache and zeroed counters.
+
+    Args:
+        algorithm: Search function or engine
+    """
+    engine = getattr(algorithm, "__self__", algorithm)
+    if hasattr(engine, "invalidate"):
+        engine.invalidate()
+    if hasattr(engine, "reset_stats"):
+        engine.reset_stats()
+
+
+def replay_cold(algorithm: Callable, data: Sequence[str], stream: List[str]) -> int:
+    """
+    Replay a query stream once, starting from a cold cache.
+
+    Args:
+        algorithm: Search function or engine
+        data: Dataset to search in
+        stream: Query stream, replayed in order
+
+    Returns:
+        Number of queries that found a match
+    """
+    from bench.sweep import run_queries
+
+    cold_start(algorithm)
+    return run_queries(algorithm, data, stream)
+
+
+def engine_stats(algorithm: Callable) -> Dict[str, float]:
+    """
+    Collect extra statistics (e.g. probes per query) reported by an engine.
+
+    Args:
+        algorithm: Search function or engine
+
+    Returns:
+        Dictionary of statistics, empty for plain search functions
+    """
+    engine = getattr(algorithm, "__self__", algorithm)
+    if not hasattr(engine, "stats"):
+        return {}
+    return engine.stats()
+
+
+def profiling_stats(
+    profile_name: str,
+    algorithm: Callable,
+    data: Sequence[str],
+    targets: List[str],
+    quiet: bool = False,
+) -> Dict[str, float]:
+    """
+    Run the --profile and --trace-memory passes that are enabled.
+
+    Both passes replay the timed queries after the timed runs, so profiler
+    and allocation tracing overhead never reaches the timings.
+
+    Args:
+        profile_name: Result label and mode (plus workload profile), used for
+                      the profile file names so runs do not overwrite each
+                      other
+        algorithm: Search function or engine
+        data: Dataset the algorithm was timed on
+        targets: Queries the algorithm was timed on
+        quiet: Suppress all console output (used by worker processes)
+
+    Returns:
+        Dictionary of memory statistics, empty without --trace-memory
+    """
+    stats = {}
+    if PROFILE_DIR is None and not TRACE_MEMORY:
+        return stats
+
+    # cProfile and pstats are slow to import, so only load them when needed
+    from bench.profiling import profile_calls, trace_memory
+
+    if PROFILE_DIR is not None:
+        path = profile_calls(profile_name, algorithm, data, targets, PROFILE_DIR)
+        if not quiet:
+            console.print(f"Profile written to {path} (+ .collapsed)")
+    if TRACE_MEMORY:
+        stats.update(trace_memory(algorithm, data, targets))
+    return stats
+
+
+def probe_stats(
+    algorithm: Callable, data: Sequence[str], targets: List[str]
+) -> Dict[str, float]:
+    """
+    Count accesses and comparisons per query when --instrument is on.
+
+    The count runs on proxies (see bench.instrument) after the timed runs,
+    so timings are unaffected and nothing runs when instrumentation is off.
+
+    Args:
+        algorithm: Search function or engine
+        data: Dataset the algorithm was timed on
+        targets: Queries the algorithm was timed on
+
+    Returns:
+        Dictionary of per-query counts, empty when instrumentation is off
+        or the dataset is not a Sequence (NumPy arrays are searched in C)
+    """
+    if not INSTRUMENT or not isinstance(data, collections.abc.Sequence):
+        return {}
+    return count_probes(algorithm, data, targets)
+
+
+def print_engine_stats(stats: Dict[str, float]) -> None:
+    """
+    Print the engine statistics that have a column in OPTIONAL_COLUMNS.
+
+    Args:
+        stats: Statistics returned by engine_stats
+    """
+    for key, header, formatter in OPTIONAL_COLUMNS:
+        if key in stats:
+            console.print(f"{header}: {formatter(stats[key])}")
+
+
+def attach_break_even(
+    results: List[Dict],
+    sorted_data: Sequence[str],
+    targets: List[str],
+    min_time: float = DEFAULT_MIN_TIME,
+) -> List[Dict]:
+    """
+    Add the query count at which each prepared engine pays for its build.
+
+    The baseline is binary_search on the already-sorted data, which needs
+    no build. An engine that saves s seconds per query over the baseline
+    recovers a build time b after b / s queries; one that is not faster
+    never does.
+
+    Args:
+        results: Benchmark results to update in place
+        sorted_data: Sorted dataset for the baseline (sorted here if it is
+                     the unsorted data itself)
+        targets: Queries the results were measured on
+        min_time: Minimum duration of one timed batch in seconds
+
+    Returns:
+        The updated results
+    """
+    from bench.sweep import run_queries
+    from dataset.profile import is_sorted
+
+    if not targets or not any("build_time" in result for result in results):
+        return results
+
+    if not is_sorted(sorted_data):
+        sorted_data = sorted(sorted_data)
+
+    timing = calibrated_timing(
+        run_queries, (binary_search, sorted_data, targets), 3, min_time
+    )
+    baseline = min(timing.per_call_times) / len(targets)
+
+    for result in results:
+        if "build_time" not in result:
+            continue
+        per_query = result["median_time"] / result.get("queries", 1)
+        saving = baseline - per_query
+        result["break_even"] = result["build_time"] / saving if saving > 0 else math.inf
+
+    return results
+
+
+def attach_layout_speedup(results: List[Dict]) -> List[Dict]:
+    """
+    Add the speedup of each layout engine over LAYOUT_BASELINE.
+
+    Each layout result is compared with the baseline result measured on the
+    same storage layout (the label with the same suffix).
+
+    Args:
+        results: Benchmark results to update in place
+
+    Returns:
+        The updated results
+    """
+    times = {
+        result["algorithm"]: result["median_time"] / result.get("queries", 1)
+        for result in results
+    }
+
+    for result in results:
+        label = result["algorithm"]
+        name = label.split(" ")[0]
+        if name not in LAYOUT_ENGINES:
+            continue
+        baseline = times.get(LAYOUT_BASELINE + label[len(name) :])
+        if baseline is not None and times[label] > 0:
+            result["speedup"] = baseline / times[label]
+
+    return results
+
+
+def format_break_even(queries: float) -> str:
+    """
+    Format a break-even query count.
+
+    Args:
+        queries: Number of queries, or infinity if never reached
+
+    Returns:
+        Formatted count
+    """
+    if math.isinf(queries):
+        return "never"
+    return f"{math.ceil(queries):,} queries"
+
+
+def run_single_search(
+    algorithm: Callable,
+    data: List[str],
+    target: str,
+    runs: int = 1,
+    show_progress: bool = True,
+    min_time: float = DEFAULT_MIN_TIME,
+) -> Tuple[bool, List[float]]:
+    """
+    Run a single search algorithm and measure execution time.
+
+    Each run is a calibrated batch of calls (see bench.timing), so the
+    reported times are per-call averages with loop overhead subtracted
+    rather than single timer readings.
+
+    Args:
+        algorithm: Search algorithm function
+        data: Dataset to search in
+        target: Item to search for
+        runs: Number of timed batches
+        show_progress: Whether to display a progress bar
+        min_time: Minimum duration of one timed batch in seconds
+
+    Returns:
+        Tuple containing (found_status, execution_times)
+    """
+    # The display is refreshed manually between batches, never while timing
+    with progress_bar(show_progress) as progress:
+        task = progress.add_task(f"Running {algorithm.__name__}", total=runs)
+
+        def advance(_: int) -> None:
+            progress.update(task, advance=1, refresh=True)
+
+        timing = calibrated_timing(
+            algorithm, (data, target), runs, min_time, on_batch=advance
+        )
+
+    return timing.result != -1, timing.per_call_times
+
+
+def run_batch_search(
+    algorithm: Callable,
+    batch_algorithm: Callable,
+    data: List[str],
+    targets: List[str],
+    runs: int = 1,
+    show_progress: bool = True,
+) -> Tuple[int, List[float], List[float]]:
+    """
+    Run a batch of lookups and measure both batch and per-query execution time.
+
+    Every batch and the per-query pass start from a cold cache.
+
+    Args:
+        algorithm: Single-target search algorithm function
+        batch_algorithm: Batch variant of the same algorithm
+        data: Dataset to search in
+        targets: Items to search for
+        runs: Number of times to run the whole batch
+        show_progress: Whether to display a progress bar
+
+    Returns:
+        Tuple containing (found_count, batch_times, per_query_latencies)
+    """
+    batch_times = []
+    latencies = []
+    found = 0
+
+    # Refresh the progress bar in chunks so it does not dominate the timings
+    chunk = max(len(targets) // 100, 1)
+    overhead = timer_overhead()
+    counter = time.perf_counter
+
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with progress_bar(show_progress) as progress:
+            task = progress.add_task(
+                f"Running {batch_algorithm.__name__}", total=runs + len(targets)
+            )
+
+            for _ in range(runs):
+                cold_start(batch_algorithm)
+                start_time = time.perf_counter()
+                results = batch_algorithm(data, targets)
+                end_time = time.perf_counter()
+
+                batch_times.append(end_time - start_time)
+                found = sum(1 for result in results if result != -1)
+
+                progress.update(task, advance=1, refresh=True)
+
+            # Time every query on its own to get a latency distribution,
+            # subtracting the cost of reading the timer itself
+            cold_start(algorithm)
+            for i, target in enumerate(targets, 1):
+                start_time = counter()
+                algorithm(data, target)
+                end_time = counter()
+
+                latencies.append(max(end_time - start_time - overhead, 0.0))
+
+                if i % chunk == 0 or i == len(targets):
+                    progress.update(task, completed=runs + i, refresh=True)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return found, batch_times, latencies
+
+
+def benchmark_batch(
+    algorithm_name: str,
+    algorithm: Callable,
+    batch_algorithm: Callable,
+    data: List[str],
+    targets: List[str],
+    runs: int = 5,
+    run_all: bool = False,
+    quiet: bool = False,
+) -> Dict:
+    """
+    Benchmark the batch variant of an algorithm and return throughput metrics.
+
+    Args:
+        algorithm_name: Name of the algorithm
+        algorithm: Single-target algorithm function
+        batch_algorithm: Batch variant of the algorithm
+        data: Dataset to search in
+        targets: Items to search for
+        runs: Number of times to run the whole batch
+        quiet: Suppress all console output (used by worker processes)
+
+    Returns:
+        Dictionary with benchmark results
+    """
+    if not quiet:
+        console.print(f"\n[bold blue]Running batch benchmark for {algorithm_name}[/]")
+
+    build_time = prepare_algorithm(batch_algorithm, data)
+
+    found, batch_times, latencies = run_batch_search(
+        algorithm, batch_algorithm, data, targets, runs, not quiet
+    )
+
+    avg_time = statistics.mean(batch_times)
+    median_time = statistics.median(batch_times)
+    queries_per_second = len(targets) / median_time if median_time > 0 else 0.0
+    latency = {f"p{p}": percentile(latencies, p) for p in LATENCY_PERCENTILES}
+    stats = engine_stats(batch_algorithm)
+    stats.update(
+        profiling_stats(f"{algorithm_name} batch", algorithm, data, targets, quiet)
+    )
+    stats.update(probe_stats(algorithm, data, targets))
+
+    if not (run_all or quiet):
+        console.print(f"\n[bold green]Results for {algorithm_name}:[/]")
+        console.print(f"Found {found} of {len(targets)} targets")
+        console.print(f"Average batch time: {format_time(avg_time)}")
+        console.print(f"Median batch time: {format_time(median_time)}")
+        console.print(f"Throughput: {queries_per_second:,.0f} queries/s")
+        for name, value in latency.items():
+            console.print(f"Latency {name}: {format_time(value)}")
+        if build_time is not None:
+            console.print(f"Build time: {format_time(build_time)}")
+        print_engine_stats(stats)
+
+    result = {
+        "algorithm": algorithm_name,
+        "found": found,
+        "queries": len(targets),
+        "avg_time": avg_time,
+        "median_time": median_time,
+        "queries_per_second": queries_per_second,
+        **latency,
+        "samples": [batch_time / len(targets) for batch_time in batch_times],
+    }
+    if build_time is not None:
+        result["build_time"] = build_time
+    result.update(stats)
+
+    return result
+
+
+def benchmark_algorithm(
+    algorithm_name: str,
+    algorithm: Callable,
+    data: List[str],
+    target: str,
+    runs: int = 10,
+    run_all: bool = False,
+    quiet: bool = False,
+    min_time: float = DEFAULT_MIN_TIME,
+) -> Dict:
+    """
+    Benchmark a single algorithm and return performance metrics.
+
+    Args:
+        algorithm_name: Name of the algorithm
+        algorithm: Algorithm function
+        data: Dataset to search in
+        target: Item to search for
+        runs: Number of timed batches
+        quiet: Suppress all console output (used by worker processes)
+        min_time: Minimum duration of one timed batch in seconds
+
+    Returns:
+        Dictionary with benchmark results
+    """
+    if not quiet:
+        console.print(f"\n[bold blue]Running benchmark for {algorithm_name}[/]")
+
+    build_time = prepare_algorithm(algorithm, data)
+
+    found, execution_times = run_single_search(
+        algorithm, data, target, runs, not quiet, min_time
+    )
+
+    # Calculate statistics
+    avg_time = statistics.mean(execution_times)
+    median_time = statistics.median(execution_times)
+    min_time = min(execution_times)
+    max_time = max(execution_times)
+    stats = engine_stats(algorithm)
+    stats.update(
+        profiling_stats(f"{algorithm_name} single", algorithm, data, [target], quiet)
+    )
+    stats.update(probe_stats(algorithm, data, [target]))
+
+    # Print results
+    if not (run_all or quiet):
+        console.print(f"\n[bold green]Results for {algorithm_name}:[/]")
+        console.print(f"Target '{target}' {'found' if found else 'not found'}")
+        console.print(f"Average time: {format_time(avg_time)}")
+        console.print(f"Median time: {format_time(median_time)}")
+        console.print(f"Best time: {format_time(min_time)}")
+        console.print(f"Worst time: {format_time(max_time)}")
+        if build_time is not None:
+            console.print(f"Build time: {format_time(build_time)}")
+        print_engine_stats(stats)
+
+    result = {
+        "algorithm": algorithm_name,
+        "found": found,
+        "avg_time": avg_time,
+        "median_time": median_time,
+        "min_time": min_time,
+        "max_time": max_time,
+        "samples": execution_times,
+    }
+    if build_time is not None:
+        result["build_time"] = build_time
+    result.update(stats)
+
+    return result
+
+
+def run_all_algorithms(
+    data: List[str],
+    target: str,
+    runs: int = 5,
+    backend: str = "python",
+    sorted_data: Optional[List[str]] = None,
+    min_time: float = DEFAULT_MIN_TIME,
+) -> List[Dict]:
+    """
+    Run all search algorithms and compare their performance.
+
+    Args:
+        data: Dataset to search in
+        target: Item to search for
+        runs: Number of timed batches for each algorithm
+        backend: One of BACKENDS
+        sorted_data: Presorted copy of data, sorted here if not given
+        min_time: Minimum duration of one timed batch in seconds
+
+    Returns:
+        List of dictionaries with benchmark results for each algorithm
+    """
+    from dataset.profile import is_sorted
+
+    results = []
+
+    # Make sure data is sorted for algorithms that require sorted input
+    if sorted_data is None:
+        sorted_data = data if is_sorted(data) else sorted(data)
+    names = [name for name in ALGORITHMS if name != "all"]
+
+    for label, _, func, _, current_data in backend_variants(
+        names, data, sorted_data, backend
+    ):
+        try:
+            result = benchmark_algorithm(
+                label, func, current_data, target, runs, min_time=min_time
+            )
+            results.append(result)
+        except Exception as e:
+            console.print(f"[bold red]Error running {label}:[/] {str(e)}")
+
+    return results
+
+
+def run_all_batch(
+    data: List[str],
+    targets: List[str],
+    runs: int = 5,
+    backend: str = "python",
+    sorted_data: Optional[List[str]] = None,
+) -> List[Dict]:
+    """
+    Run the batch variant of every search algorithm and compare throughput.
+
+    Args:
+        data: Dataset to search in
+        targets: Items to search for
+        runs: Number of times to run each batch
+        backend: One of BACKENDS
+        sorted_data: Presorted copy of data, sorted here if not given
+
+    Returns:
+        List of dictionaries with batch benchmark results for each algorithm
+    """
+    from dataset.profile import is_sorted
+
+    results = []
+    if sorted_data is None:
+        sorted_data = data if is_sorted(data) else sorted(data)
+
+    for label, _, func, batch_func, current_data in backend_variants(
+        list(BATCH_ALGORITHMS), data, sorted_data, backend
+    ):
+        try:
+            result = benchmark_batch(
+                label, func, batch_func, current_data, targets, runs, True
+            )
+            results.append(result)
+        except Exception as e:
+            console.print(f"[bold red]Error running {label}:[/] {str(e)}")
+
+    return results
+
+
+def run_sweep(
+    names: List[str],
+    sorted_data: Sequence[str],
+    runs: int = 5,
+    backend: str = "python",
+    min_time: float = DEFAULT_MIN_TIME,
+) -> Tuple[List[int], Dict[str, List[float]], Dict[str, str]]:
+    """
+    Measure every algorithm on sorted subsamples of growing size.
+
+    Every algorithm runs on the same sample and the same seeded targets at
+    each size; engines are prepared outside the timed batches.
+
+    Args:
+        names: Algorithm names from ALGORITHMS
+        sorted_data: Sorted dataset the samples are taken from
+        runs: Number of timed batches per algorithm and size
+        backend: One of BACKENDS
+        min_time: Minimum duration of one timed batch in seconds
+
+    Returns:
+        Tuple containing (sizes, per-query best time per size for each label,
+        complexity claimed by each label's docstring)
+    """
+    from bench.sweep import (
+        claimed_complexity,
+        run_queries,
+        subsample,
+        sweep_sizes,
+        sweep_targets,
+    )
+
+    sizes = sweep_sizes(len(sorted_data))
+    series: Dict[str, List[float]] = {}
+    claims: Dict[str, str] = {}
+
+    with progress_bar() as progress:
+        task = progress.add_task("Sweeping", total=len(sizes) * len(names))
+
+        for size in sizes:
+            sample = subsample(sorted_data, size)
+            targets = sweep_targets(sample)
+
+            for label, _, func, _, dataset in backend_variants(
+                names, sample, sample, backend
+            ):
+                progress.update(task, description=f"{label} at {size:,}", refresh=True)
+                claims[label] = claimed_complexity(func)
+                prepare_algorithm(func, dataset)
+                timing = calibrated_timing(
+                    replay_cold, (func, dataset, targets), runs, min_time
+                )
+                # The fastest batch is the least disturbed by other load
+                best_time = min(timing.per_call_times)
+                series.setdefault(label, []).append(best_time / len(targets))
+
+                if label in names:
+                    progress.update(task, advance=1, refresh=True)
+
+    return sizes, series, claims
+
+
+def benchmark_workload(
+    algorithm_name: str,
+    algorithm: Callable,
+    data: Sequence[str],
+    stream: List[str],
+    profile_name: str,
+    runs: int = 5,
+    min_time: float = DEFAULT_MIN_TIME,
+) -> Dict:
+    """
+    Replay a query stream in order and measure throughput and latency.
+
+    Throughput comes from calibrated batches of the whole stream; the
+    latency distribution and the engine statistics from timing every query
+    of one more pass. Every pass starts from a cold cache.
+
+    Args:
+        algorithm_name: Name of the algorithm
+        algorithm: Algorithm function
+        data: Dataset to search in
+        stream: Query stream, replayed in order
+        profile_name: Name of the workload profile the stream was drawn from
+        runs: Number of timed passes over the stream
+        min_time: Minimum duration of one timed batch in seconds
+
+    Returns:
+        Dictionary with benchmark results
+    """
+    build_time = prepare_algorithm(algorithm, data)
+
+    timing = calibrated_timing(replay_cold, (algorithm, data, stream), runs, min_time)
+    median_time = statistics.median(timing.per_call_times)
+    cold_start(algorithm)
+    latencies, found = query_latencies(algorithm, data, stream)
+    stats = engine_stats(algorithm)
+
+    result = {
+        "algorithm": algorithm_name,
+        "found": found,
+        "queries": len(stream),
+        "median_time": median_time,
+        "queries_per_second": len(stream) / median_time if median_time > 0 else 0.0,
+        **{f"p{p}": percentile(latencies, p) for p in LATENCY_PERCENTILES},
+    }
+    if build_time is not None:
+        result["build_time"] = build_time
+    result.update(stats)
+    result.update(
+        profiling_stats(
+            f"{algorithm_name} workload {profile_name}", algorithm, data, stream
+        )
+    )
+    result.update(probe_stats(algorithm, data, stream))
+
+    return result
+
+
+def run_workloads(
+    names: List[str],
+    data: Sequence[str],
+    sorted_data: Sequence[str],
+    profiles: List["WorkloadProfile"],
+    queries: int,
+    seed: int = 0,
+    runs: int = 5,
+    backend: str = "python",
+    min_time: float = DEFAULT_MIN_TIME,
+) -> Dict[str, List[Dict]]:
+    """
+    Benchmark every algorithm on the same seeded stream for each profile.
+
+    Args:
+        names: Algorithm names from ALGORITHMS
+        data: Dataset in its original order
+        sorted_data: Sorted dataset the streams are drawn from
+        profiles: Workload profiles
+        queries: Number of queries per stream
+        seed: Random seed shared by all streams
+        runs: Number of timed passes over each stream
+        backend: One of BACKENDS
+        min_time: Minimum duration of one timed batch in seconds
+
+    Returns:
+        Benchmark results for each profile name
+    """
+    from bench.workload import generate_workload
+
+    results: Dict[str, List[Dict]] = {}
+
+    with progress_bar() as progress:
+        task = progress.add_task("Workloads", total=len(profiles) * len(names))
+
+        for profile in profiles:
+            stream = generate_workload(sorted_data, profile, queries, seed)
+            profile_results = results.setdefault(profile.name, [])
+
+            for label, _, func, _, dataset in backend_variants(
+                names, data, sorted_data, backend
+            ):
+                progress.update(
+                    task, description=f"{label} on {profile.name}", refresh=True
+                )
+                try:
+                    profile_results.append(
+                        benchmark_workload(
+                            label,
+                            func,
+                            dataset,
+                            stream,
+                            profile.name,
+                            runs,
+                            min_time,
+                        )
+                    )
+                except Exception as e:
+                    console.print(f"[bold red]Error running {label}:[/] {str(e)}")
+
+                if label in names:
+                    progress.update(task, advance=1, refresh=True)
+
+            attach_break_even(profile_results, sorted_data, stream, min_time)
+            attach_layout_speedup(profile_results)
+
+    return results
+
+
+def run_ingest_benchmark(
+    names: List[str],
+    data: Sequence[str],
+    operations: int,
+    insert_ratio: float,
+    buffer_size: int,
+    seed: int = 0,
+) -> List[Dict]:
+    """
+    Replay one interleaved insert/lookup stream per algorithm and index.
+
+    Every sorted-input search function runs on an LSMSortedIndex and on a
+    single sorted list maintained with insort. Prepared engines are skipped:
+    they would rebuild on every component and never see in-place inserts.
+
+    Args:
+        names: Algorithm names from ALGORITHMS
+        data: Dataset in its original order
+        operations: Number of inserts plus lookups
+        insert_ratio: Fraction of operations that are inserts
+        buffer_size: Write buffer size of the LSM index
+        seed: Random seed of the stream
+
+    Returns:
+        List of ingest results
+    """
+    from bench.ingest import SortedListIndex, ingest_operations, run_ingest
+    from dataset.lsm import LSMSortedIndex
+
+    sorted_names = [
+        name
+        for name in names
+        if needs_sorted([name])
+        and not hasattr(
+            getattr(ALGORITHMS[name], "__self__", ALGORITHMS[name]), "prepare"
+        )
+    ]
+    skipped = [name for name in names if name not in sorted_names]
+    if skipped:
+        console.print(
+            "[yellow]Ingest mode runs plain sorted-input algorithms only; "
+            f"skipping {', '.join(skipped)}.[/]"
+        )
+
+    initial, stream = ingest_operations(data, operations, insert_ratio, seed)
+    indexes = [
+        ("lsm", lambda: LSMSortedIndex(initial, buffer_size)),
+        ("sorted list", lambda: SortedListIndex(initial)),
+    ]
+    results = []
+
+    with progress_bar() as progress:
+        task = progress.add_task("Ingest", total=len(sorted_names) * len(indexes))
+
+        for name in sorted_names:
+            for index_name, build in indexes:
+                label = f"{name} ({index_name})"
+                progress.update(task, description=label, refresh=True)
+
+                result = run_ingest(build(), ALGORITHMS[name], stream)
+                latencies = result.pop("latencies")
+                result["algorithm"] = label
+                for p in LATENCY_PERCENTILES:
+                    result[f"p{p}"] = percentile(latencies, p) if latencies else 0.0
+                results.append(result)
+
+                progress.update(task, advance=1, refresh=True)
+
+    return results
+
+
+def run_range_benchmark(
+    sorted_data: Sequence[str],
+    queries: int,
+    seed: int = 0,
+    runs: int = 5,
+    min_time: float = DEFAULT_MIN_TIME,
+) -> List[Dict]:
+    """
+    Benchmark range queries against linear filtering on seeded queries.
+
+    Args:
+        sorted_data: Sorted dataset
+        queries: Number of queries per range operation
+        seed: Random seed of the queries
+        runs: Number of timed batches per method
+        min_time: Minimum duration of one timed batch in seconds
+
+    Returns:
+        List of range query results
+    """
+    from bench.ranges import benchmark_ranges, range_queries
+
+    stream = range_queries(sorted_data, queries, seed)
+
+    with progress_bar() as progress:
+        task = progress.add_task("Range queries", total=len(stream) * 3)
+        results = benchmark_ranges(
+            sorted_data,
+            stream,
+            runs,
+            min_time,
+            lambda label: progress.update(
+                task, description=label, advance=1, refresh=True
+            ),
+        )
+
+    return results
+
+
+def run_substring_benchmark(
+    data: Sequence[str],
+    patterns: List[str],
+    runs: int = 5,
+    min_time: float = DEFAULT_MIN_TIME,
+) -> List[Dict]:
+    """
+    Benchmark substring queries on a suffix array against a linear scan.
+
+    Args:
+        data: Dataset in its original order
+        patterns: Substrings to search for
+        runs: Number of timed batches per method
+        min_time: Minimum duration of one timed batch in seconds
+
+    Returns:
+        List of substring results
+    """
+    from bench.substring import benchmark_substring
+
+    with progress_bar() as progress:
+        task = progress.add_task("Suffix array", total=2)
+        results = benchmark_substring(
+            data,
+            patterns,
+            runs,
+            min_time,
+            lambda label: progress.update(
+                task, description=label, advance=1, refresh=True
+            ),
+        )
+
+    for result in results:
+        latencies = result.pop("latencies")
+        for p in LATENCY_PERCENTILES:
+            result[f"p{p}"] = percentile(latencies, p) if latencies else 0.0
+
+    return results
+
+
+# Extra columns shown when present in results: (key, header, formatter)
+OPTIONAL_COLUMNS = [
+    ("accesses", "Accesses/Query", lambda value: f"{value:,.1f}"),
+    ("rereads", "Re-reads/Query", lambda value: f"{value:,.1f}"),
+    ("comparisons", "Comparisons/Query", lambda value: f"{value:,.1f}"),
+    ("probe_distance", "Probe Distance", lambda value: f"{value:,.1f}"),
+    ("peak_memory", "Peak Alloc", format_bytes),
+    ("build_time", "Build Time", format_time),
+    ("memory", "Memory", format_bytes),
+    ("probes", "Probes/Query", lambda value: f"{value:.1f}"),
+    ("index_memory", "Index Memory", format_bytes),
+    ("model_size", "Model Size", format_bytes),
+    ("max_error", "Max Error", lambda value: f"±{value:,}"),
+    ("break_even", "Break-even vs Binary", format_break_even),
+    ("speedup", f"Speedup vs {LAYOUT_BASELINE}", lambda value: f"{value:.2f}x"),
+    ("hit_rate", "Cache Hit Rate", lambda value: f"{value:.1%}"),
+    ("evictions", "Evictions", lambda value: f"{value:,}"),
+]
+
+
+def optional_columns(results: List[Dict]) -> List[Tuple[str, str, Callable]]:
+    """
+    Select the optional columns that at least one result provides.
+
+    Args:
+        results: Benchmark results
+
+    Returns:
+        List of (key, header, formatter) tuples
+    """
+    return [
+        column
+        for column in OPTIONAL_COLUMNS
+        if any(column[0] in result for result in results)
+    ]
+
+
+# Per-process state of parallel benchmark workers
+_WORKER_STATE: Dict = {}
+
+
+def init_worker(
+    data_handle: "SharedRecordsHandle",
+    sorted_handle: Optional["SharedRecordsHandle"],
+    targets_handle: Optional["SharedRecordsHandle"],
+    counter,
+    cpus: List[int],
+    settings: Dict,
+) -> None:
+    """
+    Apply the run's settings and attach the shared datasets once per worker.
+
+    The worker is also pinned to a CPU if cpus is not empty.
+
+    Args:
+        data_handle: Shared dataset in its original order
+        sorted_handle: Shared sorted dataset, or None if it equals the data
+        targets_handle: Shared batch targets, or None for single-target runs
+        counter: Shared counter used to hand out CPUs to workers
+        cpus: CPUs to pin workers to, empty to disable pinning
+        settings: Settings of the parent process, from worker_settings
+    """
+    from dataset.shared import attach_records
+
+    apply_worker_settings(settings)
+
+    if cpus:
+        with counter.get_lock():
+            index = counter.value
+            counter.value += 1
+        os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+
+    data = attach_records(data_handle)
+    _WORKER_STATE["data"] = data
+    _WORKER_STATE["sorted_data"] = (
+        data if sorted_handle is None else attach_records(sorted_handle)
+    )
+    _WORKER_STATE["targets"] = (
+        None if targets_handle is None else attach_records(targets_handle)
+    )
+
+
+def benchmark_worker(
+    name: str,
+    target: Optional[str],
+    runs: int,
+    backend: str,
+    storage: str,
+    min_time: float = DEFAULT_MIN_TIME,
+) -> List[Dict]:
+    """
+    Benchmark one algorithm inside a worker process.
+
+    Args:
+        name: Algorithm name from ALGORITHMS
+        target: Item to search for (ignored in batch mode)
+        runs: Number of runs
+        backend: One of BACKENDS
+        storage: One of STORAGES
+        min_time: Minimum duration of one timed batch in seconds
+
+    Returns:
+        List of benchmark results, one per backend and storage variant
+    """
+    targets = _WORKER_STATE["targets"]
+    variants = storage_variants(
+        _WORKER_STATE["data"], _WORKER_STATE["sorted_data"], storage
+    )
+    results = []
+
+    for storage_name, current, current_sorted in variants:
+        storage_results = []
+        for label, _, func, batch_func, dataset in backend_variants(
+            [name], current, current_sorted, backend
+        ):
+            if targets is not None:
+                result = benchmark_batch(
+                    label, func, batch_func, dataset, targets, runs, quiet=True
+                )
+            else:
+                result = benchmark_algorithm(
+                    label, func, dataset, target, runs, quiet=True, min_time=min_time
+                )
+            storage_results.append(result)
+
+        results.extend(
+            tag_results(
+                storage_results,
+                storage_name,
+                storage_footprint(current, current_sorted),
+                len(variants) > 1,
+            )
+        )
+
+    return results
+
+
+def run_parallel(
+    names: List[str],
+    data: Sequence[str],
+    sorted_data: Sequence[str],
+    target: Optional[str],
+    targets: Optional[List[str]],
+    runs: int = 5,
+    backend: str = "python",
+    storage: str = "list",
+    jobs: int = 2,
+    pin_cpus: bool = False,
+    min_time: float = DEFAULT_MIN_TIME,
+) -> List[Dict]:
+    """
+    Benchmark algorithms in a pool of worker processes.
+
+    The datasets are published once via shared memory, and each worker
+    attaches to them at startup instead of receiving a pickled copy.
+
+    Args:
+        names: Algorithm names from ALGORITHMS
+        data: Dataset in its original order
+        sorted_data: Sorted dataset (or data itself when sorting is not needed)
+        target: Item to search for, or None in batch mode
+        targets: Batch targets, or None for single-target runs
+        runs: Number of runs per algorithm
+        backend: One of BACKENDS
+        storage: One of STORAGES
+        jobs: Number of worker processes
+        pin_cpus: Pin each worker to its own CPU to reduce noise
+        min_time: Minimum duration of one timed batch in seconds
+
+    Returns:
+        List of benchmark results in the order of names
+    """
+    # Only parallel runs pay for importing the process machinery
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    from dataset.shared import SharedRecords
+
+    cpus = []
+    if pin_cpus:
+        if hasattr(os, "sched_setaffinity"):
+            cpus = sorted(os.sched_getaffinity(0))
+        else:
+            console.print("[yellow]CPU pinning is not supported on this platform.[/]")
+
+    shared = [SharedRecords(data)]
+    sorted_handle = None
+    if sorted_data is not data:
+        shared.append(SharedRecords(sorted_data))
+        sorted_handle = shared[-1].handle
+    targets_handle = None
+    if targets is not None:
+        shared.append(SharedRecords(targets))
+        targets_handle = shared[-1].handle
+
+    results_by_name: Dict[str, List[Dict]] = {}
+    counter = multiprocessing.Value("i", 0)
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=init_worker,
+            initargs=(
+                shared[0].handle,
+                sorted_handle,
+                targets_handle,
+                counter,
+                cpus,
+                worker_settings(),
+            ),
+        ) as executor, progress_bar(auto_refresh=True) as progress:
+            task = progress.add_task(f"Running on {jobs} workers", total=len(names))
+            futures = {
+                executor.submit(
+                    benchmark_worker, name, target, runs, backend, storage, min_time
+                ): name
+                for name in names
+            }
+
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results_by_name[name] = future.result()
+                except Exception as e:
+                    console.print(f"[bold red]Error running {name}:[/] {str(e)}")
+                progress.update(task, advance=1)
+    finally:
+        for segment in shared:
+            segment.close()
+
+    return [result for name in names for result in results_by_name.get(name, [])]
+
+
+def display_comparison_table(results: List[Dict]) -> None:
+    """
+    Display a comparison table of all algorithm results.
+
+    Args:
+        results: List of benchmark results
+    """
+    from rich.table import Table
+
+    # Sort results by average execution time
+    sorted_results = sorted(results, key=lambda x: x["avg_time"])
+
+    table = Table(title="Search Algorithm Performance Comparison")
+
+    table.add_column("Rank", style="cyan")
+    table.add_column("Algorithm", style="green")
+    table.add_column("Result", style="yellow")
+    table.add_column("Avg Time", style="magenta")
+    table.add_column("Median Time", style="blue")
+    table.add_column("Best Time", style="green")
+    table.add_column("Worst Time", style="red")
+
+    extra_columns = optional_columns(results)
+    for _, header, _ in extra_columns:
+        table.add_column(header, style="white")
+
+    for i, result in enumerate(sorted_results, 1):
+        table.add_row(
+            str(i),
+            result["algorithm"],
+            "Found" if result["found"] else "Not Found",
+            format_time(result["avg_time"]),
+            format_time(result["median_time"]),
+            format_time(result["min_time"]),
+            format_time(result["max_time"]),
+            *(
+                formatter(result[key]) if key in result else "-"
+                for key, _, formatter in extra_columns
+            ),
+        )
+
+    console.print(table)
+
+
+def display_batch_table(results: List[Dict]) -> None:
+    """
+    Display a comparison table of batch benchmark results.
+
+    Args:
+        results: List of batch benchmark results
+    """
+    from rich.table import Table
+
+    sorted_results = sorted(results, key=lambda x: x["median_time"])
+
+    table = Table(title="Batch Search Throughput Comparison")
+
+    table.add_column("Rank", style="cyan")
+    table.add_column("Algorithm", style="green")
+    table.add_column("Found", style="yellow")
+    table.add_column("Queries/s", style="magenta")
+    table.add_column("Batch Time", style="blue")
+    for p in LATENCY_PERCENTILES:
+        table.add_column(f"p{p} Latency", style="red")
+
+    extra_columns = optional_columns(results)
+    for _, header, _ in extra_columns:
+        table.add_column(header, style="white")
+
+    for i, result in enumerate(sorted_results, 1):
+        table.add_row(
+            str(i),
+            result["algorithm"],
+            f"{result['found']}/{result['queries']}",
+            f"{result['queries_per_second']:,.0f}",
+            format_time(result["median_time"]),
+            *(format_time(result[f"p{p}"]) for p in LATENCY_PERCENTILES),
+            *(
+                formatter(result[key]) if key in result else "-"
+                for key, _, formatter in extra_columns
+            ),
+        )
+
+    console.print(table)
+
+
+def display_workload_tables(
+    profiles: List["WorkloadProfile"], results: Dict[str, List[Dict]]
+) -> None:
+    """
+    Display one throughput and latency table per workload profile.
+
+    Args:
+        profiles: Workload profiles, in the order they were run
+        results: Benchmark results for each profile name
+    """
+    from rich.table import Table
+
+    for profile in profiles:
+        profile_results = sorted(
+            results[profile.name], key=lambda x: -x["queries_per_second"]
+        )
+
+        table = Table(title=f"Workload {profile.name} ({profile.describe()})")
+
+        table.add_column("Rank", style="cyan")
+        table.add_column("Algorithm", style="green")
+        table.add_column("Found", style="yellow")
+        table.add_column("Queries/s", style="magenta")
+        for p in LATENCY_PERCENTILES:
+            table.add_column(f"p{p} Latency", style="red")
+
+        extra_columns = optional_columns(profile_results)
+        for _, header, _ in extra_columns:
+            table.add_column(header, style="white")
+
+        for i, result in enumerate(profile_results, 1):
+            table.add_row(
+                str(i),
+                result["algorithm"],
+                f"{result['found']}/{result['queries']}",
+                f"{result['queries_per_second']:,.0f}",
+                *(format_time(result[f"p{p}"]) for p in LATENCY_PERCENTILES),
+                *(
+                    formatter(result[key]) if key in result else "-"
+                    for key, _, formatter in extra_columns
+                ),
+            )
+
+        console.print(table)
+
+
+def display_ingest_table(results: List[Dict], buffer_size: int) -> None:
+    """
+    Display insert throughput, merge cost and lookup latency per index.
+
+    Args:
+        results: Results from run_ingest_benchmark
+        buffer_size: Write buffer size of the LSM index
+    """
+    from rich.table import Table
+
+    if not results:
+        return
+
+    table = Table(
+        title=f"Ingest: {results[0]['inserts']:,} inserts, "
+        f"{results[0]['lookups']:,} lookups (LSM buffer {buffer_size:,})"
+    )
+
+    table.add_column("Algorithm", style="green")
+    table.add_column("Inserts/s", style="magenta")
+    table.add_column("Merges", style="yellow")
+    table.add_column("Merge Time", style="yellow")
+    table.add_column("Write Amp.", style="yellow")
+    table.add_column("Runs", style="white")
+    table.add_column("Found", style="white")
+    for p in LATENCY_PERCENTILES:
+        table.add_column(f"p{p} Lookup", style="red")
+
+    for result in results:
+        table.add_row(
+            result["algorithm"],
+            f"{result['inserts_per_second']:,.0f}",
+            f"{result.get('merges', 0):,}",
+            format_time(result.get("merge_time", 0.0)),
+            f"{result.get('write_amplification', 0.0):.2f}",
+            str(result["runs"]),
+            f"{result['found']}/{result['lookups']}",
+            *(format_time(result[f"p{p}"]) for p in LATENCY_PERCENTILES),
+        )
+
+    console.print(table)
+
+
+def display_ranges_table(results: List[Dict]) -> None:
+    """
+    Display per-query time and speedup over linear filtering per operation.
+
+    Args:
+        results: Results from run_range_benchmark
+    """
+    from rich.table import Table
+
+    from bench.ranges import LINEAR_QUERIES
+
+    if not results:
+        return
+
+    table = Table(
+        title=f"Range Queries: {max(result['queries'] for result in results):,} "
+        f"queries per operation (linear filter timed on the first "
+        f"{LINEAR_QUERIES})"
+    )
+
+    table.add_column("Operation", style="cyan")
+    table.add_column("Method", style="green")
+    table.add_column("Time/Query", style="magenta")
+    table.add_column("Speedup", style="yellow")
+    table.add_column("Matches/Query", style="white")
+
+    for result in results:
+        table.add_row(
+            result["operation"],
+            result["method"],
+            format_time(result["median_time"]),
+            f"{result['speedup']:,.1f}x",
+            f"{result['matches']:,.1f}",
+        )
+
+    console.print(table)
+
+
+def display_substring_table(results: List[Dict]) -> None:
+    """
+    Display substring query latency, build cost and index size per method.
+
+    Args:
+        results: Results from run_substring_benchmark
+    """
+    from rich.table import Table
+
+    if not results:
+        return
+
+    table = Table(title=f"Substring Search: {results[0]['queries']:,} patterns")
+
+    table.add_column("Algorithm", style="green")
+    table.add_column("Time/Query", style="magenta")
+    table.add_column("Speedup", style="yellow")
+    for p in LATENCY_PERCENTILES:
+        table.add_column(f"p{p} Latency", style="red")
+    table.add_column("Found", style="white")
+    table.add_column("Matches/Query", style="white")
+    table.add_column("Build Time", style="cyan")
+    table.add_column("Index Memory", style="cyan")
+    table.add_column("Pays Off After", style="cyan")
+
+    for result in results:
+        pays_off = result.get("pays_off_after")
+        table.add_row(
+            result["algorithm"],
+            format_time(result["median_time"]),
+            f"{result['speedup']:,.1f}x",
+            *(format_time(result[f"p{p}"]) for p in LATENCY_PERCENTILES),
+            f"{result['found']}/{result['queries']}",
+            f"{result['matches']:,.1f}",
+            format_time(result["build_time"]) if "build_time" in result else "-",
+            format_bytes(result["index_memory"]) if "index_memory" in result else "-",
+            (
+                "-"
+                if pays_off is None
+                else (
+                    "never"
+                    if math.isinf(pays_off)
+                    else f"{math.ceil(pays_off):,} queries"
+                )
+            ),
+        )
 
+    console.print(table)
 
-def format_time(seconds: float) -> str:
+
+def display_plan(plan: "Plan") -> None:
     """
-    Format execution time into appropriate units.
+    Display the dataset profile and the planner's calibration results.
 
     Args:
-        seconds: Time in seconds
-
-    Returns:
-        Formatted time string with appropriate unit
+        plan: Plan chosen for the dataset
     """
-    if seconds < 1e-6:  # Less than 1 microsecond
-        return f"{seconds * 1e9:.2f} ns"
-    elif seconds < 1e-3:  # Less than 1 millisecond
-        return f"{seconds * 1e6:.2f} μs"
-    elif seconds < 1:  # Less than 1 second
-        return f"{seconds * 1e3:.2f} ms"
-    elif seconds < 60:  # Less than 1 minute
-        return f"{seconds:.2f} s"
-    else:  # Minutes or more
-        return f"{seconds / 60:.2f} min"
+    from rich.table import Table
 
+    profile = plan.profile
+    console.print(
+        f"\n[bold]Dataset profile:[/] {profile.size:,} records, "
+        f"{'presorted' if profile.presorted else 'unsorted'}, "
+        f"key uniformity {profile.uniformity:.2f}, "
+        f"{profile.duplicate_rate:.1%} duplicates, "
+        f"{profile.mean_width:.1f} chars per record"
+    )
 
-def load_data(filepath: Union[str, Path]) -> List[str]:
-    """
-    Load data from a text file.
+    table = Table(
+        title="Planner Calibration" + (" (cached decision)" if plan.cached else "")
+    )
 
-    Args:
-        filepath: Path to the data file
+    table.add_column("Rank", style="cyan")
+    table.add_column("Algorithm", style="green")
+    table.add_column("Time/Query", style="magenta")
 
-    Returns:
-        List of strings from the file
+    for i, name in enumerate(sorted(plan.timings, key=plan.timings.get), 1):
+        table.add_row(str(i), name, format_time(plan.timings[name]))
 
-    Raises:
-        FileNotFoundError: If the file doesn't exist
-        IOError: If there's an issue reading the file
-    """
-    try:
-        with open(filepath, "r", encoding="utf-8") as file:
-            # Read lines and strip whitespace
-            data = [line.strip() for line in file if line.strip()]
-        return data
-    except FileNotFoundError:
-        console.print(f"[bold red]Error:[/] File {filepath} not found.")
-        raise
-    except IOError as e:
-        console.print(f"[bold red]Error:[/] Could not read file {filepath}: {e}")
-        raise
+    console.print(table)
+    console.print(f"[bold green]Planner picked {plan.algorithm}.[/]")
 
 
-def run_single_search(
-    algorithm: Callable, data: List[str], target: str, runs: int = 1
-) -> Tuple[bool, List[float]]:
+def display_sweep_tables(
+    sizes: List[int], series: Dict[str, List[float]], claims: Dict[str, str]
+) -> None:
     """
-    Run a single search algorithm and measure execution time.
+    Display per-size timings with fitted complexity, and the crossover sizes.
 
     Args:
-        algorithm: Search algorithm function
-        data: Dataset to search in
-        target: Item to search for
-        runs: Number of times to run the algorithm for averaging
-
-    Returns:
-        Tuple containing (found_status, execution_times)
+        sizes: Dataset sizes
+        series: Per-query time per size for each algorithm
+        claims: Complexity claimed by each algorithm's docstring
     """
-    execution_times = []
-    found = False
+    from rich.table import Table
 
-    with Progress(
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TimeElapsedColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task(f"Running {algorithm.__name__}", total=runs)
+    from bench.sweep import find_crossovers, fit_complexity
+
+    table = Table(title="Scaling Sweep (time per query)")
 
-        for _ in range(runs):
-            start_time = time.perf_counter()
-            result = algorithm(data, target)
-            end_time = time.perf_counter()
+    table.add_column("Algorithm", style="green")
+    for size in sizes:
+        table.add_column(f"{size:,}", style="magenta")
+    table.add_column("Claimed", style="blue")
+    table.add_column("Fit", style="cyan")
+    table.add_column("Fit Error", style="yellow")
 
-            execution_time = end_time - start_time
-            execution_times.append(execution_time)
+    # Order by time on the full dataset
+    for label in sorted(series, key=lambda label: series[label][-1]):
+        fit = fit_complexity(sizes, series[label])
+        table.add_row(
+            label,
+            *(format_time(value) for value in series[label]),
+            claims[label],
+            fit.model,
+            f"{fit.error:.1%}",
+        )
 
-            if result != -1:
-                found = True
+    console.print(table)
 
-            progress.update(task, advance=1)
+    crossovers = find_crossovers(sizes, series)
+    if not crossovers:
+        console.print("[yellow]No crossovers between the measured sizes.[/]")
+        return
 
-    return found, execution_times
+    table = Table(title="Crossover Points")
 
+    table.add_column("Size", style="cyan")
+    table.add_column("Faster From Here", style="green")
+    table.add_column("Overtakes", style="red")
 
-def benchmark_algorithm(
-    algorithm_name: str,
-    algorithm: Callable,
-    data: List[str],
-    target: str,
-    runs: int = 10,
-    run_all: bool = False,
+    for crossover in crossovers:
+        table.add_row(f"~{crossover.size:,.0f}", crossover.faster, crossover.slower)
+
+    console.print(table)
+
+
+def run_settings(
+    args: argparse.Namespace, fingerprint: str, records: int, queries: int
 ) -> Dict:
     """
-    Benchmark a single algorithm and return performance metrics.
+    Collect the settings a result record is stored with.
 
     Args:
-        algorithm_name: Name of the algorithm
-        algorithm: Algorithm function
-        data: Dataset to search in
-        target: Item to search for
-        runs: Number of times to run the algorithm
+        args: Parsed command-line arguments
+        fingerprint: Content hash of the data file
+        records: Number of records loaded
+        queries: Number of targets per run
 
     Returns:
-        Dictionary with benchmark results
+        Dictionary of dataset and run settings
     """
-    console.print(f"\n[bold blue]Running benchmark for {algorithm_name}[/]")
-
-    found, execution_times = run_single_search(algorithm, data, target, runs)
-
-    # Calculate statistics
-    avg_time = statistics.mean(execution_times)
-    median_time = statistics.median(execution_times)
-    min_time = min(execution_times)
-    max_time = max(execution_times)
-
-    # Print results
-    if not run_all:
-        console.print(f"\n[bold green]Results for {algorithm_name}:[/]")
-        console.print(f"Target '{target}' {'found' if found else 'not found'}")
-        console.print(f"Average time: {format_time(avg_time)}")
-        console.print(f"Median time: {format_time(median_time)}")
-        console.print(f"Best time: {format_time(min_time)}")
-        console.print(f"Worst time: {format_time(max_time)}")
-
     return {
-        "algorithm": algorithm_name,
-        "found": found,
-        "avg_time": avg_time,
-        "median_time": median_time,
-        "min_time": min_time,
-        "max_time": max_time,
+        "dataset": args.file,
+        "dataset_fingerprint": fingerprint,
+        "records": records,
+        "selection": args.algorithm,
+        "backend": args.backend,
+        "storage": args.storage,
+        "loader": args.loader,
+        "runs": args.runs,
+        "min_batch_time": args.min_time,
+        "queries": queries,
+        "jobs": args.jobs,
     }
 
 
-def run_all_algorithms(data: List[str], target: str, runs: int = 5) -> List[Dict]:
+def baseline_mismatches(baseline: Dict, environment: Dict, settings: Dict) -> List[str]:
     """
-    Run all search algorithms and compare their performance.
+    List the context fields in which a baseline differs from this run.
 
     Args:
-        data: Dataset to search in
-        target: Item to search for
-        runs: Number of times to run each algorithm
+        baseline: Baseline record
+        environment: Environment of this run
+        settings: Settings of this run
 
     Returns:
-        List of dictionaries with benchmark results for each algorithm
+        Descriptions of the differing fields, e.g. "python 3.11.7 -> 3.12.1"
     """
-    results = []
-
-    # Make sure data is sorted for algorithms that require sorted input
-    sorted_data = sorted(data)
-
-    # Define which algorithms need sorted data
-    need_sorted = [
-        "binary",
-        "interpolation",
-        "exponential",
-        "ternary",
-        "meta_binary",
-        "ubiquitous_binary",
-        "fibonacci",
-        "jump",
+    current = {"environment": environment, "settings": settings}
+    return [
+        f"{field} {baseline.get(section, {}).get(field)} -> {current[section][field]}"
+        for section, field in BASELINE_CONTEXT
+        if baseline.get(section, {}).get(field) != current[section].get(field)
     ]
 
-    for name, func in ALGORITHMS.items():
-        if name == "all":
-            continue
-
-        # Use sorted data for algorithms that need it
-        current_data = sorted_data if name in need_sorted else data
-
-        if func:
-            try:
-                result = benchmark_algorithm(name, func, current_data, target, runs)
-                results.append(result)
-            except Exception as e:
-                console.print(f"[bold red]Error running {name}:[/] {str(e)}")
-
-    return results
-
 
-def display_comparison_table(results: List[Dict]) -> None:
+def display_regression_table(comparisons: List["Comparison"], threshold: float) -> None:
     """
-    Display a comparison table of all algorithm results.
+    Display the per-algorithm comparison with the baseline.
 
     Args:
-        results: List of benchmark results
+        comparisons: Results of compare_results
+        threshold: Relative change of the median that counts
     """
-    # Sort results by average execution time
-    sorted_results = sorted(results, key=lambda x: x["avg_time"])
+    from rich.table import Table
 
-    table = Table(title="Search Algorithm Performance Comparison")
+    from bench.regression import IMPROVEMENT, REGRESSION
+
+    table = Table(title=f"Baseline Comparison (threshold {threshold:.1%})")
 
-    table.add_column("Rank", style="cyan")
     table.add_column("Algorithm", style="green")
-    table.add_column("Result", style="yellow")
-    table.add_column("Avg Time", style="magenta")
-    table.add_column("Median Time", style="blue")
-    table.add_column("Best Time", style="green")
-    table.add_column("Worst Time", style="red")
+    table.add_column("Baseline Median", style="magenta")
+    table.add_column("Current Median", style="magenta")
+    table.add_column("Change", style="yellow")
+    table.add_column("p-value", style="cyan")
+    table.add_column("Verdict")
 
-    for i, result in enumerate(sorted_results, 1):
+    styles = {REGRESSION: "bold red", IMPROVEMENT: "bold green"}
+    for comparison in comparisons:
+        measured = comparison.change is not None
         table.add_row(
-            str(i),
-            result["algorithm"],
-            "Found" if result["found"] else "Not Found",
-            format_time(result["avg_time"]),
-            format_time(result["median_time"]),
-            format_time(result["min_time"]),
-            format_time(result["max_time"]),
+            comparison.algorithm,
+            format_time(comparison.baseline_median) if measured else "-",
+            format_time(comparison.current_median) if measured else "-",
+            f"{comparison.change:+.1%}" if measured else "-",
+            f"{comparison.p_value:.3g}" if measured else "-",
+            f"[{styles.get(comparison.verdict, 'white')}]{comparison.verdict}[/]",
         )
 
     console.print(table)
@@ -270,6 +2431,17 @@ def main() -> None:
     """
     Main function to parse arguments and run the benchmark.
     """
+    # Defaults shown by --help; the rest of each module is imported by the
+    # options that use it
+    from bench.history import DEFAULT_HISTORY_FILE, EXPORT_FORMATS
+    from bench.ingest import DEFAULT_INSERT_RATIO
+    from bench.regression import DEFAULT_ALPHA, DEFAULT_THRESHOLD
+    from bench.workload import PRESETS as WORKLOAD_PRESETS
+    from dataset.lsm import DEFAULT_BUFFER_SIZE
+    from search.cache import DEFAULT_CAPACITY
+    from search.cache import POLICIES as CACHE_POLICIES
+    from search.layout import DEFAULT_NODE_WIDTH
+
     parser = argparse.ArgumentParser(
         description="Benchmark search algorithms on text data"
     )
@@ -286,11 +2458,56 @@ def main() -> None:
         "--algorithm",
         type=str,
         default="all",
-        choices=ALGORITHMS.keys(),
-        help="Search algorithm to use (default: all)",
+        metavar="NAME",
+        help="Search algorithm to use (built-in or from an installed plugin), "
+        "all, or auto to let the planner pick the fastest one for the data "
+        "(default: all)",
+    )
+    target_group = parser.add_mutually_exclusive_group(required=True)
+    target_group.add_argument(
+        "-t", "--target", type=str, help="Target string to search for"
+    )
+    target_group.add_argument(
+        "--targets-file",
+        type=str,
+        help="Path to a file with one target per line (batch mode)",
+    )
+    target_group.add_argument(
+        "--sweep",
+        action="store_true",
+        help="Time every algorithm on sorted subsamples from 1000 records up to "
+        "the full file and fit complexity curves",
+    )
+    target_group.add_argument(
+        "-w",
+        "--workload",
+        nargs="+",
+        metavar="PROFILE",
+        help="Benchmark on generated query streams: presets "
+        f"({', '.join(WORKLOAD_PRESETS)}) or custom specs such as "
+        "hit=0.8,position=front,zipf=1.2,out=0.5",
+    )
+    target_group.add_argument(
+        "--ingest",
+        action="store_true",
+        help="Interleave inserts with lookups on an LSM-style updatable index "
+        "and on one sorted list, reporting insert throughput, merge cost and "
+        "lookup latency",
+    )
+    target_group.add_argument(
+        "--ranges",
+        action="store_true",
+        help="Benchmark duplicate counts, equal ranges, prefix ranges and value "
+        "ranges by bisection against linear filtering",
     )
     parser.add_argument(
-        "-t", "--target", type=str, required=True, help="Target string to search for"
+        "--mode",
+        type=str,
+        default="exact",
+        choices=MODES,
+        help="Find records equal to the targets with the search algorithms, or "
+        "records containing them with a suffix array against a linear scan "
+        "(default: exact)",
     )
     parser.add_argument(
         "-r",
@@ -299,45 +2516,524 @@ def main() -> None:
         default=5,
         help="Number of runs for each algorithm (default: 5)",
     )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=DEFAULT_MIN_TIME,
+        help="Minimum duration of one timed batch in seconds "
+        f"(default: {DEFAULT_MIN_TIME})",
+    )
+    parser.add_argument(
+        "-b",
+        "--backend",
+        type=str,
+        default="python",
+        choices=BACKENDS,
+        help="Search backend: pure Python, NumPy or both (default: python)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Directory for dataset snapshots (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "-l",
+        "--loader",
+        type=str,
+        default="text",
+        choices=LOADERS,
+        help="Dataset loader: list of str or lazy memory-mapped view (default: text)",
+    )
+    parser.add_argument(
+        "-s",
+        "--storage",
+        type=str,
+        default="list",
+        choices=STORAGES,
+        help="In-memory layout: records as loaded, CompactStringArray or both "
+        "(default: list)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Benchmark algorithms in N worker processes (default: 1)",
+    )
+    parser.add_argument(
+        "--pin-cpus",
+        action="store_true",
+        help="Pin each worker process to its own CPU (with --jobs)",
+    )
+    parser.add_argument(
+        "--parallel-workers",
+        type=str,
+        default=None,
+        help="Comma-separated worker counts for parallel_linear, e.g. 1,2,4 "
+        "(default: CPU count)",
+    )
+    parser.add_argument(
+        "--node-width",
+        type=int,
+        default=DEFAULT_NODE_WIDTH,
+        help=f"Keys per node of the btree engine (default: {DEFAULT_NODE_WIDTH})",
+    )
+    parser.add_argument(
+        "--instrument",
+        action="store_true",
+        help="After the timed runs, count element accesses, comparisons and "
+        "the distance between consecutive accesses per query",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=DEFAULT_PROFILE_DIR,
+        metavar="DIR",
+        help="After the timed runs, profile each algorithm with cProfile and "
+        "write a pstats dump and collapsed stacks per algorithm to DIR "
+        f"(default: {DEFAULT_PROFILE_DIR})",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="After the timed runs, trace each algorithm with tracemalloc and "
+        "report the peak allocation of a call",
+    )
+    parser.add_argument(
+        "--result-cache",
+        nargs="+",
+        choices=CACHE_POLICIES,
+        metavar="POLICY",
+        help="Also measure every algorithm behind a result cache with these "
+        f"eviction policies ({', '.join(CACHE_POLICIES)})",
+    )
+    parser.add_argument(
+        "--result-cache-size",
+        type=int,
+        default=DEFAULT_CAPACITY,
+        help=f"Results held by each --result-cache (default: {DEFAULT_CAPACITY})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always parse and sort the data file instead of using snapshots",
+    )
+    parser.add_argument(
+        "--queries",
+        type=int,
+        default=1000,
+        help="Number of queries per generated workload or --ranges operation, "
+        "or of inserts plus lookups with --ingest (default: 1000)",
+    )
+    parser.add_argument(
+        "--insert-ratio",
+        type=float,
+        default=DEFAULT_INSERT_RATIO,
+        help="Fraction of --ingest operations that are inserts "
+        f"(default: {DEFAULT_INSERT_RATIO})",
+    )
+    parser.add_argument(
+        "--buffer-size",
+        type=int,
+        default=DEFAULT_BUFFER_SIZE,
+        help="Write buffer size of the --ingest LSM index "
+        f"(default: {DEFAULT_BUFFER_SIZE})",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed for generated workloads (default: 0)",
+    )
+    parser.add_argument(
+        "--format",
+        type=str,
+        default="table",
+        choices=FORMATS,
+        help="Result output: rich tables, or JSON on stdout with messages on "
+        "stderr and without importing rich (default: table)",
+    )
+    parser.add_argument(
+        "--export",
+        nargs="+",
+        metavar="PATH",
+        help="Write the results with environment metadata to these files, "
+        f"as JSON or CSV by suffix ({', '.join(EXPORT_FORMATS)})",
+    )
+    parser.add_argument(
+        "--history",
+        nargs="?",
+        const=DEFAULT_HISTORY_FILE,
+        metavar="PATH",
+        help="Append the results with environment metadata to a JSON Lines "
+        f"history (default: {DEFAULT_HISTORY_FILE})",
+    )
+    parser.add_argument(
+        "--compare-baseline",
+        metavar="PATH",
+        help="Compare per-run timings with a baseline (a JSON export, or the "
+        "latest matching run in a history file) and exit with status "
+        f"{REGRESSION_EXIT_CODE} if any algorithm regressed",
+    )
+    parser.add_argument(
+        "--regression-threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Slowdown of the median, as a fraction, that counts as a "
+        f"regression when significant (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--significance",
+        type=float,
+        default=DEFAULT_ALPHA,
+        help="Significance level of the Mann-Whitney U test used by "
+        f"--compare-baseline (default: {DEFAULT_ALPHA})",
+    )
 
     args = parser.parse_args()
 
+    # Listing the choices would load every plugin, so check after parsing
+    if args.algorithm != "auto" and args.algorithm not in ALGORITHMS:
+        names = ", ".join([*ALGORITHMS, "auto"])
+        parser.error(f"unknown algorithm {args.algorithm!r} (choose from {names})")
+
+    if args.mode == "substring" and not (args.target or args.targets_file):
+        parser.error("--mode substring needs --target or --targets-file")
+
+    recording = args.export or args.history or args.compare_baseline
+    if recording and not (args.target or args.targets_file):
+        parser.error(
+            "--export, --history and --compare-baseline need --target or "
+            "--targets-file"
+        )
+    for path in args.export or []:
+        if Path(path).suffix.lower() not in EXPORT_FORMATS:
+            parser.error(f"--export {path}: use one of {', '.join(EXPORT_FORMATS)}")
+    if args.regression_threshold < 0:
+        parser.error("--regression-threshold cannot be negative")
+    if not 0 < args.significance < 1:
+        parser.error("--significance must be between 0 and 1")
+
+    if args.format == "json":
+        enable_headless()
+
+    if args.node_width != DEFAULT_NODE_WIDTH:
+        register_node_width(args.node_width)
+
+    if args.instrument:
+        enable_instrumentation()
+
+    if args.profile or args.trace_memory:
+        enable_profiling(args.profile, args.trace_memory)
+
+    if args.result_cache:
+        if args.result_cache_size < 1:
+            parser.error("--result-cache-size must be positive")
+        register_cache(args.result_cache, args.result_cache_size)
+
+    if args.parallel_workers:
+        register_parallel_workers(
+            [int(count) for count in args.parallel_workers.split(",")]
+        )
+
     # Display banner
-    console.print("[bold cyan]=======================================")
-    console.print("[bold cyan]    SEARCH ALGORITHM BENCHMARK TOOL")
-    console.print("[bold cyan]=======================================")
+    if args.format == "table":
+        console.print("[bold cyan]=======================================")
+        console.print("[bold cyan]    SEARCH ALGORITHM BENCHMARK TOOL")
+        console.print("[bold cyan]=======================================")
 
     try:
-        # Load data
-        console.print(f"\n[bold]Loading data from {args.file}...[/]")
-        data = load_data(args.file)
-        console.print(f"[green]Loaded {len(data)} items.[/]")
-
-        # Run benchmark
-        if args.algorithm == "all":
-            console.print("\n[bold yellow]Running all search algorithms...[/]")
-            results = run_all_algorithms(data, args.target, args.runs)
-            display_comparison_table(results)
+        # Validate workload profiles before spending time on loading
+        profiles = []
+        if args.workload:
+            from bench.workload import parse_profile
+
+            profiles = [parse_profile(spec) for spec in args.workload]
+
+        # Load data, sorting only when a selected algorithm needs it
+        need_sorted = args.mode == "exact" and (
+            args.sweep
+            or args.workload
+            or args.ranges
+            or args.algorithm == "auto"
+            or needs_sorted(selected_algorithms(args.algorithm))
+        )
+        cache_dir = None if args.no_cache else args.cache_dir
+        data, sorted_data = load_dataset(args.file, need_sorted, cache_dir, args.loader)
+
+        if args.targets_file:
+            targets = load_data(args.targets_file)
+            console.print(f"[green]Loaded {len(targets)} targets.[/]")
+
+        # Load the baseline before spending time on the benchmarks
+        if args.mode == "substring":
+            mode = "substring"
+        else:
+            mode = "batch" if args.targets_file else "single"
+        if recording:
+            from bench.history import environment_metadata
+            from dataset.snapshot import file_fingerprint
+
+            dataset_fingerprint = file_fingerprint(
+                args.file, None if cache_dir is None else Path(cache_dir)
+            )
+            environment = environment_metadata()
+            settings = run_settings(
+                args,
+                dataset_fingerprint,
+                len(data),
+                len(targets) if args.targets_file else 1,
+            )
+        baseline = None
+        if args.compare_baseline:
+            from bench.history import load_baseline
+
+            baseline = load_baseline(args.compare_baseline, mode, dataset_fingerprint)
+            if baseline is None:
+                console.print(
+                    f"[yellow]No {mode} run in {args.compare_baseline} yet; "
+                    "nothing to compare against.[/]"
+                )
+            else:
+                mismatches = baseline_mismatches(baseline, environment, settings)
+                if mismatches:
+                    console.print(
+                        "[yellow]Baseline was measured with different "
+                        f"{'; '.join(mismatches)}.[/]"
+                    )
+
+        if args.ranges:
+            results = run_range_benchmark(
+                sorted_data, args.queries, args.seed, args.runs, args.min_time
+            )
+            if args.format == "json":
+                print_json({"mode": "ranges", "results": results})
+            else:
+                display_ranges_table(results)
+            return 0
+
+        if args.algorithm == "auto" and args.mode == "exact":
+            from bench.planner import plan_algorithm
+            from dataset.snapshot import file_fingerprint
+
+            fingerprint = (
+                None
+                if cache_dir is None
+                else file_fingerprint(args.file, Path(cache_dir))
+            )
+            algorithms = {name: ALGORITHMS[name] for name in selected_algorithms("all")}
+            plan = plan_algorithm(
+                data, sorted_data, algorithms, NEED_SORTED, fingerprint, cache_dir
+            )
+            if args.format == "table":
+                display_plan(plan)
+            names = [plan.algorithm]
+        else:
+            names = selected_algorithms(args.algorithm)
+
+        # Layout engines are always measured next to their baseline
+        if LAYOUT_BASELINE not in names and any(
+            name in LAYOUT_ENGINES for name in names
+        ):
+            names.append(LAYOUT_BASELINE)
+
+        if args.sweep:
+            sizes, series, claims = run_sweep(
+                names, sorted_data, args.runs, args.backend, args.min_time
+            )
+            if args.format == "json":
+                from bench.sweep import find_crossovers
+
+                print_json(
+                    {
+                        "mode": "sweep",
+                        "sizes": sizes,
+                        "series": series,
+                        "claims": claims,
+                        "crossovers": [
+                            crossover._asdict()
+                            for crossover in find_crossovers(sizes, series)
+                        ],
+                    }
+                )
+            else:
+                display_sweep_tables(sizes, series, claims)
+            return 0
+
+        if args.ingest:
+            results = run_ingest_benchmark(
+                names,
+                data,
+                args.queries,
+                args.insert_ratio,
+                args.buffer_size,
+                args.seed,
+            )
+            if args.format == "json":
+                print_json({"mode": "ingest", "results": results})
+            else:
+                display_ingest_table(results, args.buffer_size)
+            return 0
+
+        if args.workload:
+            results = run_workloads(
+                names,
+                data,
+                sorted_data,
+                profiles,
+                args.queries,
+                args.seed,
+                args.runs,
+                args.backend,
+                args.min_time,
+            )
+            if args.format == "json":
+                print_json({"mode": "workload", "results": results})
+            else:
+                display_workload_tables(profiles, results)
+            return 0
+
+        if args.mode == "substring":
+            results = run_substring_benchmark(
+                data,
+                targets if args.targets_file else [args.target],
+                args.runs,
+                args.min_time,
+            )
+        elif args.jobs > 1:
+            results = run_parallel(
+                names,
+                data,
+                sorted_data,
+                args.target,
+                targets if args.targets_file else None,
+                args.runs,
+                args.backend,
+                args.storage,
+                args.jobs,
+                args.pin_cpus,
+                args.min_time,
+            )
         else:
-            algorithm = ALGORITHMS[args.algorithm]
-
-            # Check if algorithm needs sorted data
-            if args.algorithm in [
-                "binary",
-                "interpolation",
-                "exponential",
-                "ternary",
-                "meta_binary",
-                "ubiquitous_binary",
-                "fibonacci",
-                "jump",
-            ]:
+            results = []
+            variants = storage_variants(data, sorted_data, args.storage)
+
+            for storage_name, current, current_sorted in variants:
+                footprint = storage_footprint(current, current_sorted)
                 console.print(
-                    "[yellow]This algorithm requires sorted data. Sorting...[/]"
+                    f"\n[bold]Storage {storage_name}: {format_bytes(footprint)}[/]"
+                )
+
+                # Run batch benchmark
+                if args.targets_file:
+                    if args.algorithm == "all":
+                        console.print(
+                            "\n[bold yellow]Running all batch algorithms...[/]"
+                        )
+                        storage_results = run_all_batch(
+                            current, targets, args.runs, args.backend, current_sorted
+                        )
+                    else:
+                        storage_results = [
+                            benchmark_batch(
+                                label, func, batch_func, dataset, targets, args.runs
+                            )
+                            for label, _, func, batch_func, dataset in backend_variants(
+                                names, current, current_sorted, args.backend
+                            )
+                        ]
+
+                # Run benchmark
+                elif args.algorithm == "all":
+                    console.print("\n[bold yellow]Running all search algorithms...[/]")
+                    storage_results = run_all_algorithms(
+                        current,
+                        args.target,
+                        args.runs,
+                        args.backend,
+                        current_sorted,
+                        args.min_time,
+                    )
+                else:
+                    storage_results = [
+                        benchmark_algorithm(
+                            label,
+                            func,
+                            dataset,
+                            args.target,
+                            args.runs,
+                            min_time=args.min_time,
+                        )
+                        for label, _, func, _, dataset in backend_variants(
+                            names, current, current_sorted, args.backend
+                        )
+                    ]
+
+                results.extend(
+                    tag_results(
+                        storage_results, storage_name, footprint, len(variants) > 1
+                    )
+                )
+
+        if args.mode == "exact":
+            attach_break_even(
+                results,
+                sorted_data,
+                targets if args.targets_file else [args.target],
+                args.min_time,
+            )
+            attach_layout_speedup(results)
+
+        payload = {"mode": mode, "results": results}
+        comparisons = []
+        regressions = []
+        if recording:
+            from bench.history import append_history, export_record, result_record
+
+            payload = result_record(mode, results, settings)
+            for path in args.export or []:
+                export_record(payload, path)
+            if baseline is not None:
+                from bench.regression import REGRESSION, compare_results
+
+                comparisons = compare_results(
+                    results,
+                    baseline["results"],
+                    args.regression_threshold,
+                    args.significance,
                 )
-                data = sorted(data)
+                payload["comparison"] = [
+                    comparison._asdict() for comparison in comparisons
+                ]
+                regressions = [
+                    c.algorithm for c in comparisons if c.verdict == REGRESSION
+                ]
+            # Appended after the comparison, so a history file can be its own
+            # baseline
+            if args.history:
+                append_history(payload, args.history)
+
+        if args.format == "json":
+            print_json(payload)
+        elif args.mode == "substring":
+            display_substring_table(results)
+        elif args.algorithm == "all" or len(results) > 1:
+            if args.targets_file:
+                display_batch_table(results)
+            else:
+                display_comparison_table(results)
+        elif results and "break_even" in results[0]:
+            console.print(
+                "Break-even vs binary search: "
+                f"{format_break_even(results[0]['break_even'])}"
+            )
 
-            benchmark_algorithm(args.algorithm, algorithm, data, args.target, args.runs)
+        if comparisons and args.format == "table":
+            display_regression_table(comparisons, args.regression_threshold)
+        if regressions:
+            console.print(f"[bold red]Regressed:[/] {', '.join(regressions)}")
+            return REGRESSION_EXIT_CODE
 
     except Exception as e:
         console.print(f"[bold red]An error occurred:[/] {str(e)}")
@@ -0,0 +1,40 @@
+"""
+Batch Search Helpers Module
+
+This module contains shared helpers for running many lookups against the
+same dataset in a single call.
+"""
+
+from typing import Callable, List, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# A bounded search step takes (arr, target, lo) and returns
+# (index or -1, lower bound to start the next larger target from)
+BoundedStep = Callable[[Sequence[T], T, int], Tuple[int, int]]
+
+
+def sorted_search_many(
+    step: BoundedStep, arr: Sequence[T], targets: Sequence[T]
+) -> List[int]:
+    """
+    Run a bounded search step for every target, visiting targets in sorted order.
+
+    Because the targets are visited in ascending order, every lookup can start
+    from the bound left behind by the previous one instead of from index zero.
+
+    Args:
+        step: Bounded search step for a single target
+        arr: Sorted list to search in
+        targets: Elements to search for
+
+    Returns:
+        List of indices (or -1) in the same order as targets
+    """
+    results = [-1] * len(targets)
+    lo = 0
+
+    for i in sorted(range(len(targets)), key=targets.__getitem__):
+        results[i], lo = step(arr, targets[i], lo)
+
+    return results
@@ -5,7 +5,9 @@ This module contains implementations of binary search algorithms.
 Note: All these algorithms require a sorted array as input.
 """
 
-from typing import List, TypeVar
+from typing import List, Optional, Sequence, Tuple, TypeVar
+
+from search.batch import sorted_search_many
 
 T = TypeVar("T")
 
@@ -121,3 +123,201 @@ def ubiquitous_binary(arr: List[T], target: T) -> int:
             right = mid - 1
 
     return -1
+
+
+def lower_bound(
+    arr: Sequence[T], target: T, lo: int = 0, hi: Optional[int] = None
+) -> int:
+    """
+    Find the first position in arr[lo:hi] whose element is not below target.
+
+    This is the insertion point that keeps arr sorted with target placed
+    before any equal elements, like bisect.bisect_left.
+
+    Time complexity: O(log n)
+    Space complexity: O(1)
+
+    Args:
+        arr: Sorted list to search in
+        target: Element to search for
+        lo: First index of the searched slice
+        hi: End of the searched slice (default: len(arr))
+
+    Returns:
+        Index between lo and hi
+    """
+    left, right = lo, len(arr) if hi is None else hi
+
+    # Everything before left is below target, everything from right is not
+    while left < right:
+        mid = left + (right - left) // 2
+
+        if arr[mid] < target:
+            left = mid + 1
+        else:
+            right = mid
+
+    return left
+
+
+def upper_bound(
+    arr: Sequence[T], target: T, lo: int = 0, hi: Optional[int] = None
+) -> int:
+    """
+    Find the first position in arr[lo:hi] whose element is above target.
+
+    This is the insertion point that keeps arr sorted with target placed
+    after any equal elements, like bisect.bisect_right.
+
+    Time complexity: O(log n)
+    Space complexity: O(1)
+
+    Args:
+        arr: Sorted list to search in
+        target: Element to search for
+        lo: First index of the searched slice
+        hi: End of the searched slice (default: len(arr))
+
+    Returns:
+        Index between lo and hi
+    """
+    left, right = lo, len(arr) if hi is None else hi
+
+    # Everything before left is at most target, everything from right is above
+    while left < right:
+        mid = left + (right - left) // 2
+
+        if target < arr[mid]:
+            right = mid
+        else:
+            left = mid + 1
+
+    return left
+
+
+def _binary_search_from(arr: List[T], target: T, lo: int) -> Tuple[int, int]:
+    """
+    Standard binary search restricted to arr[lo:].
+
+    Args:
+        arr: Sorted list to search in
+        target: Element to search for
+        lo: Index to start the search from
+
+    Returns:
+        Tuple of (index or -1, lower bound for the next larger target)
+    """
+    left, right = lo, len(arr) - 1
+
+    while left <= right:
+        mid = left + (right - left) // 2
+
+        if arr[mid] == target:
+            return mid, mid
+        elif arr[mid] < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+
+    # Everything before left is smaller than target
+    return -1, left
+
+
+def _meta_binary_search_from(arr: List[T], target: T, lo: int) -> Tuple[int, int]:
+    """
+    Meta binary search restricted to arr[lo:].
+
+    Args:
+        arr: Sorted list to search in
+        target: Element to search for
+        lo: Index to start the search from
+
+    Returns:
+        Tuple of (index or -1, lower bound for the next larger target)
+    """
+    length = len(arr)
+    if lo >= length or target < arr[lo]:
+        return -1, lo
+
+    power = 1
+    while power < length - lo:
+        power *= 2
+
+    # arr[bound] <= target holds throughout
+    bound = lo
+    while power > 0:
+        if bound + power < length and arr[bound + power] <= target:
+            bound += power
+        power //= 2
+
+    if arr[bound] == target:
+        return bound, bound
+
+    return -1, bound
+
+
+def _ubiquitous_binary_from(arr: List[T], target: T, lo: int) -> Tuple[int, int]:
+    """
+    Ubiquitous binary search restricted to arr[lo:].
+
+    Args:
+        arr: Sorted list to search in
+        target: Element to search for
+        lo: Index to start the search from
+
+    Returns:
+        Tuple of (index or -1, lower bound for the next larger target)
+    """
+    if lo >= len(arr):
+        return -1, lo
+
+    # Out-of-range targets exit early without moving the bound
+    if target < arr[lo] or target > arr[-1]:
+        return -1, lo
+
+    return _binary_search_from(arr, target, lo)
+
+
+def binary_search_many(arr: Sequence[T], targets: Sequence[T]) -> List[int]:
+    """
+    Batch variant of binary search.
+
+    Targets are processed in sorted order so that each lookup starts from
+    the bound of the previous one.
+
+    Args:
+        arr: Sorted list to search in
+        targets: Elements to search for
+
+    Returns:
+        List of indices (or -1) in the same order as targets
+    """
+    return sorted_search_many(_binary_search_from, arr, targets)
+
+
+def meta_binary_search_many(arr: Sequence[T], targets: Sequence[T]) -> List[int]:
+    """
+    Batch variant of meta binary search.
+
+    Args:
+        arr: Sorted list to search in
+        targets: Elements to search for
+
+    Returns:
+        List of indices (or -1) in the same order as targets
+    """
+    return sorted_search_many(_meta_binary_search_from, arr, targets)
+
+
+def ubiquitous_binary_many(arr: Sequence[T], targets: Sequence[T]) -> List[int]:
+    """
+    Batch variant of ubiquitous binary search.
+
+    Args:
+        arr: Sorted list to search in
+        targets: Elements to search for
+
+    Returns:
+        List of indices (or -1) in the same order as targets
+    """
+    return sorted_search_many(_ubiquitous_binary_from, arr, targets)
@@ -0,0 +1,381 @@
+"""
+Result Cache Module
+
+This module contains bounded result caches with LRU, LFU and ARC eviction,
+and a wrapper that puts one in front of any search function. Hot keys are
+answered from the cache instead of being searched again; the cache is
+cleared whenever the wrapped function is pointed at a different or changed
+dataset.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+# Available eviction policies
+POLICIES = ["lru", "lfu", "arc"]
+
+# Default number of cached results
+DEFAULT_CAPACITY = 1024
+
+# Returned by get() when a key is not cached
+MISSING = object()
+
+
+class LRUCache:
+    """Evicts the least recently used entry."""
+
+    def __init__(self, capacity: int):
+        """
+        Create an empty cache.
+
+        Args:
+            capacity: Maximum number of entries
+        """
+        self.capacity = capacity
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Look up a key and mark it as recently used.
+
+        Args:
+            key: Key to look up
+
+        Returns:
+            The cached value, or MISSING
+        """
+        value = self._entries.get(key, MISSING)
+        if value is not MISSING:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Insert a key that get() just missed.
+
+        Args:
+            key: Key to insert
+            value: Value to cache
+        """
+        if len(self._entries) >= self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        self._entries[key] = value
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LFUCache:
+    """
+    Evicts the least frequently used entry, the least recent among ties.
+
+    Entries are grouped in per-frequency buckets so every operation is O(1).
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Create an empty cache.
+
+        Args:
+            capacity: Maximum number of entries
+        """
+        self.capacity = capacity
+        self.evictions = 0
+        self._entries: Dict[Hashable, Tuple[Any, int]] = {}
+        self._buckets: Dict[int, "OrderedDict[Hashable, None]"] = {}
+        self._min_frequency = 0
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Look up a key and count the access.
+
+        Args:
+            key: Key to look up
+
+        Returns:
+            The cached value, or MISSING
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+
+        value, frequency = entry
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[frequency]
+            if self._min_frequency == frequency:
+                self._min_frequency = frequency + 1
+
+        self._entries[key] = (value, frequency + 1)
+        self._buckets.setdefault(frequency + 1, OrderedDict())[key] = None
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Insert a key that get() just missed.
+
+        Args:
+            key: Key to insert
+            value: Value to cache
+        """
+        if len(self._entries) >= self.capacity:
+            bucket = self._buckets[self._min_frequency]
+            victim, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self._buckets[self._min_frequency]
+            del self._entries[victim]
+            self.evictions += 1
+
+        self._entries[key] = (value, 1)
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_frequency = 1
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+        self._buckets.clear()
+        self._min_frequency = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ARCCache:
+    """
+    Adaptive Replacement Cache (Megiddo and Modha).
+
+    Entries seen once live in T1 and entries seen again in T2. The ghost
+    lists B1 and B2 remember keys recently evicted from each, and a hit on
+    a ghost shifts the target size p of T1, so the cache adapts between
+    recency-heavy and frequency-heavy traffic.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Create an empty cache.
+
+        Args:
+            capacity: Maximum number of cached values
+        """
+        self.capacity = capacity
+        self.evictions = 0
+        self._t1: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._t2: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._b1: "OrderedDict[Hashable, None]" = OrderedDict()
+        self._b2: "OrderedDict[Hashable, None]" = OrderedDict()
+        self._p = 0
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Look up a key, promoting it to T2 on a hit.
+
+        Args:
+            key: Key to look up
+
+        Returns:
+            The cached value, or MISSING
+        """
+        if key in self._t1:
+            value = self._t1.pop(key)
+            self._t2[key] = value
+            return value
+        if key in self._t2:
+            self._t2.move_to_end(key)
+            return self._t2[key]
+        return MISSING
+
+    def _replace(self, key: Hashable) -> None:
+        """
+        Evict one value from T1 or T2 into its ghost list.
+
+        Args:
+            key: Key being inserted, which steers the choice on a B2 hit
+        """
+        if self._t1 and (
+            len(self._t1) > self._p or (key in self._b2 and len(self._t1) == self._p)
+        ):
+            victim, _ = self._t1.popitem(last=False)
+            self._b1[victim] = None
+        else:
+            victim, _ = self._t2.popitem(last=False)
+            self._b2[victim] = None
+        self.evictions += 1
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Insert a key that get() just missed.
+
+        Args:
+            key: Key to insert
+            value: Value to cache
+        """
+        capacity = self.capacity
+
+        if key in self._b1:
+            # Recency is paying off: grow T1
+            self._p = min(capacity, self._p + max(len(self._b2) // len(self._b1), 1))
+            self._replace(key)
+            del self._b1[key]
+            self._t2[key] = value
+            return
+
+        if key in self._b2:
+            # Frequency is paying off: shrink T1
+            self._p = max(0, self._p - max(len(self._b1) // len(self._b2), 1))
+            self._replace(key)
+            del self._b2[key]
+            self._t2[key] = value
+            return
+
+        l1 = len(self._t1) + len(self._b1)
+        total = l1 + len(self._t2) + len(self._b2)
+        if l1 >= capacity:
+            if len(self._t1) < capacity:
+                self._b1.popitem(last=False)
+                self._replace(key)
+            else:
+                self._t1.popitem(last=False)
+                self.evictions += 1
+        elif total >= capacity:
+            if total >= 2 * capacity:
+                self._b2.popitem(last=False)
+            self._replace(key)
+
+        self._t1[key] = value
+
+    def clear(self) -> None:
+        """Drop all entries and ghosts."""
+        for entries in (self._t1, self._t2, self._b1, self._b2):
+            entries.clear()
+        self._p = 0
+
+    def __len__(self) -> int:
+        return len(self._t1) + len(self._t2)
+
+
+CACHE_CLASSES = {"lru": LRUCache, "lfu": LFUCache, "arc": ARCCache}
+
+
+class CachedSearch:
+    """
+    Search function wrapped in a bounded result cache.
+
+    Callable as (arr, target) like the function it wraps. Results, misses
+    included, are cached per target. The cache is cleared when the wrapper
+    is called with a different array object, or when the array's length or
+    `version` attribute (if it has one) changes; call invalidate() after
+    other in-place edits.
+    """
+
+    def __init__(
+        self,
+        algorithm: Callable,
+        policy: str = "lru",
+        capacity: int = DEFAULT_CAPACITY,
+    ):
+        """
+        Wrap a search function.
+
+        Args:
+            algorithm: Search function or engine called as algorithm(arr, target)
+            policy: One of POLICIES
+            capacity: Maximum number of cached results
+
+        Raises:
+            ValueError: If the policy is unknown or capacity is not positive
+        """
+        if policy not in CACHE_CLASSES:
+            raise ValueError(f"Unknown cache policy '{policy}'")
+        if capacity < 1:
+            raise ValueError("Cache capacity must be positive")
+
+        self.algorithm = algorithm
+        self.policy = policy
+        self.__name__ = f"{policy}_cached_{algorithm.__name__}"
+        self._cache = CACHE_CLASSES[policy](capacity)
+        self._signature: Optional[Tuple[int, int, Any]] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _check(self, arr: Sequence) -> None:
+        """
+        Clear the cache if arr is not the dataset the results came from.
+
+        Args:
+            arr: Dataset about to be searched
+        """
+        signature = (id(arr), len(arr), getattr(arr, "version", None))
+        if signature != self._signature:
+            self._cache.clear()
+            self._signature = signature
+
+    def invalidate(self) -> None:
+        """Drop every cached result."""
+        self._cache.clear()
+        self._signature = None
+
+    def prepare(self, arr: Sequence) -> None:
+        """
+        Prepare the wrapped engine (if it is one) and start with a cold cache.
+
+        Args:
+            arr: Dataset to search in
+        """
+        engine = getattr(self.algorithm, "__self__", self.algorithm)
+        if hasattr(engine, "prepare"):
+            engine.prepare(arr)
+        self.invalidate()
+        self._check(arr)
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Reset the hit, miss and eviction counters."""
+        self.hits = 0
+        self.misses = 0
+        self._cache.evictions = 0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Report the cache hit rate and eviction count.
+
+        Returns:
+            Dictionary of statistics
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self._cache.evictions,
+        }
+
+    def __call__(self, arr: Sequence, target: Hashable) -> int:
+        self._check(arr)
+
+        result = self._cache.get(target)
+        if result is not MISSING:
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = self.algorithm(arr, target)
+        self._cache.put(target, result)
+        return result
+
+    def batch(self, arr: Sequence, targets: Sequence[Hashable]) -> List[int]:
+        """
+        Batch adapter with the same signature as the *_many functions.
+
+        Args:
+            arr: Dataset to search in
+            targets: Elements to search for, answered in order through the cache
+
+        Returns:
+            List of indices (or -1) in the same order as targets
+        """
+        return [self(arr, target) for target in targets]
@@ -0,0 +1,95 @@
+"""
+Prepared Engine Module
+
+This module contains the base class of the prepared search engines. An
+engine builds a structure over a dataset once and then answers queries
+against it; the base class turns that into the (arr, target) search
+function and the (arr, targets) batch function the benchmarks call.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence
+
+
+class PreparedEngine(ABC):
+    """
+    Base class of search engines prepared once per dataset.
+
+    Subclasses implement prepare(arr), which must record arr as
+    self._source, search(target) and search_many(targets), and may
+    override stats(); a subclass missing one of the three cannot be
+    instantiated.
+
+    Instances are usable directly as an (arr, target) search function: the
+    engine is (re)prepared only when called with a different array object.
+    In-place changes to an already prepared array are not detected.
+    """
+
+    def __init__(self):
+        """Create an engine that is not prepared for any array yet."""
+        self._source: Optional[Sequence] = None
+
+    @abstractmethod
+    def prepare(self, arr: Sequence) -> None:
+        """
+        Build the engine's structures for an array.
+
+        Args:
+            arr: List to search in
+        """
+
+    @abstractmethod
+    def search(self, target: Any) -> int:
+        """
+        Search the prepared array.
+
+        Args:
+            target: Element to search for
+
+        Returns:
+            Index of the element if found, -1 otherwise
+        """
+
+    @abstractmethod
+    def search_many(self, targets: Sequence) -> List[int]:
+        """
+        Search the prepared array for every target.
+
+        Args:
+            targets: Elements to search for
+
+        Returns:
+            List of indices (or -1) in the same order as targets
+        """
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Report statistics collected by the engine.
+
+        Returns:
+            Dictionary of statistics, empty unless overridden
+        """
+        return {}
+
+    def _prepared_for(self, arr: Sequence) -> None:
+        """Prepare the engine unless it already is for this array object."""
+        if arr is not self._source:
+            self.prepare(arr)
+
+    def __call__(self, arr: Sequence, target: Any) -> int:
+        self._prepared_for(arr)
+        return self.search(target)
+
+    def batch(self, arr: Sequence, targets: Sequence) -> List[int]:
+        """
+        Batch adapter with the same signature as the *_many functions.
+
+        Args:
+            arr: List to search in
+            targets: Elements to search for
+
+        Returns:
+            List of indices (or -1) in the same order as targets
+        """
+        self._prepared_for(arr)
+        return self.search_many(targets)
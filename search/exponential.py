@@ -5,7 +5,9 @@ This module contains implementation of exponential search algorithm.
 Note: This algorithm requires a sorted array as input.
 """
 
-from typing import List, TypeVar
+from typing import List, Sequence, Tuple, TypeVar
+
+from search.batch import sorted_search_many
 
 T = TypeVar("T")
 
@@ -71,3 +73,49 @@ def exponential_search(arr: List[T], target: T) -> int:
 
     # Call binary search for the found range
     return binary_search_bounded(arr, target, i // 2, min(i, n - 1))
+
+
+def _exponential_search_from(arr: List[T], target: T, lo: int) -> Tuple[int, int]:
+    """
+    Exponential search that gallops forward from index lo.
+
+    Args:
+        arr: Sorted list to search in
+        target: Element to search for
+        lo: Index to start galloping from
+
+    Returns:
+        Tuple of (index or -1, lower bound for the next larger target)
+    """
+    n = len(arr)
+    if lo >= n:
+        return -1, lo
+
+    if arr[lo] == target:
+        return lo, lo
+
+    i = 1
+    while lo + i < n and arr[lo + i] <= target:
+        i *= 2
+
+    left = lo + i // 2
+    index = binary_search_bounded(arr, target, left, min(lo + i, n - 1))
+
+    return index, (index if index != -1 else left)
+
+
+def exponential_search_many(arr: Sequence[T], targets: Sequence[T]) -> List[int]:
+    """
+    Batch variant of exponential search.
+
+    With targets processed in sorted order, each lookup gallops forward from
+    the previous bound, so nearby targets cost only a few probes.
+
+    Args:
+        arr: Sorted list to search in
+        targets: Elements to search for
+
+    Returns:
+        List of indices (or -1) in the same order as targets
+    """
+    return sorted_search_many(_exponential_search_from, arr, targets)
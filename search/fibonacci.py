@@ -5,7 +5,9 @@ This module contains implementation of fibonacci search algorithm.
 Note: This algorithm requires a sorted array as input.
 """
 
-from typing import List, TypeVar
+from typing import List, Sequence, Tuple, TypeVar
+
+from search.batch import sorted_search_many
 
 T = TypeVar("T")
 
@@ -70,3 +72,64 @@ def fibonacci_search(arr: List[T], target: T) -> int:
 
     # Element not found
     return -1
+
+
+def _fibonacci_search_from(arr: List[T], target: T, lo: int) -> Tuple[int, int]:
+    """
+    Fibonacci search restricted to arr[lo:].
+
+    Args:
+        arr: Sorted list to search in
+        target: Element to search for
+        lo: Index to start the search from
+
+    Returns:
+        Tuple of (index or -1, lower bound for the next larger target)
+    """
+    n = len(arr)
+
+    fib2 = 0
+    fib1 = 1
+    fib = fib1 + fib2
+
+    while fib < n - lo:
+        fib2 = fib1
+        fib1 = fib
+        fib = fib1 + fib2
+
+    # arr[offset] < target holds throughout
+    offset = lo - 1
+
+    while fib > 1:
+        i = min(offset + fib2, n - 1)
+
+        if arr[i] < target:
+            fib = fib1
+            fib1 = fib2
+            fib2 = fib - fib1
+            offset = i
+        elif arr[i] > target:
+            fib = fib2
+            fib1 = fib1 - fib2
+            fib2 = fib - fib1
+        else:
+            return i, i
+
+    if fib1 and offset + 1 < n and arr[offset + 1] == target:
+        return offset + 1, offset + 1
+
+    return -1, offset + 1
+
+
+def fibonacci_search_many(arr: Sequence[T], targets: Sequence[T]) -> List[int]:
+    """
+    Batch variant of fibonacci search.
+
+    Args:
+        arr: Sorted list to search in
+        targets: Elements to search for
+
+    Returns:
+        List of indices (or -1) in the same order as targets
+    """
+    return sorted_search_many(_fibonacci_search_from, arr, targets)
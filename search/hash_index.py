@@ -0,0 +1,191 @@
+"""
+Hash Index Module
+
+This module contains a prepared exact-match index. It maps every value to
+the index of its first occurrence, built once per dataset, so lookups take
+expected O(1) time on unsorted data. The index is either a plain dict or a
+compact open-addressing table of flat arrays that stores record indexes
+instead of Python int objects.
+"""
+
+import sys
+from array import array
+from typing import Dict, List, Optional, Sequence, TypeVar
+
+from search.engine import PreparedEngine
+
+T = TypeVar("T")
+
+# Maximum fraction of occupied slots in the compact table
+LOAD_FACTOR = 0.7
+
+# Marker for an empty slot in the compact table
+EMPTY = -1
+
+
+def _tag(hash_value: int) -> int:
+    """
+    Take 8 bits of a hash that are not used to pick the slot.
+
+    Comparing tags first skips most record comparisons on collisions.
+
+    Args:
+        hash_value: Hash of a value
+
+    Returns:
+        Tag between 0 and 255
+    """
+    return (hash_value >> 48) & 0xFF
+
+
+class HashIndexSearcher(PreparedEngine):
+    """
+    Exact-match lookup through a hash index built once per dataset.
+
+    The default index is a dict from value to first index. With compact=True
+    it is an open-addressing table with linear probing: one array of record
+    indexes (4 bytes per slot for up to 2**31 records) plus one byte per slot
+    holding hash bits, with records compared only when those bits match.
+    """
+
+    def __init__(self, compact: bool = False, arr: Optional[Sequence[T]] = None):
+        """
+        Create a searcher, optionally preparing it for an array.
+
+        Args:
+            compact: Use the open-addressing table instead of a dict
+            arr: List to build the index for
+        """
+        super().__init__()
+        self.compact = compact
+        self.__name__ = "compact_hash_index_search" if compact else "hash_index_search"
+        self._index: Dict[T, int] = {}
+        self._slots = array("i")
+        self._tags = bytearray()
+        self._mask = 0
+        self.nbytes = 0
+
+        if arr is not None:
+            self.prepare(arr)
+
+    def prepare(self, arr: Sequence[T]) -> None:
+        """
+        Build the index.
+
+        Time complexity: O(n), paid once per dataset
+
+        Args:
+            arr: List to search in
+        """
+        self._source = arr
+        if self.compact:
+            self._build_table(arr)
+        else:
+            self._build_dict(arr)
+
+    def _build_dict(self, arr: Sequence[T]) -> None:
+        """
+        Build the dict index; later duplicates are overwritten by earlier ones.
+
+        Args:
+            arr: List to index
+        """
+        n = len(arr)
+        self._index = dict(zip(reversed(arr), range(n - 1, -1, -1)))
+
+        # Ints above 256 are separate objects owned by the dict
+        self.nbytes = sys.getsizeof(self._index) + sum(
+            sys.getsizeof(i) for i in self._index.values() if i > 256
+        )
+
+    def _build_table(self, arr: Sequence[T]) -> None:
+        """
+        Build the open-addressing table; only first occurrences are inserted.
+
+        Args:
+            arr: List to index
+        """
+        n = len(arr)
+        capacity = 8
+        while capacity * LOAD_FACTOR < n:
+            capacity *= 2
+
+        mask = capacity - 1
+        slots = array("i" if n < 2**31 else "q", [EMPTY]) * capacity
+        tags = bytearray(capacity)
+
+        for index, value in enumerate(arr):
+            hash_value = hash(value)
+            tag = _tag(hash_value)
+            slot = hash_value & mask
+            while slots[slot] != EMPTY:
+                if tags[slot] == tag and arr[slots[slot]] == value:
+                    break
+                slot = (slot + 1) & mask
+            else:
+                slots[slot] = index
+                tags[slot] = tag
+
+        self._slots = slots
+        self._tags = tags
+        self._mask = mask
+        self.nbytes = slots.itemsize * len(slots) + len(tags)
+
+    def search(self, target: T) -> int:
+        """
+        Look up the target in the index.
+
+        Time complexity: O(1) expected
+        Space complexity: O(1)
+
+        Args:
+            target: Element to search for
+
+        Returns:
+            Index of the first occurrence if found, -1 otherwise
+        """
+        if not self.compact:
+            return self._index.get(target, -1)
+
+        arr = self._source
+        slots = self._slots
+        tags = self._tags
+        mask = self._mask
+
+        hash_value = hash(target)
+        tag = _tag(hash_value)
+        slot = hash_value & mask
+
+        # Linear probing until an empty slot ends the cluster
+        index = slots[slot]
+        while index != EMPTY:
+            if tags[slot] == tag and arr[index] == target:
+                return index
+            slot = (slot + 1) & mask
+            index = slots[slot]
+
+        return -1
+
+    def search_many(self, targets: Sequence[T]) -> List[int]:
+        """
+        Look up every target in the index.
+
+        Args:
+            targets: Elements to search for
+
+        Returns:
+            List of indices (or -1) in the same order as targets
+        """
+        if not self.compact:
+            get = self._index.get
+            return [get(target, -1) for target in targets]
+        return [self.search(target) for target in targets]
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Report the memory held by the index, excluding the records.
+
+        Returns:
+            Dictionary with the index size in bytes
+        """
+        return {"index_memory": self.nbytes}
@@ -6,7 +6,12 @@ Note: This algorithm requires a sorted array as input and works best
 on uniformly distributed data.
 """
 
-from typing import List, TypeVar, Union
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from search.batch import sorted_search_many
+from search.engine import PreparedEngine
 
 T = TypeVar("T")
 
@@ -71,3 +76,285 @@ def interpolation_search(
 
     # Element not found
     return -1
+
+
+def _interpolation_search_from(
+    arr: List[Union[int, float]], target: Union[int, float], lo: int
+) -> Tuple[int, int]:
+    """
+    Interpolation search restricted to arr[lo:].
+
+    Args:
+        arr: Sorted list of numbers to search in
+        target: Number to search for
+        lo: Index to start the search from
+
+    Returns:
+        Tuple of (index or -1, lower bound for the next larger target)
+    """
+    low, high = lo, len(arr) - 1
+
+    while low <= high and arr[low] <= target <= arr[high]:
+        if arr[high] == arr[low]:
+            if arr[low] == target:
+                return low, low
+            return -1, low
+
+        try:
+            pos = low + int(
+                ((float(high - low) / (arr[high] - arr[low])) * (target - arr[low]))
+            )
+        except (TypeError, ValueError):
+            pos = low + (high - low) // 2
+
+        pos = max(low, min(pos, high))
+
+        if arr[pos] == target:
+            return pos, pos
+
+        if arr[pos] < target:
+            low = pos + 1
+        else:
+            high = pos - 1
+
+    return -1, low
+
+
+def interpolation_search_many(
+    arr: Sequence[Union[int, float]], targets: Sequence[Union[int, float]]
+) -> List[int]:
+    """
+    Batch variant of interpolation search.
+
+    Args:
+        arr: Sorted list of numbers to search in
+        targets: Numbers to search for
+
+    Returns:
+        List of indices (or -1) in the same order as targets
+    """
+    return sorted_search_many(_interpolation_search_from, arr, targets)
+
+
+# Keys must fit in an unsigned 64-bit array slot
+KEY_LIMIT = 1 << 64
+
+
+class PrefixKeyEncoder:
+    """
+    Order-preserving map from strings to fixed-width integer keys.
+
+    Text uses only a small alphabet of byte values, so packing raw bytes
+    (e.g. the first 8 bytes big-endian) leaves most of the key space empty
+    and interpolation lands far from the target. The encoder instead ranks
+    the byte values that occur in the dataset and packs as many leading
+    bytes as fit into 64 bits in base (alphabet size + 1), with 0 reserved
+    for "past the end of the string". Because UTF-8 byte order equals code
+    point order, a <= b implies key(a) <= key(b); strings sharing a prefix
+    of `width` bytes get equal keys (ties).
+    """
+
+    def __init__(self, records: Sequence[str]):
+        """
+        Build the byte alphabet for a dataset.
+
+        Args:
+            records: Strings the keys will be computed for
+        """
+        seen = set()
+        for record in records:
+            seen.update(record.encode("utf-8"))
+
+        alphabet = sorted(seen)
+        # An empty dataset still needs a usable base
+        self.base = max(len(alphabet) + 1, 2)
+        self.width = 1
+        while self.base ** (self.width + 1) <= KEY_LIMIT:
+            self.width += 1
+
+        # codes[b] is the rank of byte b; unseen bytes get the rank of the
+        # largest smaller byte and are flagged in _exact
+        self._codes = bytearray(256)
+        self._exact = bytearray(256)
+        rank = 0
+        for byte in range(256):
+            if byte in seen:
+                rank += 1
+                self._exact[byte] = 1
+            self._codes[byte] = rank
+
+    def key(self, value: str) -> int:
+        """
+        Compute the key of a string.
+
+        For strings containing bytes outside the dataset alphabet, the key is
+        the largest key any dataset string below the value could have, so
+        comparisons against dataset keys stay consistent.
+
+        Args:
+            value: String to convert
+
+        Returns:
+            Unsigned integer key below 2**64
+        """
+        base = self.base
+        digits = value.encode("utf-8")[: self.width]
+        key = 0
+        count = 0
+
+        for byte in digits:
+            key = key * base + self._codes[byte]
+            count += 1
+            if not self._exact[byte]:
+                # Saturate the remaining digits
+                remaining = self.width - count
+                return (key + 1) * base**remaining - 1
+
+        return key * base ** (self.width - count)
+
+
+class StringInterpolationSearcher(PreparedEngine):
+    """
+    Interpolation search for sorted string data via precomputed numeric keys.
+
+    prepare() builds a PrefixKeyEncoder and the key of every record once per
+    dataset. Queries interpolate on those integer keys and fall back to
+    binary search (with string comparisons) only inside runs of equal keys.
+    """
+
+    def __init__(self, arr: Optional[Sequence[str]] = None):
+        """
+        Create a searcher, optionally preparing it for a sorted array.
+
+        Args:
+            arr: Sorted list of strings to prepare keys for
+        """
+        super().__init__()
+        self.__name__ = "string_interpolation_search"
+        self._encoder: Optional[PrefixKeyEncoder] = None
+        self._keys = array("Q")
+        self.total_probes = 0
+        self.total_queries = 0
+
+        if arr is not None:
+            self.prepare(arr)
+
+    def prepare(self, arr: Sequence[str]) -> None:
+        """
+        Compute the numeric key of every record.
+
+        Time complexity: O(n), paid once per dataset
+
+        Args:
+            arr: Sorted list of strings
+        """
+        self._encoder = PrefixKeyEncoder(arr)
+        self._keys = array("Q", map(self._encoder.key, arr))
+        self._source = arr
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Reset the probe counters."""
+        self.total_probes = 0
+        self.total_queries = 0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Report probe statistics collected since the last reset.
+
+        Returns:
+            Dictionary with the mean number of probes per query
+        """
+        queries = self.total_queries or 1
+        return {"probes": self.total_probes / queries}
+
+    def search_with_probes(self, target: str) -> Tuple[int, int]:
+        """
+        Search the prepared array and count the probes needed.
+
+        Probes are interpolation steps on the keys plus record comparisons
+        inside ties.
+
+        Time complexity: O(log log n) for uniformly distributed keys
+        Space complexity: O(1)
+
+        Args:
+            target: String to search for
+
+        Returns:
+            Tuple of (index or -1, number of probes)
+        """
+        arr = self._source
+        keys = self._keys
+        target_key = self._encoder.key(target)
+        low, high = 0, len(keys) - 1
+        probes = 0
+
+        # Interpolate on the integer keys until the target key is hit
+        while low <= high and keys[low] <= target_key <= keys[high]:
+            if keys[low] == keys[high]:
+                break
+
+            pos = low + (target_key - keys[low]) * (high - low) // (
+                keys[high] - keys[low]
+            )
+            probes += 1
+
+            if keys[pos] < target_key:
+                low = pos + 1
+            elif keys[pos] > target_key:
+                high = pos - 1
+            else:
+                # Narrow to the run of equal keys around pos
+                low = bisect_left(keys, target_key, low, pos)
+                high = bisect_right(keys, target_key, pos, high + 1) - 1
+                break
+        else:
+            return -1, probes
+
+        # Binary search inside the tie; strings are compared only on equal keys
+        while low <= high:
+            mid = low + (high - low) // 2
+            probes += 1
+
+            if keys[mid] < target_key:
+                low = mid + 1
+            elif keys[mid] > target_key:
+                high = mid - 1
+            elif arr[mid] == target:
+                return mid, probes
+            elif arr[mid] < target:
+                low = mid + 1
+            else:
+                high = mid - 1
+
+        return -1, probes
+
+    def search(self, target: str) -> int:
+        """
+        Search the prepared array, recording the probe count.
+
+        Time complexity: O(log log n) for uniformly distributed keys
+
+        Args:
+            target: String to search for
+
+        Returns:
+            Index of the element if found, -1 otherwise
+        """
+        index, probes = self.search_with_probes(target)
+        self.total_probes += probes
+        self.total_queries += 1
+        return index
+
+    def search_many(self, targets: Sequence[str]) -> List[int]:
+        """
+        Search the prepared array for every target.
+
+        Args:
+            targets: Strings to search for
+
+        Returns:
+            List of indices (or -1) in the same order as targets
+        """
+        return [self.search(target) for target in targets]
@@ -6,7 +6,9 @@ Note: This algorithm requires a sorted array as input.
 """
 
 import math
-from typing import List, TypeVar
+from typing import List, Sequence, Tuple, TypeVar
+
+from search.batch import sorted_search_many
 
 T = TypeVar("T")
 
@@ -54,3 +56,53 @@ def jump_search(arr: List[T], target: T) -> int:
         return prev
 
     return -1
+
+
+def _jump_search_from(arr: List[T], target: T, lo: int) -> Tuple[int, int]:
+    """
+    Jump search that starts jumping from index lo.
+
+    Args:
+        arr: Sorted list to search in
+        target: Element to search for
+        lo: Index to start jumping from
+
+    Returns:
+        Tuple of (index or -1, lower bound for the next larger target)
+    """
+    n = len(arr)
+    if lo >= n:
+        return -1, lo
+
+    step_size = max(int(math.sqrt(n)), 1)
+
+    prev, step = lo, lo + step_size
+    while arr[min(step, n) - 1] < target:
+        prev = step
+        step += step_size
+        if prev >= n:
+            return -1, n
+
+    while arr[prev] < target:
+        prev += 1
+        if prev == min(step, n):
+            return -1, prev
+
+    if arr[prev] == target:
+        return prev, prev
+
+    return -1, prev
+
+
+def jump_search_many(arr: Sequence[T], targets: Sequence[T]) -> List[int]:
+    """
+    Batch variant of jump search.
+
+    Args:
+        arr: Sorted list to search in
+        targets: Elements to search for
+
+    Returns:
+        List of indices (or -1) in the same order as targets
+    """
+    return sorted_search_many(_jump_search_from, arr, targets)
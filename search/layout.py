@@ -0,0 +1,256 @@
+"""
+Cache-Friendly Layout Search Module
+
+This module contains search engines that rearrange sorted data once into a
+layout where the probes of one lookup sit close together in memory:
+
+- Eytzinger (BFS) layout: the implicit binary search tree stored level by
+  level, so the first levels share a few cache lines and the next probe's
+  location is computed rather than loaded.
+- Static B+-tree layout: nodes of a tunable width, each searched as one
+  contiguous block, so a lookup touches one block per level instead of one
+  scattered element per comparison.
+
+Note: Both engines require a sorted array as input.
+"""
+
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from search.engine import PreparedEngine
+
+T = TypeVar("T")
+
+# Default number of keys per B+-tree node
+DEFAULT_NODE_WIDTH = 16
+
+
+class EytzingerSearcher(PreparedEngine):
+    """
+    Binary search over an Eytzinger (BFS-ordered) copy of sorted data.
+
+    Slot k of the layout holds the root of the subtree whose children are
+    slots 2k and 2k + 1 (slot 0 is unused). A parallel array maps every slot
+    back to its index in the sorted data.
+    """
+
+    def __init__(self, arr: Optional[Sequence[T]] = None):
+        """
+        Create a searcher, optionally preparing it for a sorted array.
+
+        Args:
+            arr: Sorted list to build the layout from
+        """
+        super().__init__()
+        self.__name__ = "eytzinger_search"
+        self._layout: List[Optional[T]] = [None]
+        self._positions = array("q")
+        self._size = 0
+
+        if arr is not None:
+            self.prepare(arr)
+
+    def prepare(self, arr: Sequence[T]) -> None:
+        """
+        Build the Eytzinger layout and the slot-to-index map.
+
+        Time complexity: O(n), paid once per dataset
+
+        Args:
+            arr: Sorted list to search in
+        """
+        n = len(arr)
+        layout: List[Optional[T]] = [None] * (n + 1)
+        positions = array("q", [-1]) * (n + 1)
+
+        # An in-order walk of the implicit tree visits slots in sorted order
+        index = 0
+        stack = []
+        k = 1
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            layout[k] = arr[index]
+            positions[k] = index
+            index += 1
+            k = 2 * k + 1
+
+        self._layout = layout
+        self._positions = positions
+        self._size = n
+        self._source = arr
+
+    def search(self, target: T) -> int:
+        """
+        Search the layout for the first element not less than the target.
+
+        Time complexity: O(log n)
+        Space complexity: O(1)
+
+        Args:
+            target: Element to search for
+
+        Returns:
+            Index in the sorted data of the element if found, -1 otherwise
+        """
+        layout = self._layout
+        n = self._size
+
+        k = 1
+        while k <= n:
+            k = 2 * k + (layout[k] < target)
+
+        # Undo the trailing right turns (and one left turn) to reach the
+        # last node where the search went left: the lower bound
+        k >>= ((~k) & (k + 1)).bit_length()
+
+        if k and layout[k] == target:
+            return self._positions[k]
+        return -1
+
+    def search_many(self, targets: Sequence[T]) -> List[int]:
+        """
+        Search the layout for every target.
+
+        Args:
+            targets: Elements to search for
+
+        Returns:
+            List of indices (or -1) in the same order as targets
+        """
+        return [self.search(target) for target in targets]
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Report the memory held by the layout, excluding the records.
+
+        Returns:
+            Dictionary with the layout size in bytes
+        """
+        positions = self._positions
+        return {
+            "index_memory": sys.getsizeof(self._layout)
+            + positions.itemsize * len(positions)
+        }
+
+
+class BTreeSearcher(PreparedEngine):
+    """
+    Search over a static B+-tree built from sorted data.
+
+    All levels are stored top-down in one flat list. The leaf level is the
+    sorted data itself in blocks of `width` keys; every inner node holds the
+    largest key of each of its `width` children. A lookup searches one node
+    per level and descends into the first child whose largest key is not
+    less than the target, so the leaf position maps back to the sorted
+    index by subtracting the leaf level's offset.
+    """
+
+    def __init__(
+        self, width: int = DEFAULT_NODE_WIDTH, arr: Optional[Sequence[T]] = None
+    ):
+        """
+        Create a searcher, optionally preparing it for a sorted array.
+
+        Args:
+            width: Number of keys per node (at least 2)
+            arr: Sorted list to build the tree from
+
+        Raises:
+            ValueError: If width is smaller than 2
+        """
+        super().__init__()
+        if width < 2:
+            raise ValueError("B+-tree nodes need at least 2 keys")
+
+        self.width = width
+        self.__name__ = "btree_search"
+        self._tree: List[T] = []
+        self._levels: List[Tuple[int, int]] = []
+
+        if arr is not None:
+            self.prepare(arr)
+
+    def prepare(self, arr: Sequence[T]) -> None:
+        """
+        Build the tree levels bottom-up and flatten them top-down.
+
+        Time complexity: O(n), paid once per dataset
+
+        Args:
+            arr: Sorted list to search in
+        """
+        width = self.width
+        levels = [list(arr)]
+        while len(levels[-1]) > width:
+            below = levels[-1]
+            last = len(below) - 1
+            levels.append(
+                [below[min(i + width - 1, last)] for i in range(0, len(below), width)]
+            )
+
+        tree: List[T] = []
+        meta = []
+        for level in reversed(levels):
+            meta.append((len(tree), len(level)))
+            tree.extend(level)
+
+        self._tree = tree
+        self._levels = meta
+        self._source = arr
+
+    def search(self, target: T) -> int:
+        """
+        Descend from the root, searching one node per level.
+
+        Time complexity: O(log n)
+        Space complexity: O(1)
+
+        Args:
+            target: Element to search for
+
+        Returns:
+            Index in the sorted data of the element if found, -1 otherwise
+        """
+        tree = self._tree
+        width = self.width
+
+        child = 0
+        position = offset = 0
+        for offset, size in self._levels:
+            low = offset + child * width
+            high = min(low + width, offset + size)
+            position = bisect_left(tree, target, low, high)
+            if position == high:
+                # Only possible at the root: target is above every key
+                return -1
+            child = position - offset
+
+        if tree and tree[position] == target:
+            return position - offset
+        return -1
+
+    def search_many(self, targets: Sequence[T]) -> List[int]:
+        """
+        Search the tree for every target.
+
+        Args:
+            targets: Elements to search for
+
+        Returns:
+            List of indices (or -1) in the same order as targets
+        """
+        return [self.search(target) for target in targets]
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Report the memory held by the tree, excluding the records.
+
+        Returns:
+            Dictionary with the tree size in bytes
+        """
+        return {"index_memory": sys.getsizeof(self._tree)}
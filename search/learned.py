@@ -0,0 +1,221 @@
+"""
+Learned Index Module
+
+This module contains a two-stage recursive model index (RMI). Instead of
+assuming one global linear key distribution like interpolation search, it
+fits a root linear model that routes a key to one of many leaf linear
+models, each fitted to its own slice of the sorted keys. Every leaf records
+its largest prediction error, so a lookup predicts a position and finishes
+with a binary search bounded to that error window.
+Note: This engine requires a sorted array as input.
+"""
+
+from array import array
+from numbers import Real
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from search.engine import PreparedEngine
+from search.exponential import binary_search_bounded
+from search.interpolation import PrefixKeyEncoder
+
+T = TypeVar("T")
+
+# Default number of records per leaf model
+RECORDS_PER_LEAF = 64
+
+
+def _fit_line(xs: Sequence[float], ys: Sequence[float]) -> Tuple[float, float]:
+    """
+    Fit ys = slope * xs + intercept by least squares.
+
+    Args:
+        xs: Keys
+        ys: Positions
+
+    Returns:
+        Tuple containing (slope, intercept); a flat line through the mean
+        when all keys are equal
+    """
+    count = len(xs)
+    mean_x = sum(xs) / count
+    mean_y = sum(ys) / count
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if spread == 0:
+        return 0.0, mean_y
+
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+    return slope, mean_y - slope * mean_x
+
+
+class LearnedIndexSearcher(PreparedEngine):
+    """
+    Two-stage recursive model index over sorted numeric or string keys.
+
+    Numbers are used as keys directly; strings are mapped to order-preserving
+    integer keys with PrefixKeyEncoder, as in string interpolation search.
+    Strings sharing a long prefix get equal keys, and the error window of
+    their leaf covers all of them.
+    """
+
+    def __init__(
+        self,
+        records_per_leaf: int = RECORDS_PER_LEAF,
+        arr: Optional[Sequence[T]] = None,
+    ):
+        """
+        Create a searcher, optionally preparing it for a sorted array.
+
+        Args:
+            records_per_leaf: Average number of records each leaf model covers
+            arr: Sorted list to fit the model to
+        """
+        super().__init__()
+        self.records_per_leaf = records_per_leaf
+        self.__name__ = "learned_index_search"
+        self._key: Callable[[T], float] = float
+        self._root = (0.0, 0.0)
+        self._slopes = array("d")
+        self._intercepts = array("d")
+        self._below = array("q")
+        self._above = array("q")
+        self.total_probes = 0
+        self.total_queries = 0
+
+        if arr is not None:
+            self.prepare(arr)
+
+    def prepare(self, arr: Sequence[T]) -> None:
+        """
+        Fit the root and leaf models and record each leaf's error bounds.
+
+        Time complexity: O(n), paid once per dataset
+
+        Args:
+            arr: Sorted list to search in
+        """
+        n = len(arr)
+        if n and not isinstance(arr[0], Real):
+            self._key = PrefixKeyEncoder(arr).key
+        else:
+            self._key = float
+        keys = [self._key(value) for value in arr]
+        leaves = max(n // self.records_per_leaf, 1)
+
+        # The root maps a key to a leaf by scaling its predicted position
+        slope, intercept = _fit_line(keys, range(n)) if n else (0.0, 0.0)
+        self._root = (slope * leaves / max(n, 1), intercept * leaves / max(n, 1))
+
+        routed: List[List[int]] = [[] for _ in range(leaves)]
+        for position, key in enumerate(keys):
+            routed[self._leaf(key, leaves)].append(position)
+
+        self._slopes = array("d", [0.0]) * leaves
+        self._intercepts = array("d", [0.0]) * leaves
+        self._below = array("q", [0]) * leaves
+        self._above = array("q", [-1]) * leaves
+
+        for leaf, positions in enumerate(routed):
+            if not positions:
+                # No record is routed here, so every lookup is a miss
+                continue
+            slope, intercept = _fit_line([keys[i] for i in positions], positions)
+            self._slopes[leaf] = slope
+            self._intercepts[leaf] = intercept
+
+            errors = [
+                position - int(slope * keys[position] + intercept)
+                for position in positions
+            ]
+            self._below[leaf] = -min(errors)
+            self._above[leaf] = max(errors)
+
+        self._source = arr
+        self.reset_stats()
+
+    def _leaf(self, key: float, leaves: int) -> int:
+        """
+        Route a key to its leaf model.
+
+        Args:
+            key: Numeric key
+            leaves: Number of leaf models
+
+        Returns:
+            Leaf index in [0, leaves)
+        """
+        slope, intercept = self._root
+        return min(max(int(slope * key + intercept), 0), leaves - 1)
+
+    def window(self, target: T) -> Tuple[int, int]:
+        """
+        Predict the range of positions the target can be in.
+
+        Args:
+            target: Element to search for
+
+        Returns:
+            Tuple of (left, right) bounds, empty when left > right
+        """
+        key = self._key(target)
+        leaf = self._leaf(key, len(self._slopes))
+        predicted = int(self._slopes[leaf] * key + self._intercepts[leaf])
+
+        left = max(predicted - self._below[leaf], 0)
+        right = min(predicted + self._above[leaf], len(self._source) - 1)
+        return left, right
+
+    def reset_stats(self) -> None:
+        """Reset the probe counters."""
+        self.total_probes = 0
+        self.total_queries = 0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Report probes per query, model size and the largest error window.
+
+        Probes are the steps of the bounded binary search, which is at most
+        the bit length of the window size.
+
+        Returns:
+            Dictionary of statistics
+        """
+        queries = self.total_queries or 1
+        models = len(self._slopes) + 1
+        return {
+            "probes": self.total_probes / queries,
+            "model_size": models * 4 * 8,
+            "max_error": max(max(self._below, default=0), max(self._above, default=0)),
+        }
+
+    def search(self, target: T) -> int:
+        """
+        Predict the target's position and search inside the error window.
+
+        Time complexity: O(log e) for a largest leaf error e
+        Space complexity: O(1)
+
+        Args:
+            target: Element to search for
+
+        Returns:
+            Index of the element if found, -1 otherwise
+        """
+        if self._source is None or not len(self._source):
+            return -1
+
+        left, right = self.window(target)
+        self.total_probes += max(right - left + 1, 0).bit_length()
+        self.total_queries += 1
+        return binary_search_bounded(self._source, target, left, right)
+
+    def search_many(self, targets: Sequence[T]) -> List[int]:
+        """
+        Search the prepared array for every target.
+
+        Args:
+            targets: Elements to search for
+
+        Returns:
+            List of indices (or -1) in the same order as targets
+        """
+        return [self.search(target) for target in targets]
@@ -4,7 +4,9 @@ Linear Search Algorithms Module
 This module contains implementations of linear search algorithms.
 """
 
-from typing import List, TypeVar
+from typing import Dict, List, Optional, Sequence, TypeVar
+
+from search.engine import PreparedEngine
 
 T = TypeVar("T")
 
@@ -29,6 +31,23 @@ def linear_search(arr: List[T], target: T) -> int:
     return -1
 
 
+def linear_substring_search(arr: Sequence[str], pattern: str) -> List[int]:
+    """
+    Find every record containing a substring by testing each record with `in`.
+
+    Time complexity: O(n * m) for n records of length m
+    Space complexity: O(k) for k matching records
+
+    Args:
+        arr: List of strings to search in
+        pattern: Substring to search for
+
+    Returns:
+        Indices of the matching records, in ascending order
+    """
+    return [i for i, element in enumerate(arr) if pattern in element]
+
+
 def sentinel_linear_search(arr: List[T], target: T) -> int:
     """
     Implementation of sentinel linear search algorithm.
@@ -66,3 +85,144 @@ def sentinel_linear_search(arr: List[T], target: T) -> int:
         return i
     else:
         return -1
+
+
+def linear_search_many(arr: Sequence[T], targets: Sequence[T]) -> List[int]:
+    """
+    Batch variant of linear search.
+
+    All targets are resolved in a single pass over the array, so the cost is
+    O(n + m) instead of O(n * m) for m targets.
+
+    Args:
+        arr: List to search in
+        targets: Elements to search for (must be hashable)
+
+    Returns:
+        List of indices (or -1) in the same order as targets
+    """
+    results = [-1] * len(targets)
+
+    # Map each distinct target to the positions that asked for it
+    pending: Dict[T, List[int]] = {}
+    for i, target in enumerate(targets):
+        pending.setdefault(target, []).append(i)
+
+    for i, element in enumerate(arr):
+        positions = pending.pop(element, None)
+        if positions is not None:
+            for position in positions:
+                results[position] = i
+            if not pending:
+                break
+
+    return results
+
+
+def sentinel_linear_search_many(arr: Sequence[T], targets: Sequence[T]) -> List[int]:
+    """
+    Batch variant of sentinel linear search.
+
+    The array is copied once for the whole batch and the trailing sentinel
+    slot is overwritten for every target.
+
+    Args:
+        arr: List to search in
+        targets: Elements to search for
+
+    Returns:
+        List of indices (or -1) in the same order as targets
+    """
+    temp_arr = list(arr)
+    length = len(temp_arr)
+    temp_arr.append(None)
+
+    results = []
+    for target in targets:
+        temp_arr[length] = target
+
+        i = 0
+        while temp_arr[i] != target:
+            i += 1
+
+        results.append(i if i < length else -1)
+
+    return results
+
+
+class SentinelSearcher(PreparedEngine):
+    """
+    Prepared sentinel linear search.
+
+    The searcher owns a private copy of the array with one reserved trailing
+    slot. Each query writes the target into that slot and restores it
+    afterwards, so no per-query copy or append is needed.
+    """
+
+    def __init__(self, arr: Optional[Sequence[T]] = None):
+        """
+        Create a searcher, optionally preparing it for an array.
+
+        Args:
+            arr: List to prepare the buffer from
+        """
+        super().__init__()
+        self.__name__ = "prepared_sentinel_search"
+        self._buffer: List[Optional[T]] = [None]
+        self._length = 0
+
+        if arr is not None:
+            self.prepare(arr)
+
+    def prepare(self, arr: Sequence[T]) -> None:
+        """
+        Copy the array into the buffer and reserve the sentinel slot.
+
+        Time complexity: O(n), paid once per dataset
+
+        Args:
+            arr: List to search in
+        """
+        self._buffer = list(arr)
+        self._length = len(self._buffer)
+        self._buffer.append(None)
+        self._source = arr
+
+    def search(self, target: T) -> int:
+        """
+        Search the prepared buffer using the sentinel slot.
+
+        Time complexity: O(n)
+        Space complexity: O(1)
+
+        Args:
+            target: Element to search for
+
+        Returns:
+            Index of the element if found, -1 otherwise
+        """
+        buffer = self._buffer
+        length = self._length
+
+        buffer[length] = target
+
+        i = 0
+        while buffer[i] != target:
+            i += 1
+
+        # Restore the slot so the buffer does not keep the target alive
+        buffer[length] = None
+
+        return i if i < length else -1
+
+    def search_many(self, targets: Sequence[T]) -> List[int]:
+        """
+        Search the prepared buffer for every target.
+
+        Args:
+            targets: Elements to search for
+
+        Returns:
+            List of indices (or -1) in the same order as targets
+        """
+        return [self.search(target) for target in targets]
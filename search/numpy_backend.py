@@ -0,0 +1,170 @@
+"""
+NumPy Search Backend Module
+
+This module contains vectorized equivalents of the pure-Python search
+algorithms. The dataset is stored once as a NumPy array (fixed-width
+unicode, bytes or numeric) and searched with NumPy primitives.
+Note: This module requires numpy to be installed.
+"""
+
+from typing import Any, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+# Largest boolean matrix (targets x records) built by one batched scan
+SCAN_CELLS = 2**22
+
+
+def to_numpy_array(data: Iterable[Any], dtype: Optional[str] = None) -> np.ndarray:
+    """
+    Convert a dataset into a NumPy array.
+
+    Args:
+        data: Records to convert
+        dtype: Optional NumPy dtype; "bytes" encodes strings as UTF-8 fixed-width
+               bytes, None infers fixed-width unicode or numeric
+
+    Returns:
+        One-dimensional NumPy array holding the records
+    """
+    items = list(data)
+    if dtype == "bytes":
+        return np.array([str(item).encode("utf-8") for item in items], dtype=np.bytes_)
+    if not items and dtype is None:
+        # An empty list would otherwise default to float64
+        dtype = np.str_
+    return np.asarray(items, dtype=dtype)
+
+
+def _coerce_target(arr: np.ndarray, target: Any) -> Any:
+    """
+    Convert a target to a scalar comparable with the array's dtype.
+
+    Unicode targets are left untouched so that a target wider than the
+    array's fixed width is not truncated into a false match.
+
+    Args:
+        arr: Array the target will be compared against
+        target: Element to search for
+
+    Returns:
+        Target converted to a matching scalar type
+    """
+    kind = arr.dtype.kind
+    if kind == "S" and isinstance(target, str):
+        return target.encode("utf-8")
+    if kind == "f":
+        return float(target)
+    if kind in "iu":
+        return int(target)
+    return target
+
+
+def _coerce_targets(arr: np.ndarray, targets: Sequence[Any]) -> np.ndarray:
+    """
+    Convert a batch of targets to an array comparable with arr.
+
+    Args:
+        arr: Array the targets will be compared against
+        targets: Elements to search for
+
+    Returns:
+        NumPy array of targets
+    """
+    if isinstance(targets, np.ndarray):
+        return targets
+    return np.asarray([_coerce_target(arr, target) for target in targets])
+
+
+def numpy_linear_search(arr: np.ndarray, target: Any) -> int:
+    """
+    Vectorized linear search using an equality scan over the whole array.
+
+    Time complexity: O(n), executed in native code
+    Space complexity: O(n) for the boolean mask
+
+    Args:
+        arr: NumPy array to search in
+        target: Element to search for
+
+    Returns:
+        Index of the first match if found, -1 otherwise
+    """
+    matches = np.flatnonzero(arr == _coerce_target(arr, target))
+    return int(matches[0]) if matches.size else -1
+
+
+def numpy_binary_search(arr: np.ndarray, target: Any) -> int:
+    """
+    Binary search based on numpy.searchsorted.
+
+    Time complexity: O(log n)
+    Space complexity: O(1)
+
+    Args:
+        arr: Sorted NumPy array to search in
+        target: Element to search for
+
+    Returns:
+        Index of the element if found, -1 otherwise
+    """
+    target = _coerce_target(arr, target)
+    index = int(np.searchsorted(arr, target))
+    if index < arr.size and arr[index] == target:
+        return index
+    return -1
+
+
+def numpy_linear_search_many(arr: np.ndarray, targets: Sequence[Any]) -> List[int]:
+    """
+    Batch variant of the vectorized linear search.
+
+    Each chunk of targets is compared with the whole array in one broadcast
+    equality scan, and the first match per target is found with argmax. The
+    chunks are sized so that the boolean matrix stays below SCAN_CELLS.
+
+    Time complexity: O(n * m) for m targets, executed in native code
+    Space complexity: O(SCAN_CELLS) for the boolean matrix
+
+    Args:
+        arr: NumPy array to search in
+        targets: Elements to search for
+
+    Returns:
+        List of indices (or -1) in the same order as targets
+    """
+    queries = _coerce_targets(arr, targets)
+    if arr.size == 0:
+        return [-1] * len(queries)
+
+    rows = max(SCAN_CELLS // arr.size, 1)
+    results: List[int] = []
+    for start in range(0, len(queries), rows):
+        matches = arr[np.newaxis, :] == queries[start : start + rows, np.newaxis]
+        first = matches.argmax(axis=1)
+        found = matches[np.arange(len(first)), first]
+        results.extend(np.where(found, first, -1).tolist())
+
+    return results
+
+
+def numpy_binary_search_many(arr: np.ndarray, targets: Sequence[Any]) -> List[int]:
+    """
+    Batch binary search using a single vectorized numpy.searchsorted call.
+
+    Args:
+        arr: Sorted NumPy array to search in
+        targets: Elements to search for
+
+    Returns:
+        List of indices (or -1) in the same order as targets
+    """
+    queries = _coerce_targets(arr, targets)
+    if arr.size == 0:
+        return [-1] * len(queries)
+
+    positions = np.searchsorted(arr, queries)
+    clipped = np.minimum(positions, arr.size - 1)
+    found = (positions < arr.size) & (arr[clipped] == queries)
+
+    return np.where(found, clipped, -1).tolist()
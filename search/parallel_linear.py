@@ -0,0 +1,251 @@
+"""
+Parallel Linear Search Module
+
+This module contains a multi-core linear search for unsorted data. The
+dataset is published once to shared memory and split into contiguous
+chunks, each scanned in place by its own worker process.
+"""
+
+import multiprocessing
+import os
+import weakref
+from typing import List, Optional, Sequence
+
+from dataset.shared import SharedRecords, SharedRecordsHandle, SharedRecordsView
+from search.engine import PreparedEngine
+
+# Records scanned between checks of the cancellation flag
+BLOCK_SIZE = 4096
+
+# Value of the "lowest matching chunk" flag while no chunk has matched
+NO_MATCH = 2**62
+
+
+def _scan(
+    records: SharedRecordsView,
+    offset: int,
+    chunk: int,
+    query: int,
+    target: str,
+    generation,
+    found,
+) -> Optional[int]:
+    """
+    Linearly scan one chunk, giving up as soon as a lower chunk has matched.
+
+    Args:
+        records: Shared view of the chunk
+        offset: Index of the chunk's first record in the dataset
+        chunk: Chunk number (lower chunks hold lower indices)
+        query: Generation number of the query this scan belongs to
+        target: Element to search for
+        generation: Shared query counter
+        found: Shared lowest chunk number that matched the current query
+
+    Returns:
+        Dataset index of the first match in the chunk, -1 if none, or None
+        if the scan was cancelled
+    """
+    n = len(records)
+
+    for block_start in range(0, n, BLOCK_SIZE):
+        if generation.value != query or found.value < chunk:
+            return None
+
+        index = records.find(target, block_start, block_start + BLOCK_SIZE)
+        if index != -1:
+            with found.get_lock():
+                if generation.value == query and chunk < found.value:
+                    found.value = chunk
+            return offset + index
+
+    return -1
+
+
+def _worker_main(
+    connection,
+    handle: SharedRecordsHandle,
+    start: int,
+    stop: int,
+    chunk: int,
+    generation,
+    found,
+) -> None:
+    """
+    Worker loop: attach to one chunk in shared memory, then answer queries.
+
+    Args:
+        connection: Pipe end used to receive queries and send results
+        handle: Shared dataset handle
+        start: First record index of the chunk
+        stop: Record index the chunk ends at (exclusive)
+        chunk: Chunk number
+        generation: Shared query counter
+        found: Shared lowest chunk number that matched the current query
+    """
+    with SharedRecordsView(handle, start, stop) as records:
+        connection.send(True)
+
+        while True:
+            message = connection.recv()
+            if message is None:
+                break
+            query, target = message
+            connection.send(
+                (query, _scan(records, start, chunk, query, target, generation, found))
+            )
+
+    connection.close()
+
+
+def _stop_workers(connections: List, processes: List[multiprocessing.Process]) -> None:
+    """
+    Ask the workers to exit and wait for them, terminating stragglers.
+
+    A module-level function, so the finalizer calling it holds no reference
+    to the engine.
+
+    Args:
+        connections: Pipe ends of the workers
+        processes: Worker processes
+    """
+    for connection in connections:
+        try:
+            connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        connection.close()
+    for process in processes:
+        process.join(timeout=1)
+        if process.is_alive():
+            process.terminate()
+
+
+class ParallelLinearSearcher(PreparedEngine):
+    """
+    Multi-core chunked linear search.
+
+    prepare() publishes the dataset to shared memory and starts one worker
+    per chunk; each worker scans only its own contiguous range, in place. A
+    query is
+    broadcast to all workers; once a chunk matches, higher chunks stop
+    scanning at their next block boundary, and the lowest matching index is
+    returned, exactly like linear_search.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        """
+        Create a searcher.
+
+        Args:
+            workers: Number of worker processes (default: CPU count)
+        """
+        super().__init__()
+        self.__name__ = "parallel_linear_search"
+        self.workers = workers or os.cpu_count() or 1
+        self._processes: List[multiprocessing.Process] = []
+        self._connections: List = []
+        self._generation = multiprocessing.Value("q", 0)
+        self._found = multiprocessing.Value("q", NO_MATCH)
+        self._finalizer: Optional[weakref.finalize] = None
+
+    def prepare(self, arr: Sequence[str]) -> None:
+        """
+        Publish the dataset to shared memory and start the workers.
+
+        Time complexity: O(n), paid once per dataset
+
+        Args:
+            arr: List of strings to search in
+        """
+        self.close()
+        # Stops the workers started below when the engine is collected or
+        # the interpreter exits
+        self._finalizer = weakref.finalize(
+            self, _stop_workers, self._connections, self._processes
+        )
+
+        n = len(arr)
+        count = max(min(self.workers, n), 1)
+        bounds = [n * i // count for i in range(count + 1)]
+
+        with SharedRecords(arr) as shared:
+            for chunk in range(count):
+                parent_end, child_end = multiprocessing.Pipe()
+                process = multiprocessing.Process(
+                    target=_worker_main,
+                    args=(
+                        child_end,
+                        shared.handle,
+                        bounds[chunk],
+                        bounds[chunk + 1],
+                        chunk,
+                        self._generation,
+                        self._found,
+                    ),
+                    daemon=True,
+                )
+                process.start()
+                child_end.close()
+                self._processes.append(process)
+                self._connections.append(parent_end)
+
+            # Workers attach before the segment is unlinked; their mappings
+            # stay valid until they detach
+            for connection in self._connections:
+                connection.recv()
+
+        self._source = arr
+
+    def search(self, target: str) -> int:
+        """
+        Search all chunks in parallel.
+
+        Time complexity: O(n / workers) plus dispatch overhead
+        Space complexity: O(1)
+
+        Args:
+            target: Element to search for
+
+        Returns:
+            Lowest index of the element if found, -1 otherwise
+        """
+        with self._found.get_lock():
+            self._generation.value += 1
+            self._found.value = NO_MATCH
+        query = self._generation.value
+
+        for connection in self._connections:
+            connection.send((query, target))
+
+        # Every worker answers each query once; chunks are in index order
+        best = -1
+        for connection in self._connections:
+            _, result = connection.recv()
+            if best == -1 and result is not None and result != -1:
+                best = result
+
+        return best
+
+    def search_many(self, targets: Sequence[str]) -> List[int]:
+        """
+        Search all chunks for every target.
+
+        Args:
+            targets: Elements to search for
+
+        Returns:
+            List of indices (or -1) in the same order as targets
+        """
+        return [self.search(target) for target in targets]
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        if self._finalizer is not None:
+            # Runs _stop_workers once and unregisters it
+            self._finalizer()
+            self._finalizer = None
+
+        self._connections = []
+        self._processes = []
+        self._source = None
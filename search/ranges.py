@@ -0,0 +1,351 @@
+"""
+Range Query Module
+
+This module contains range queries on sorted data, built on the bisection
+core of search.binary and search.exponential: the span of records equal to
+a target, records starting with a prefix and records between two values.
+Ranges are returned as slice objects or RangeView objects over the sorted
+list, so answering a query never copies the matching records.
+Note: All these functions require a sorted array as input.
+"""
+
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from search.binary import lower_bound, upper_bound
+from search.exponential import binary_search_bounded
+
+T = TypeVar("T")
+
+# A bound function takes (arr, target, lo, hi) and returns an index in [lo, hi]
+Bound = Callable[[Sequence[T], T, int, int], int]
+
+
+class RangeView(Sequence):
+    """Read-only view of arr[start:stop] that reads through to arr."""
+
+    __slots__ = ("arr", "start", "stop")
+
+    def __init__(self, arr: Sequence[T], span: slice):
+        """
+        Wrap a span of a sorted list.
+
+        Args:
+            arr: Sorted list the span refers to
+            span: Slice with explicit start and stop, e.g. from equal_range
+        """
+        self.arr = arr
+        self.start, self.stop, _ = span.indices(len(arr))
+        self.stop = max(self.stop, self.start)
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("RangeView only supports contiguous slices")
+            return RangeView(
+                self.arr, slice(self.start + start, self.start + max(stop, start))
+            )
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("RangeView index out of range")
+        return self.arr[self.start + index]
+
+    def __iter__(self) -> Iterator[T]:
+        return map(self.arr.__getitem__, range(self.start, self.stop))
+
+    def __repr__(self) -> str:
+        return f"RangeView(start={self.start}, stop={self.stop})"
+
+    def indices(self) -> range:
+        """Positions of the viewed records in the sorted list."""
+        return range(self.start, self.stop)
+
+
+def prefix_end(
+    arr: Sequence[str], prefix: str, lo: int = 0, hi: Optional[int] = None
+) -> int:
+    """
+    Find the first position in arr[lo:hi] past every record starting with prefix.
+
+    Records are compared on their first len(prefix) characters, which are
+    sorted whenever the records are.
+
+    Time complexity: O(log n)
+    Space complexity: O(1)
+
+    Args:
+        arr: Sorted list of strings to search in
+        prefix: Prefix to search for
+        lo: First index of the searched slice
+        hi: End of the searched slice (default: len(arr))
+
+    Returns:
+        Index between lo and hi
+    """
+    width = len(prefix)
+    left, right = lo, len(arr) if hi is None else hi
+
+    while left < right:
+        mid = left + (right - left) // 2
+
+        if prefix < arr[mid][:width]:
+            right = mid
+        else:
+            left = mid + 1
+
+    return left
+
+
+def equal_range(
+    arr: Sequence[T], target: T, lo: int = 0, hi: Optional[int] = None
+) -> slice:
+    """
+    Find the span of records equal to target.
+
+    A bounded binary search finds any match first; the two bounds are then
+    searched only on either side of it. A missing target yields the empty
+    span at its insertion point.
+
+    Time complexity: O(log n)
+    Space complexity: O(1)
+
+    Args:
+        arr: Sorted list to search in
+        target: Element to search for
+        lo: First index of the searched slice
+        hi: End of the searched slice (default: len(arr))
+
+    Returns:
+        Slice of arr holding every copy of target
+    """
+    hi = len(arr) if hi is None else hi
+    hit = binary_search_bounded(arr, target, lo, hi - 1)
+
+    if hit == -1:
+        position = lower_bound(arr, target, lo, hi)
+        return slice(position, position)
+
+    return slice(
+        lower_bound(arr, target, lo, hit), upper_bound(arr, target, hit + 1, hi)
+    )
+
+
+def count_equal(arr: Sequence[T], target: T) -> int:
+    """
+    Count the records equal to target.
+
+    Time complexity: O(log n)
+    Space complexity: O(1)
+
+    Args:
+        arr: Sorted list to search in
+        target: Element to count
+
+    Returns:
+        Number of copies of target
+    """
+    span = equal_range(arr, target)
+    return span.stop - span.start
+
+
+def prefix_range(arr: Sequence[str], prefix: str) -> slice:
+    """
+    Find the span of records starting with prefix.
+
+    An empty prefix matches every record.
+
+    Time complexity: O(log n)
+    Space complexity: O(1)
+
+    Args:
+        arr: Sorted list of strings to search in
+        prefix: Prefix to search for
+
+    Returns:
+        Slice of arr holding every record that starts with prefix
+    """
+    start = lower_bound(arr, prefix)
+    return slice(start, prefix_end(arr, prefix, start))
+
+
+def value_range(arr: Sequence[T], low: T, high: T) -> slice:
+    """
+    Find the span of records between low and high, both inclusive.
+
+    Time complexity: O(log n)
+    Space complexity: O(1)
+
+    Args:
+        arr: Sorted list to search in
+        low: Smallest value in the range
+        high: Largest value in the range
+
+    Returns:
+        Slice of arr holding every record in [low, high]; empty if high < low
+    """
+    start = lower_bound(arr, low)
+    return slice(start, max(start, upper_bound(arr, high, start)))
+
+
+def iter_range(arr: Sequence[T], span: slice) -> Iterator[T]:
+    """
+    Lazily yield the records of a span.
+
+    Args:
+        arr: Sorted list the span refers to
+        span: Slice from one of the range queries
+
+    Returns:
+        Iterator over arr[span] that does not copy it
+    """
+    return iter(RangeView(arr, span))
+
+
+def _gallop(
+    arr: Sequence[T],
+    target: T,
+    lo: int,
+    ahead: Callable[[T, T], bool],
+    bound: Bound,
+) -> int:
+    """
+    Find a bound at or after lo by galloping forward, then bisecting.
+
+    Probes lo, lo + 1, lo + 3, lo + 7, ... until one is no longer ahead of
+    the answer, so a nearby answer costs only a few comparisons.
+
+    Args:
+        arr: Sorted list to search in
+        target: Element or prefix to search for
+        lo: Index the answer is known not to precede
+        ahead: Tells whether a record lies before the answer
+        bound: Bound function searching the final window
+
+    Returns:
+        Same index as bound(arr, target, lo, len(arr))
+    """
+    n = len(arr)
+    step = 1
+    while lo + step - 1 < n and ahead(arr[lo + step - 1], target):
+        step *= 2
+
+    return bound(arr, target, lo + step // 2, min(lo + step - 1, n))
+
+
+def _below(value: T, target: T) -> bool:
+    """Whether value lies before the lower bound of target."""
+    return value < target
+
+
+def _not_above(value: T, target: T) -> bool:
+    """Whether value lies before the upper bound of target."""
+    return not target < value
+
+
+def _prefix_not_above(value: str, prefix: str) -> bool:
+    """Whether value lies before the end of the records starting with prefix."""
+    return not prefix < value[: len(prefix)]
+
+
+def _sorted_order(queries: Sequence[T]) -> List[int]:
+    """Positions of queries in ascending order of the query."""
+    return sorted(range(len(queries)), key=queries.__getitem__)
+
+
+def equal_range_many(arr: Sequence[T], targets: Sequence[T]) -> List[slice]:
+    """
+    Batch variant of equal_range.
+
+    Targets are processed in sorted order so that each range gallops forward
+    from the start of the previous one.
+
+    Args:
+        arr: Sorted list to search in
+        targets: Elements to search for
+
+    Returns:
+        List of slices in the same order as targets
+    """
+    results: List[slice] = [slice(0, 0)] * len(targets)
+    lo = 0
+
+    for i in _sorted_order(targets):
+        start = _gallop(arr, targets[i], lo, _below, lower_bound)
+        stop = _gallop(arr, targets[i], start, _not_above, upper_bound)
+        results[i] = slice(start, stop)
+        lo = start
+
+    return results
+
+
+def count_equal_many(arr: Sequence[T], targets: Sequence[T]) -> List[int]:
+    """
+    Batch variant of count_equal.
+
+    Args:
+        arr: Sorted list to search in
+        targets: Elements to count
+
+    Returns:
+        List of counts in the same order as targets
+    """
+    return [span.stop - span.start for span in equal_range_many(arr, targets)]
+
+
+def prefix_range_many(arr: Sequence[str], prefixes: Sequence[str]) -> List[slice]:
+    """
+    Batch variant of prefix_range.
+
+    Prefixes are processed in sorted order so that each range gallops
+    forward from the start of the previous one.
+
+    Args:
+        arr: Sorted list of strings to search in
+        prefixes: Prefixes to search for
+
+    Returns:
+        List of slices in the same order as prefixes
+    """
+    results: List[slice] = [slice(0, 0)] * len(prefixes)
+    lo = 0
+
+    for i in _sorted_order(prefixes):
+        start = _gallop(arr, prefixes[i], lo, _below, lower_bound)
+        stop = _gallop(arr, prefixes[i], start, _prefix_not_above, prefix_end)
+        results[i] = slice(start, stop)
+        lo = start
+
+    return results
+
+
+def value_range_many(arr: Sequence[T], ranges: Sequence[Tuple[T, T]]) -> List[slice]:
+    """
+    Batch variant of value_range.
+
+    Ranges are processed in order of their low end so that each start
+    gallops forward from the previous one; the end is bisected as the
+    ranges may be arbitrarily wide.
+
+    Args:
+        arr: Sorted list to search in
+        ranges: (low, high) pairs, both ends inclusive
+
+    Returns:
+        List of slices in the same order as ranges
+    """
+    lows = [low for low, _ in ranges]
+    results: List[slice] = [slice(0, 0)] * len(ranges)
+    lo = 0
+
+    for i in _sorted_order(lows):
+        start = _gallop(arr, lows[i], lo, _below, lower_bound)
+        stop = upper_bound(arr, ranges[i][1], start)
+        results[i] = slice(start, max(start, stop))
+        lo = start
+
+    return results
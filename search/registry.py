@@ -0,0 +1,242 @@
+"""
+Algorithm Registry Module
+
+This module contains the lazy mapping behind ALGORITHMS and
+BATCH_ALGORITHMS. Entries are registered as loaders and built on first
+access, so a run imports only the search modules it actually uses.
+
+Engines from other packages register through the "search_benchmark.algorithms"
+entry point group, e.g. in the plugin's pyproject.toml:
+
+    [project.entry-points."search_benchmark.algorithms"]
+    my_search = "my_package.search:MySearcher"
+
+The entry point names either a search function called as func(arr, target)
+or an engine class, instantiated without arguments, that follows the
+prepare/search/batch protocol of the built-in engines; subclassing
+search.engine.PreparedEngine provides __call__ and batch. A truthy
+`needs_sorted` attribute marks it as requiring sorted input. Installed
+distributions are only scanned when a name is not registered or the whole
+registry is listed.
+"""
+
+from collections.abc import MutableMapping
+from functools import lru_cache, partial
+from importlib import import_module
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+# Entry point group scanned for third-party algorithms
+ENTRY_POINT_GROUP = "search_benchmark.algorithms"
+
+Loader = Callable[[], Any]
+
+
+class _Pending:
+    """Loader of a registry entry that has not been built yet."""
+
+    __slots__ = ("load",)
+
+    def __init__(self, load: Loader):
+        self.load = load
+
+
+class LazyRegistry(MutableMapping):
+    """
+    Mapping from names to values built by their loader on first access.
+
+    Listing names, membership tests and deletion never build an entry.
+    The discover callable, if any, is consulted once: the first time a name
+    is missing or the registry is listed. Names it returns are appended
+    after the registered ones and never replace them.
+    """
+
+    def __init__(
+        self,
+        loaders: Dict[str, Loader],
+        discover: Optional[Callable[[], Dict[str, Loader]]] = None,
+    ):
+        """
+        Create a registry.
+
+        Args:
+            loaders: Loader for each name, in listing order
+            discover: Called once to find more loaders, e.g. from entry points
+        """
+        self._entries: Dict[str, Any] = {
+            name: _Pending(load) for name, load in loaders.items()
+        }
+        self._discover = discover
+        self.discovered: List[str] = []
+
+    def register(self, name: str, load: Loader) -> None:
+        """
+        Add or replace an entry without building it.
+
+        Args:
+            name: Entry name
+            load: Called without arguments on first access to build the value
+        """
+        self._entries[name] = _Pending(load)
+
+    def _run_discovery(self) -> None:
+        """Add the discovered loaders, the first time only."""
+        if self._discover is None:
+            return
+        discover, self._discover = self._discover, None
+
+        for name, load in discover().items():
+            if name not in self._entries:
+                self._entries[name] = _Pending(load)
+                self.discovered.append(name)
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._entries:
+            self._run_discovery()
+        entry = self._entries[name]
+        if isinstance(entry, _Pending):
+            entry = self._entries[name] = entry.load()
+        return entry
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        self._entries[name] = value
+
+    def __delitem__(self, name: str) -> None:
+        del self._entries[name]
+
+    def __contains__(self, name: object) -> bool:
+        if name not in self._entries:
+            self._run_discovery()
+        return name in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        self._run_discovery()
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        self._run_discovery()
+        return len(self._entries)
+
+
+def _import_attribute(module: str, attribute: str) -> Any:
+    """
+    Import a module and return one of its attributes.
+
+    Args:
+        module: Module path
+        attribute: Attribute name
+
+    Returns:
+        The attribute
+    """
+    return getattr(import_module(module), attribute)
+
+
+def _build_engine(module: str, cls: str, args: Sequence, kwargs: Dict) -> Any:
+    """
+    Import an engine class and instantiate it.
+
+    Args:
+        module: Module path
+        cls: Class name
+        args: Positional constructor arguments
+        kwargs: Keyword constructor arguments
+
+    Returns:
+        The engine
+    """
+    return _import_attribute(module, cls)(*args, **kwargs)
+
+
+def function_loader(module: str, name: str) -> Loader:
+    """
+    Create a loader for a search function.
+
+    Args:
+        module: Module path, e.g. "search.binary"
+        name: Function name
+
+    Returns:
+        Loader importing the function
+    """
+    return partial(_import_attribute, module, name)
+
+
+def engine_loader(module: str, cls: str, *args: Any, **kwargs: Any) -> Loader:
+    """
+    Create a loader for a prepared engine.
+
+    Args:
+        module: Module path, e.g. "search.layout"
+        cls: Engine class name
+        *args: Positional constructor arguments
+        **kwargs: Keyword constructor arguments
+
+    Returns:
+        Loader importing the class and building one engine
+    """
+    return partial(_build_engine, module, cls, args, kwargs)
+
+
+@lru_cache(maxsize=None)
+def plugin_entry_points(group: str = ENTRY_POINT_GROUP) -> Dict[str, Any]:
+    """
+    Find the installed algorithm plugins.
+
+    Args:
+        group: Entry point group
+
+    Returns:
+        Entry point for each plugin name
+    """
+    # Scanning installed distributions is slow, so only do it on demand
+    from importlib.metadata import entry_points
+
+    return {entry_point.name: entry_point for entry_point in entry_points(group=group)}
+
+
+def load_plugin(name: str, group: str = ENTRY_POINT_GROUP) -> Callable:
+    """
+    Load a plugin, instantiating it if the entry point names a class.
+
+    Args:
+        name: Plugin name
+        group: Entry point group
+
+    Returns:
+        Search function or engine called as algorithm(arr, target)
+
+    Raises:
+        TypeError: If the plugin is not callable as a search function
+    """
+    algorithm = plugin_entry_points(group)[name].load()
+    if isinstance(algorithm, type):
+        algorithm = algorithm()
+    if not callable(algorithm):
+        raise TypeError(f"Plugin {name} is not a search function or engine")
+    if not hasattr(algorithm, "__name__"):
+        algorithm.__name__ = name
+    return algorithm
+
+
+def batch_function(algorithm: Callable) -> Callable:
+    """
+    Find the batch variant of a search function or engine.
+
+    Engines provide one as their batch method; for anything else the
+    targets are searched one call at a time.
+
+    Args:
+        algorithm: Search function or engine
+
+    Returns:
+        Batch search function called as batch(arr, targets)
+    """
+    batch = getattr(algorithm, "batch", None)
+    if batch is not None:
+        return batch
+
+    def search_many(arr: Sequence, targets: Sequence) -> List[int]:
+        return [algorithm(arr, target) for target in targets]
+
+    search_many.__name__ = f"{algorithm.__name__}_many"
+    return search_many
@@ -0,0 +1,342 @@
+"""
+Suffix Array Module
+
+This module contains a prepared substring index. All records are joined
+into one text with a separator, the suffixes of that text are sorted once
+into a suffix array, and an LCP array records how many leading characters
+each suffix shares with the one before it. A substring query is a binary
+search for the first suffix starting with the pattern; the LCP array then
+tells whether the next suffix starts with it too, so a unique match needs
+no second search for the end. Every match is mapped back to its record.
+"""
+
+import sys
+from array import array
+from itertools import repeat
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from search.engine import PreparedEngine
+
+# Joins the records; sorts before every other character and may not occur
+# in any record
+SEPARATOR = "\x00"
+
+
+def _int_array(values: Sequence[int], largest: int) -> array:
+    """
+    Store ints in a flat array of the smallest sufficient signed type.
+
+    Args:
+        values: Values to store
+        largest: Upper bound on the values
+
+    Returns:
+        Array of 4-byte ints, or 8-byte ints for large texts
+    """
+    return array("i" if largest < 2**31 else "q", values)
+
+
+def build_suffix_array(text: str) -> Tuple[List[int], List[int]]:
+    """
+    Sort the suffixes of a text by prefix doubling.
+
+    Every round sorts the suffixes by the ranks of their first 2k characters,
+    formed from the pair of ranks of their first k characters and of the k
+    characters after that, until all ranks differ. The number of rounds grows
+    with the length of the longest repeated substring.
+
+    Time complexity: O(n log^2 n) in the worst case
+    Space complexity: O(n)
+
+    Args:
+        text: Text to index
+
+    Returns:
+        Tuple containing (suffix start positions in sorted order, rank of
+        each position, i.e. the inverse of the suffix array)
+    """
+    n = len(text)
+    rank = list(map(ord, text))
+    suffixes = list(range(n))
+    step = 1
+
+    while n:
+        # Suffixes ending before i + step sort first among equal prefixes
+        shifted = rank[step:] + [-1] * min(step, n)
+        base = max(rank) + 2
+        keys = [first * base + second + 1 for first, second in zip(rank, shifted)]
+        suffixes.sort(key=keys.__getitem__)
+
+        current = 0
+        previous = keys[suffixes[0]]
+        for position in suffixes:
+            if keys[position] != previous:
+                current += 1
+                previous = keys[position]
+            rank[position] = current
+
+        if current == n - 1:
+            break
+        step *= 2
+
+    return suffixes, rank
+
+
+def build_lcp_array(text: str, suffixes: List[int], rank: List[int]) -> List[int]:
+    """
+    Compute longest common prefixes of adjacent suffixes (Kasai's algorithm).
+
+    Suffixes are visited in text order, so the common prefix found for one
+    suffix shrinks by at most one for the next and is never recounted.
+
+    Time complexity: O(n)
+    Space complexity: O(n)
+
+    Args:
+        text: Indexed text
+        suffixes: Suffix array of text
+        rank: Inverse of the suffix array
+
+    Returns:
+        lcp[i]: length of the common prefix of suffixes i - 1 and i (0 for i = 0)
+    """
+    n = len(text)
+    lcp = [0] * n
+    common = 0
+
+    for position in range(n):
+        if rank[position] == 0:
+            common = 0
+            continue
+
+        other = suffixes[rank[position] - 1]
+        while (
+            position + common < n
+            and other + common < n
+            and text[position + common] == text[other + common]
+        ):
+            common += 1
+        lcp[rank[position]] = common
+
+        if common:
+            common -= 1
+
+    return lcp
+
+
+class SuffixArraySearcher(PreparedEngine):
+    """
+    Substring lookup through a suffix array built once per dataset.
+
+    Separator suffixes sort first and never match a pattern, so they are
+    dropped after construction. The suffix and LCP arrays hold one entry per
+    record character, the owner array one per text character naming the
+    record it belongs to, all as flat 4-byte ints for texts below 2**31
+    characters.
+
+    Called as an (arr, pattern) search function it returns every matching
+    record, like linear_substring_search; search() and batch() report the
+    first matching record of each pattern.
+    """
+
+    def __init__(self, arr: Optional[Sequence[str]] = None):
+        """
+        Create a searcher, optionally preparing it for an array.
+
+        Args:
+            arr: List of strings to build the index for
+        """
+        super().__init__()
+        self.__name__ = "suffix_array_search"
+        self._text = ""
+        self._suffixes = array("i")
+        self._lcp = array("i")
+        self._owners = array("i")
+        self.nbytes = 0
+
+        if arr is not None:
+            self.prepare(arr)
+
+    def prepare(self, arr: Sequence[str]) -> None:
+        """
+        Build the suffix and LCP arrays over the joined records.
+
+        Time complexity: O(n log^2 n) for n characters, paid once per dataset
+
+        Args:
+            arr: List of strings to search in
+
+        Raises:
+            ValueError: If a record contains SEPARATOR
+        """
+        text = "".join(record + SEPARATOR for record in arr)
+        if text.count(SEPARATOR) != len(arr):
+            raise ValueError("Records may not contain the NUL separator")
+
+        owners = _int_array([], len(arr))
+        for index, record in enumerate(arr):
+            owners.extend(repeat(index, len(record) + 1))
+
+        suffixes, rank = build_suffix_array(text)
+        lcp = build_lcp_array(text, suffixes, rank)
+
+        # One separator per record, sorted ahead of every other suffix
+        skip = len(arr)
+        self._source = arr
+        self._text = text
+        self._suffixes = _int_array(suffixes[skip:], len(text))
+        self._lcp = _int_array(lcp[skip:], len(text))
+        self._owners = owners
+        self.nbytes = sys.getsizeof(text) + sum(
+            values.itemsize * len(values)
+            for values in (self._suffixes, self._lcp, self._owners)
+        )
+
+    def _first_suffix(self, pattern: str, lo: int = 0) -> int:
+        """
+        Find the first suffix from lo on, in sorted order, not below pattern.
+
+        Only the first len(pattern) characters of each suffix are compared.
+
+        Args:
+            pattern: Substring to search for
+            lo: First position in the suffix array to consider
+
+        Returns:
+            Position in the suffix array
+        """
+        text = self._text
+        suffixes = self._suffixes
+        width = len(pattern)
+        left, right = lo, len(suffixes)
+
+        while left < right:
+            mid = left + (right - left) // 2
+            start = suffixes[mid]
+
+            if text[start : start + width] < pattern:
+                left = mid + 1
+            else:
+                right = mid
+
+        return left
+
+    def _end_suffix(self, pattern: str, lo: int = 0) -> int:
+        """
+        Find the first suffix from lo on, in sorted order, past every suffix
+        starting with pattern.
+
+        Args:
+            pattern: Substring to search for
+            lo: First position in the suffix array to consider
+
+        Returns:
+            Position in the suffix array
+        """
+        text = self._text
+        suffixes = self._suffixes
+        width = len(pattern)
+        left, right = lo, len(suffixes)
+
+        while left < right:
+            mid = left + (right - left) // 2
+            start = suffixes[mid]
+
+            if pattern < text[start : start + width]:
+                right = mid
+            else:
+                left = mid + 1
+
+        return left
+
+    def occurrences(self, pattern: str) -> range:
+        """
+        Find the span of the suffix array whose suffixes start with pattern.
+
+        The binary search finds the first match. If the LCP with the next
+        suffix is shorter than the pattern, the match is unique and no
+        second search is needed; otherwise the end is searched for too.
+
+        Time complexity: O(m log n) for a pattern of length m
+
+        Args:
+            pattern: Non-empty substring to search for
+
+        Returns:
+            Positions in the suffix array, empty if pattern does not occur
+        """
+        suffixes = self._suffixes
+        width = len(pattern)
+        first = self._first_suffix(pattern)
+        if first == len(suffixes):
+            return range(first, first)
+
+        start = suffixes[first]
+        if self._text[start : start + width] != pattern:
+            return range(first, first)
+
+        end = first + 1
+        if end < len(suffixes) and self._lcp[end] >= width:
+            end = self._end_suffix(pattern, end + 1)
+
+        return range(first, end)
+
+    def find_all(self, pattern: str) -> List[int]:
+        """
+        Find every record containing pattern.
+
+        Time complexity: O(m log n + k log k) for k occurrences
+
+        Args:
+            pattern: Substring to search for; the empty string matches every
+                     record
+
+        Returns:
+            Indices of the matching records, in ascending order
+        """
+        if not pattern:
+            return list(range(len(self._source or ())))
+        if SEPARATOR in pattern:
+            return []
+
+        span = self.occurrences(pattern)
+        starts = self._suffixes[span.start : span.stop]
+        return sorted(set(map(self._owners.__getitem__, starts)))
+
+    def search(self, pattern: str) -> int:
+        """
+        Find the first record containing pattern.
+
+        Args:
+            pattern: Substring to search for
+
+        Returns:
+            Index of the first matching record if any, -1 otherwise
+        """
+        records = self.find_all(pattern)
+        return records[0] if records else -1
+
+    def search_many(self, patterns: Sequence[str]) -> List[int]:
+        """
+        Find the first record containing each pattern.
+
+        Args:
+            patterns: Substrings to search for
+
+        Returns:
+            List of record indices (or -1) in the same order as patterns
+        """
+        return [self.search(pattern) for pattern in patterns]
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Report the memory held by the index, including the joined text.
+
+        Returns:
+            Dictionary with the index size in bytes
+        """
+        return {"index_memory": self.nbytes}
+
+    def __call__(self, arr: Sequence[str], pattern: str) -> List[int]:
+        self._prepared_for(arr)
+        return self.find_all(pattern)
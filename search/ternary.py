@@ -5,7 +5,9 @@ This module contains implementation of ternary search algorithm.
 Note: This algorithm requires a sorted array as input.
 """
 
-from typing import List, TypeVar
+from typing import List, Sequence, Tuple, TypeVar
+
+from search.batch import sorted_search_many
 
 T = TypeVar("T")
 
@@ -54,3 +56,52 @@ def ternary_search(arr: List[T], target: T) -> int:
 
     # Element not found
     return -1
+
+
+def _ternary_search_from(arr: List[T], target: T, lo: int) -> Tuple[int, int]:
+    """
+    Ternary search restricted to arr[lo:].
+
+    Args:
+        arr: Sorted list to search in
+        target: Element to search for
+        lo: Index to start the search from
+
+    Returns:
+        Tuple of (index or -1, lower bound for the next larger target)
+    """
+    left, right = lo, len(arr) - 1
+
+    while left <= right:
+        mid1 = left + (right - left) // 3
+        mid2 = right - (right - left) // 3
+
+        if arr[mid1] == target:
+            return mid1, mid1
+        if arr[mid2] == target:
+            return mid2, mid2
+
+        if target < arr[mid1]:
+            right = mid1 - 1
+        elif target > arr[mid2]:
+            left = mid2 + 1
+        else:
+            left = mid1 + 1
+            right = mid2 - 1
+
+    # Everything before left is smaller than target
+    return -1, left
+
+
+def ternary_search_many(arr: Sequence[T], targets: Sequence[T]) -> List[int]:
+    """
+    Batch variant of ternary search.
+
+    Args:
+        arr: Sorted list to search in
+        targets: Elements to search for
+
+    Returns:
+        List of indices (or -1) in the same order as targets
+    """
+    return sorted_search_many(_ternary_search_from, arr, targets)
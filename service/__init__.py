@@ -0,0 +1,8 @@
+"""
+Lookup Service Package
+
+This package contains an asyncio lookup server for the search engines and
+a local load generator to measure it under concurrent load.
+"""
+
+# This file makes the 'service' directory a Python package
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Load Generator Module
+
+This module contains a closed-loop load generator for the lookup server.
+For each concurrency level it opens that many connections, each sending
+one lookup and waiting for its answer before sending the next, and reports
+throughput and p50/p99/p99.9 latency. Queries are drawn from the data file
+with the same seeded workload profiles as --workload.
+
+Run from the repository root, against a running server or one started for
+the measurement with --spawn:
+
+    python3 -m service.loadgen -f data.txt --spawn -a binary -c 1 4 16 64
+"""
+
+import argparse
+import asyncio
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from bench.workload import generate_workload, parse_profile
+from main import ALGORITHMS, console, format_time, load_data, percentile
+from service.server import DEFAULT_HOST, DEFAULT_PORT, ERROR_PREFIX
+
+# Default concurrency levels
+DEFAULT_CONCURRENCY = [1, 4, 16, 64]
+
+# Default number of requests per concurrency level
+DEFAULT_REQUESTS = 5000
+
+# Latency percentiles reported per level
+LOAD_PERCENTILES = (50, 99, 99.9)
+
+# Directory the spawned server is started from, so `-m service.server` resolves
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Seconds to wait for a spawned server to start listening
+SPAWN_TIMEOUT = 60.0
+
+
+async def _client(
+    host: str, port: int, targets: Sequence[str], latencies: List[float]
+) -> int:
+    """
+    Send lookups one at a time over one connection.
+
+    Args:
+        host: Server address
+        port: Server port
+        targets: Lookups to send, in order
+        latencies: List to append each request's latency to
+
+    Returns:
+        Number of hits
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    counter = time.perf_counter
+    found = 0
+    try:
+        for target in targets:
+            start_time = counter()
+            writer.write(target.encode("utf-8") + b"\n")
+            await writer.drain()
+            line = await reader.readline()
+            latencies.append(counter() - start_time)
+
+            if not line:
+                raise ConnectionError("Server closed the connection")
+            if line.startswith(ERROR_PREFIX):
+                raise RuntimeError(f"Server error: {line.decode('utf-8').strip()}")
+            if int(line) != -1:
+                found += 1
+    finally:
+        writer.close()
+    return found
+
+
+async def run_level(
+    host: str, port: int, stream: Sequence[str], concurrency: int
+) -> Dict[str, float]:
+    """
+    Replay a query stream over concurrent connections.
+
+    The stream is dealt round-robin to the connections.
+
+    Args:
+        host: Server address
+        port: Server port
+        stream: Lookups to send
+        concurrency: Number of connections
+
+    Returns:
+        Dictionary with throughput and latency percentiles
+    """
+    latencies: List[float] = []
+    start_time = time.perf_counter()
+    found = await asyncio.gather(
+        *(
+            _client(host, port, stream[i::concurrency], latencies)
+            for i in range(concurrency)
+        )
+    )
+    elapsed = time.perf_counter() - start_time
+
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "found": sum(found),
+        "throughput": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        **{f"p{p}": percentile(latencies, p) for p in LOAD_PERCENTILES},
+    }
+
+
+def spawn_server(
+    data_file: str, algorithm: str, host: str, port: int
+) -> subprocess.Popen:
+    """
+    Start a lookup server in a child process and wait until it listens.
+
+    Args:
+        data_file: Path to the data file to serve
+        algorithm: Algorithm name from ALGORITHMS
+        host: Address to bind
+        port: Port to bind
+
+    Returns:
+        The server process
+
+    Raises:
+        RuntimeError: If the server exits or does not listen in time
+    """
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "service.server",
+            "-f",
+            str(Path(data_file).resolve()),
+            "-a",
+            algorithm,
+            "--host",
+            host,
+            "--port",
+            str(port),
+        ],
+        cwd=REPO_ROOT,
+        stdout=subprocess.DEVNULL,
+    )
+
+    deadline = time.monotonic() + SPAWN_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("Lookup server exited during startup")
+        try:
+            socket.create_connection((host, port)).close()
+            return process
+        except OSError:
+            time.sleep(0.1)
+
+    process.kill()
+    raise RuntimeError("Lookup server did not start listening in time")
+
+
+def display_load_table(results: List[Dict], title: str) -> None:
+    """
+    Display throughput and latency per concurrency level.
+
+    Args:
+        results: Results from run_level
+        title: Table title
+    """
+    from rich.table import Table
+
+    table = Table(title=title)
+
+    table.add_column("Concurrency", style="cyan")
+    table.add_column("Requests", style="yellow")
+    table.add_column("Found", style="yellow")
+    table.add_column("Requests/s", style="magenta")
+    for p in LOAD_PERCENTILES:
+        table.add_column(f"p{p:g} Latency", style="red")
+
+    for result in results:
+        table.add_row(
+            str(result["concurrency"]),
+            f"{result['requests']:,}",
+            f"{result['found']:,}",
+            f"{result['throughput']:,.0f}",
+            *(format_time(result[f"p{p}"]) for p in LOAD_PERCENTILES),
+        )
+
+    console.print(table)
+
+
+def main() -> int:
+    """
+    Parse arguments, generate the query stream and measure each level.
+    """
+    parser = argparse.ArgumentParser(
+        description="Measure a lookup server under growing concurrency"
+    )
+    parser.add_argument(
+        "-f",
+        "--file",
+        type=str,
+        default="data.txt",
+        help="Data file to draw queries from (default: data.txt)",
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        default=DEFAULT_HOST,
+        help=f"Server address (default: {DEFAULT_HOST})",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help=f"Server port (default: {DEFAULT_PORT})",
+    )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=DEFAULT_CONCURRENCY,
+        help="Concurrent connections per level "
+        f"(default: {' '.join(map(str, DEFAULT_CONCURRENCY))})",
+    )
+    parser.add_argument(
+        "-n",
+        "--requests",
+        type=int,
+        default=DEFAULT_REQUESTS,
+        help=f"Requests per level (default: {DEFAULT_REQUESTS})",
+    )
+    parser.add_argument(
+        "-w",
+        "--workload",
+        type=str,
+        default="uniform",
+        help="Workload preset or custom spec for the queries (default: uniform)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed for the queries (default: 0)",
+    )
+    parser.add_argument(
+        "--spawn",
+        action="store_true",
+        help="Start a server on the data file for the measurement",
+    )
+    parser.add_argument(
+        "-a",
+        "--algorithm",
+        type=str,
+        default="binary",
+        choices=[name for name in ALGORITHMS if name != "all"],
+        help="Algorithm of the spawned server (default: binary)",
+    )
+
+    args = parser.parse_args()
+    process: Optional[subprocess.Popen] = None
+
+    try:
+        if any(level < 1 for level in args.concurrency):
+            raise ValueError("Concurrency levels must be positive")
+        profile = parse_profile(args.workload)
+        data = load_data(args.file)
+        stream = generate_workload(sorted(data), profile, args.requests, args.seed)
+
+        if args.spawn:
+            console.print(f"[bold]Starting {args.algorithm} server...[/]")
+            process = spawn_server(args.file, args.algorithm, args.host, args.port)
+
+        results = []
+        for level in args.concurrency:
+            console.print(f"Running {level} connection(s)...")
+            results.append(asyncio.run(run_level(args.host, args.port, stream, level)))
+
+        display_load_table(
+            results,
+            f"Lookup server at {args.host}:{args.port}, "
+            f"workload {profile.name} ({profile.describe()})",
+        )
+
+    except Exception as e:
+        console.print(f"[bold red]An error occurred:[/] {str(e)}")
+        return 1
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
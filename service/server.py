@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Lookup Server Module
+
+This module contains an asyncio TCP server that loads a dataset once and
+answers lookups with any engine from ALGORITHMS. The protocol is one
+UTF-8 target per line in, one index per line out (-1 for a miss). A
+request that cannot be answered (invalid UTF-8, a failing search) gets an
+"ERR <reason>" line instead, and the connection stays open.
+
+Requests from all connections go through one queue. A single batcher task
+takes everything queued (up to --max-batch), runs one batched search over
+the distinct targets and resolves every waiting request, so concurrent
+clients share the per-call overhead instead of paying it one by one.
+
+Run from the repository root:
+
+    python3 -m service.server -f data.txt -a binary --port 8765
+"""
+
+import argparse
+import asyncio
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from main import (
+    ALGORITHMS,
+    BATCH_ALGORITHMS,
+    DEFAULT_CACHE_DIR,
+    LOADERS,
+    console,
+    format_time,
+    load_dataset,
+    needs_sorted,
+    prepare_algorithm,
+)
+
+# Default address; the server is meant for local measurements only
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Default maximum number of requests answered by one batched search
+DEFAULT_MAX_BATCH = 256
+
+# Start of the response line for a request that failed
+ERROR_PREFIX = b"ERR"
+
+
+class LookupServer:
+    """Coalesces concurrent lookups into batched searches over one dataset."""
+
+    def __init__(
+        self,
+        batch_search: Callable[[Sequence[str], Sequence[str]], List[int]],
+        data: Sequence[str],
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_delay: float = 0.0,
+    ):
+        """
+        Create a server for a prepared dataset.
+
+        Args:
+            batch_search: Batch search function called as batch_search(data, targets)
+            data: Dataset to search in
+            max_batch: Maximum number of requests per batched search
+            max_delay: Seconds to wait after the first request of a batch for
+                       more to arrive (0 batches only what is already queued)
+
+        Raises:
+            ValueError: If max_batch is not positive or max_delay is negative
+        """
+        if max_batch < 1:
+            raise ValueError("Batch size must be positive")
+        if max_delay < 0:
+            raise ValueError("Batch delay cannot be negative")
+
+        self.batch_search = batch_search
+        self.data = data
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.requests = 0
+        self.batches = 0
+        self.searches = 0
+        self._queue: Optional[asyncio.Queue] = None
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Answer the lookups of one connection in order.
+
+        Requests that fail are answered with an error line; only a lost
+        connection ends the loop.
+
+        Args:
+            reader: Stream of request lines
+            writer: Stream for response lines
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                try:
+                    target = line.decode("utf-8").strip()
+                    future = loop.create_future()
+                    self._queue.put_nowait((target, future))
+                    response = b"%d\n" % await future
+                except Exception as e:
+                    # One bad request must not cost the client its connection
+                    reason = f"{type(e).__name__}: {e}".replace("\n", " ")
+                    response = ERROR_PREFIX + b" " + reason.encode("utf-8") + b"\n"
+
+                writer.write(response)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_batches(self) -> None:
+        """Run one batched search per group of queued requests, forever."""
+        queue = self._queue
+        while True:
+            pending: List[Tuple[str, asyncio.Future]] = [await queue.get()]
+            if self.max_delay:
+                await asyncio.sleep(self.max_delay)
+            while len(pending) < self.max_batch and not queue.empty():
+                pending.append(queue.get_nowait())
+
+            # Identical concurrent lookups are searched once
+            targets = list(dict.fromkeys(target for target, _ in pending))
+            try:
+                results = dict(zip(targets, self.batch_search(self.data, targets)))
+            except Exception as e:
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for target, future in pending:
+                    if not future.done():
+                        future.set_result(results[target])
+
+            self.requests += len(pending)
+            self.searches += len(targets)
+            self.batches += 1
+
+            # Let the connections write responses and queue new requests
+            await asyncio.sleep(0)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Report how well requests were coalesced.
+
+        Returns:
+            Dictionary of request, batch and search counts and mean batch size
+        """
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "searches": self.searches,
+            "mean_batch": self.requests / self.batches if self.batches else 0.0,
+        }
+
+    async def serve(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        ready: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Accept connections until cancelled.
+
+        Args:
+            host: Address to bind
+            port: Port to bind
+            ready: Called once the server is listening
+        """
+        self._queue = asyncio.Queue()
+        batcher = asyncio.create_task(self._serve_batches())
+        server = await asyncio.start_server(self._handle, host, port)
+        try:
+            async with server:
+                if ready is not None:
+                    ready()
+                await server.serve_forever()
+        finally:
+            batcher.cancel()
+
+
+def main() -> int:
+    """
+    Parse arguments, load and prepare the dataset and serve lookups.
+    """
+    parser = argparse.ArgumentParser(
+        description="Serve lookups on a dataset over TCP, one target per line"
+    )
+    parser.add_argument(
+        "-f",
+        "--file",
+        type=str,
+        default="data.txt",
+        help="Path to the data file (default: data.txt)",
+    )
+    parser.add_argument(
+        "-a",
+        "--algorithm",
+        type=str,
+        default="binary",
+        choices=[name for name in ALGORITHMS if name != "all"],
+        help="Search algorithm to serve (default: binary)",
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        default=DEFAULT_HOST,
+        help=f"Address to bind (default: {DEFAULT_HOST})",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help=f"Port to bind (default: {DEFAULT_PORT})",
+    )
+    parser.add_argument(
+        "--max-batch",
+        type=int,
+        default=DEFAULT_MAX_BATCH,
+        help="Maximum number of requests per batched search "
+        f"(default: {DEFAULT_MAX_BATCH})",
+    )
+    parser.add_argument(
+        "--max-delay",
+        type=float,
+        default=0.0,
+        help="Seconds to wait for more requests before searching a batch "
+        "(default: 0, batch only what is already queued)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Directory for dataset snapshots (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always parse and sort the data file instead of using snapshots",
+    )
+    parser.add_argument(
+        "-l",
+        "--loader",
+        type=str,
+        default="text",
+        choices=LOADERS,
+        help="Dataset loader: list of str or lazy memory-mapped view (default: text)",
+    )
+
+    args = parser.parse_args()
+    server = None
+
+    try:
+        cache_dir = None if args.no_cache else args.cache_dir
+        sorted_input = needs_sorted([args.algorithm])
+        data, sorted_data = load_dataset(
+            args.file, sorted_input, cache_dir, args.loader
+        )
+        dataset = sorted_data if sorted_input else data
+
+        build_time = prepare_algorithm(ALGORITHMS[args.algorithm], dataset)
+        if build_time is not None:
+            console.print(f"[green]Prepared index in {format_time(build_time)}.[/]")
+
+        server = LookupServer(
+            BATCH_ALGORITHMS[args.algorithm], dataset, args.max_batch, args.max_delay
+        )
+
+        def ready() -> None:
+            console.print(
+                f"[bold cyan]Serving {args.algorithm} on {args.host}:{args.port}[/]"
+            )
+
+        asyncio.run(server.serve(args.host, args.port, ready))
+
+    except KeyboardInterrupt:
+        if server is None:
+            return 1
+        stats = server.stats()
+        console.print(
+            f"\n[bold]Served {stats['requests']:,} requests in "
+            f"{stats['batches']:,} batches (mean batch {stats['mean_batch']:.1f}, "
+            f"{stats['searches']:,} distinct searches).[/]"
+        )
+    except Exception as e:
+        console.print(f"[bold red]An error occurred:[/] {str(e)}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,106 @@
+"""Tests for the batch (*_many) search API."""
+
+import random
+
+import pytest
+
+from search.batch import sorted_search_many
+from search.binary import (
+    binary_search,
+    binary_search_many,
+    meta_binary_search,
+    meta_binary_search_many,
+    ubiquitous_binary,
+    ubiquitous_binary_many,
+)
+from search.exponential import exponential_search, exponential_search_many
+from search.fibonacci import fibonacci_search, fibonacci_search_many
+from search.interpolation import interpolation_search, interpolation_search_many
+from search.jump import jump_search, jump_search_many
+from search.linear import (
+    linear_search,
+    linear_search_many,
+    sentinel_linear_search,
+    sentinel_linear_search_many,
+)
+from search.ternary import ternary_search, ternary_search_many
+
+SORTED_PAIRS = [
+    (binary_search, binary_search_many),
+    (meta_binary_search, meta_binary_search_many),
+    (ubiquitous_binary, ubiquitous_binary_many),
+    (exponential_search, exponential_search_many),
+    (fibonacci_search, fibonacci_search_many),
+    (jump_search, jump_search_many),
+    (ternary_search, ternary_search_many),
+    (interpolation_search, interpolation_search_many),
+]
+
+
+def random_case(rng):
+    """A sorted list with duplicates and targets inside and outside it."""
+    arr = sorted(rng.randrange(30) for _ in range(rng.randrange(1, 40)))
+    targets = [rng.randrange(-2, 33) for _ in range(rng.randrange(15))]
+    return arr, targets
+
+
+def assert_valid(arr, targets, results):
+    """Every result points at a copy of its target, or is -1 for a miss."""
+    assert len(results) == len(targets)
+    for target, result in zip(targets, results):
+        if target in arr:
+            assert arr[result] == target
+        else:
+            assert result == -1
+
+
+@pytest.mark.parametrize(
+    "single, many", SORTED_PAIRS, ids=[many.__name__ for _, many in SORTED_PAIRS]
+)
+def test_sorted_batches_find_every_target(single, many):
+    rng = random.Random(many.__name__)
+    for _ in range(200):
+        arr, targets = random_case(rng)
+        assert_valid(arr, targets, many(arr, targets))
+        assert_valid(arr, targets, [single(arr, target) for target in targets])
+
+
+@pytest.mark.parametrize("many", [many for _, many in SORTED_PAIRS])
+def test_sorted_batches_on_empty_input(many):
+    assert many([], [1, 2]) == [-1, -1]
+    assert many([1, 2, 3], []) == []
+
+
+@pytest.mark.parametrize(
+    "single, many",
+    [
+        (linear_search, linear_search_many),
+        (sentinel_linear_search, sentinel_linear_search_many),
+    ],
+)
+def test_linear_batches_return_first_occurrence(single, many):
+    rng = random.Random(5)
+    arr = [rng.randrange(20) for _ in range(60)]
+    targets = [rng.randrange(-1, 22) for _ in range(40)]
+
+    expected = [arr.index(t) if t in arr else -1 for t in targets]
+    assert many(arr, targets) == expected
+    assert [single(arr, t) for t in targets] == expected
+
+
+def test_linear_batch_handles_repeated_targets():
+    assert linear_search_many(["b", "a", "b"], ["b", "b", "c", "a"]) == [0, 0, -1, 1]
+
+
+def test_sorted_search_many_carries_the_bound_forward():
+    calls = []
+
+    def step(arr, target, lo):
+        calls.append((target, lo))
+        index = arr.index(target) if target in arr else -1
+        return index, max(lo, index)
+
+    arr = [10, 20, 30, 40]
+    assert sorted_search_many(step, arr, [40, 10, 30, 25]) == [3, 0, 2, -1]
+    # Targets are visited in ascending order, each starting where the last ended
+    assert calls == [(10, 0), (25, 0), (30, 0), (40, 2)]
@@ -0,0 +1,37 @@
+"""Tests for the lower_bound and upper_bound primitives."""
+
+import random
+from bisect import bisect_left, bisect_right
+
+import pytest
+
+from search.binary import lower_bound, upper_bound
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_bounds_match_bisect(seed):
+    rng = random.Random(seed)
+    arr = sorted(rng.randrange(10) for _ in range(rng.randrange(30)))
+
+    for target in range(-1, 11):
+        assert lower_bound(arr, target) == bisect_left(arr, target)
+        assert upper_bound(arr, target) == bisect_right(arr, target)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_bounds_respect_lo_and_hi(seed):
+    rng = random.Random(seed)
+    arr = sorted(rng.randrange(10) for _ in range(30))
+    lo = rng.randrange(31)
+    hi = rng.randrange(lo, 31)
+
+    for target in range(-1, 11):
+        assert lower_bound(arr, target, lo, hi) == bisect_left(arr, target, lo, hi)
+        assert upper_bound(arr, target, lo, hi) == bisect_right(arr, target, lo, hi)
+
+
+def test_bounds_on_strings():
+    arr = ["apple", "fig", "fig", "kiwi"]
+    assert (lower_bound(arr, "fig"), upper_bound(arr, "fig")) == (1, 3)
+    assert (lower_bound(arr, "banana"), upper_bound(arr, "banana")) == (1, 1)
+    assert lower_bound([], "x") == upper_bound([], "x") == 0
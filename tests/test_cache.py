@@ -0,0 +1,153 @@
+"""Tests for the result caches and the cached search wrapper."""
+
+import random
+
+import pytest
+
+from search.binary import binary_search
+from search.cache import (
+    MISSING,
+    POLICIES,
+    ARCCache,
+    CachedSearch,
+    LFUCache,
+    LRUCache,
+)
+from search.linear import linear_search
+
+
+def access(cache, key):
+    """Read a key through the cache as CachedSearch does; True on a hit."""
+    if cache.get(key) is not MISSING:
+        return True
+    cache.put(key, key * 10)
+    return False
+
+
+def key_stream(seed, length=2000, keys=40):
+    rng = random.Random(seed)
+    # Skewed towards small keys, so there are hot and cold entries
+    return [int(rng.paretovariate(1.2)) % keys for _ in range(length)]
+
+
+@pytest.mark.parametrize("capacity", [1, 3, 8])
+def test_lru_evicts_least_recently_used(capacity):
+    cache = LRUCache(capacity)
+    model = []
+
+    for key in key_stream(capacity):
+        assert access(cache, key) == (key in model)
+        if key in model:
+            model.remove(key)
+        elif len(model) == capacity:
+            model.pop(0)
+        model.append(key)
+        assert len(cache) == len(model)
+
+
+@pytest.mark.parametrize("capacity", [1, 3, 8])
+def test_lfu_evicts_least_frequently_used(capacity):
+    cache = LFUCache(capacity)
+    frequency = {}
+    last_use = {}
+
+    for time, key in enumerate(key_stream(capacity)):
+        assert access(cache, key) == (key in frequency)
+        if key not in frequency and len(frequency) == capacity:
+            # Least frequent first, then least recently used
+            victim = min(frequency, key=lambda k: (frequency[k], last_use[k]))
+            del frequency[victim]
+        frequency[key] = frequency.get(key, 0) + 1
+        last_use[key] = time
+        assert len(cache) == len(frequency)
+
+
+@pytest.mark.parametrize("capacity", [1, 2, 5, 16])
+def test_arc_stays_within_capacity(capacity):
+    cache = ARCCache(capacity)
+    cached = set()
+
+    for key in key_stream(capacity, length=5000):
+        assert access(cache, key) == (key in cached)
+        cached = set(cache._t1) | set(cache._t2)
+        assert len(cache) <= capacity
+        assert len(cache) + len(cache._b1) + len(cache._b2) <= 2 * capacity
+        assert 0 <= cache._p <= capacity
+        assert cache.get(key) == key * 10
+
+
+def test_arc_keeps_frequent_keys_through_a_scan():
+    cache = ARCCache(4)
+    for _ in range(3):
+        for key in (1, 2):
+            access(cache, key)
+    # A one-off scan evicts from the recency side only
+    for key in range(100, 120):
+        access(cache, key)
+    assert access(cache, 1) and access(cache, 2)
+
+
+@pytest.mark.parametrize("policy", POLICIES)
+def test_cached_search_returns_uncached_results(policy):
+    data = [f"key{i:03d}" for i in range(200)]
+    search = CachedSearch(linear_search, policy, capacity=16)
+    targets = [f"key{i:03d}" for i in key_stream(5, length=500, keys=220)]
+
+    assert search.batch(data, targets) == [linear_search(data, t) for t in targets]
+    stats = search.stats()
+    assert search.hits + search.misses == len(targets)
+    assert 0 < stats["hit_rate"] < 1
+    assert search.__name__ == f"{policy}_cached_linear_search"
+
+
+class VersionedList(list):
+    version = 0
+
+
+def test_cached_search_notices_changed_data():
+    data = VersionedList([1, 3, 5])
+    search = CachedSearch(linear_search, "lru")
+
+    assert search(data, 4) == -1
+    data.append(4)
+    assert search(data, 4) == 3
+    # An in-place change is only visible through the version
+    data[3] = 7
+    data.version += 1
+    assert search(data, 4) == -1
+    assert search.misses == 3
+
+    # A different dataset object starts with a cold cache as well
+    assert search(VersionedList([9, 4]), 4) == 1
+    assert search.misses == 4
+
+
+@pytest.mark.parametrize("policy, capacity", [("fifo", 8), ("lru", 0)])
+def test_rejects_invalid_configuration(policy, capacity):
+    with pytest.raises(ValueError):
+        CachedSearch(binary_search, policy, capacity)
+
+
+def test_workload_hit_rate_counts_one_cold_pass():
+    from main import benchmark_workload
+
+    data = [f"key{i:03d}" for i in range(300)]
+    stream = [data[i % 50] for i in range(400)]
+    search = CachedSearch(linear_search, "lru", 2000)
+
+    result = benchmark_workload("cached", search, data, stream, "test", 3, 0.001)
+    assert result["hit_rate"] == (len(stream) - 50) / len(stream)
+    assert result["found"] == len(stream)
+
+
+def test_batch_hit_rate_counts_one_cold_pass():
+    from main import benchmark_batch
+
+    data = [f"key{i:03d}" for i in range(300)]
+    targets = [data[i % 50] for i in range(400)] + ["missing"] * 10
+    search = CachedSearch(linear_search, "arc", 2000)
+
+    result = benchmark_batch(
+        "cached", search, search.batch, data, targets, 3, quiet=True
+    )
+    assert result["hit_rate"] == (len(targets) - 51) / len(targets)
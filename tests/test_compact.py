@@ -0,0 +1,70 @@
+"""Tests for the contiguous string store."""
+
+import pytest
+
+from dataset.compact import CompactStringArray, memory_footprint
+from search.binary import binary_search
+from search.fibonacci import fibonacci_search
+from search.jump import jump_search
+from search.linear import linear_search, sentinel_linear_search
+from search.ternary import ternary_search
+
+WORDS = ["delta", "", "älg", "alpha", "charlie", "bravo", "alpha"]
+
+
+def test_behaves_like_a_list():
+    store = CompactStringArray(WORDS)
+
+    assert len(store) == len(WORDS)
+    assert list(store) == WORDS
+    assert store[2] == "älg"
+    assert store[-1] == "alpha"
+    assert store[1:4] == WORDS[1:4]
+    assert store[::-3] == WORDS[::-3]
+    for index in (len(WORDS), -len(WORDS) - 1):
+        with pytest.raises(IndexError):
+            store[index]
+
+
+def test_copy_is_independent():
+    store = CompactStringArray(WORDS)
+    copy = store.copy()
+    copy.append("echo")
+
+    assert list(copy) == WORDS + ["echo"]
+    assert list(store) == WORDS
+
+
+@pytest.mark.parametrize(
+    "algorithm", [binary_search, ternary_search, jump_search, fibonacci_search]
+)
+def test_sorted_algorithms_run_on_the_store(algorithm):
+    data = sorted(set(WORDS))
+    store = CompactStringArray(data)
+
+    for target in data + ["aardvark", "zulu"]:
+        assert algorithm(store, target) == algorithm(data, target)
+
+
+@pytest.mark.parametrize("algorithm", [linear_search, sentinel_linear_search])
+def test_linear_algorithms_run_on_the_store(algorithm):
+    store = CompactStringArray(WORDS)
+    for target in WORDS + ["zulu"]:
+        assert algorithm(store, target) == algorithm(WORDS, target)
+
+
+def test_store_is_smaller_than_a_list():
+    words = [f"record-{i:06d}" for i in range(10000)]
+    assert memory_footprint(CompactStringArray(words)) < memory_footprint(words) / 2
+
+
+def test_shared_containers_count_once():
+    words = [f"record-{i}" for i in range(100)]
+    store = CompactStringArray(words)
+    seen = set()
+
+    assert memory_footprint(store, seen) == store.nbytes
+    assert memory_footprint(store, seen) == 0
+    # A list sharing its records with an already counted list adds only itself
+    first = memory_footprint(words, seen)
+    assert memory_footprint(list(words), seen) < first
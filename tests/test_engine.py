@@ -0,0 +1,55 @@
+"""Tests for the prepared-engine base class."""
+
+import pytest
+
+from search.engine import PreparedEngine
+
+
+class ListEngine(PreparedEngine):
+    """Minimal engine that records how often it was prepared."""
+
+    def __init__(self):
+        super().__init__()
+        self.prepared = 0
+
+    def prepare(self, arr):
+        self.prepared += 1
+        self._source = arr
+
+    def search(self, target):
+        return self._source.index(target) if target in self._source else -1
+
+    def search_many(self, targets):
+        return [self.search(target) for target in targets]
+
+
+def test_prepares_once_per_array_object():
+    engine = ListEngine()
+    first, second = ["a", "b"], ["b", "a"]
+
+    assert engine(first, "b") == 1
+    assert engine(first, "c") == -1
+    assert engine.batch(first, ["a", "b"]) == [0, 1]
+    assert engine.prepared == 1
+
+    assert engine(second, "b") == 0
+    # An equal but distinct list is a different dataset
+    assert engine.batch(list(first), ["b"]) == [1]
+    assert engine.prepared == 3
+
+
+def test_stats_default_to_empty():
+    assert ListEngine().stats() == {}
+
+
+@pytest.mark.parametrize("missing", ["prepare", "search", "search_many"])
+def test_incomplete_engine_fails_on_creation(missing):
+    methods = {
+        name: getattr(ListEngine, name)
+        for name in ("prepare", "search", "search_many")
+        if name != missing
+    }
+    Incomplete = type("Incomplete", (PreparedEngine,), methods)
+
+    with pytest.raises(TypeError):
+        Incomplete()
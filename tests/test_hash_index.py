@@ -0,0 +1,49 @@
+"""Tests for the hash-index engine."""
+
+import random
+
+import pytest
+
+from search.hash_index import HashIndexSearcher
+from search.linear import linear_search
+
+DATA = ["pear", "apple", "fig", "apple", "kiwi", "pear", "plum"]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_finds_first_occurrence(compact):
+    searcher = HashIndexSearcher(compact, DATA)
+    for target in DATA + ["grape", ""]:
+        assert searcher.search(target) == linear_search(DATA, target)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_search_many_matches_search(compact):
+    searcher = HashIndexSearcher(compact, DATA)
+    targets = ["plum", "apple", "grape", "pear"]
+    assert searcher.search_many(targets) == [searcher.search(t) for t in targets]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_large_table_with_collisions(compact):
+    rng = random.Random(1)
+    data = [str(rng.randrange(5000)) for _ in range(3000)]
+    searcher = HashIndexSearcher(compact)
+    targets = [str(i) for i in range(5000)]
+    first = {}
+    for index, value in enumerate(data):
+        first.setdefault(value, index)
+
+    assert searcher.batch(data, targets) == [first.get(t, -1) for t in targets]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_empty_array(compact):
+    assert HashIndexSearcher(compact, []).search("x") == -1
+
+
+def test_compact_index_is_smaller():
+    data = [f"record-{i}" for i in range(10_000)]
+    plain = HashIndexSearcher(False, data).stats()["index_memory"]
+    compact = HashIndexSearcher(True, data).stats()["index_memory"]
+    assert 0 < compact < plain
@@ -0,0 +1,97 @@
+"""Tests for result export and the append-only run history."""
+
+import csv
+import json
+import math
+
+import pytest
+
+from bench.history import (
+    SCHEMA_VERSION,
+    append_history,
+    export_record,
+    json_ready,
+    load_baseline,
+    load_history,
+    result_record,
+)
+
+RESULTS = [
+    {"algorithm": "binary", "median_time": 1e-6, "samples": [1e-6, 2e-6]},
+    {"algorithm": "hash_index", "median_time": 2e-7, "break_even": math.inf},
+]
+
+
+def record(mode="batch", fingerprint="abc"):
+    return result_record(mode, RESULTS, {"dataset_fingerprint": fingerprint})
+
+
+def test_json_ready():
+    assert json_ready({1: (math.inf, math.nan, 2.5), "x": [None, b"y"]}) == {
+        "1": [None, None, 2.5],
+        "x": [None, "b'y'"],
+    }
+
+
+def test_record_carries_schema_and_environment():
+    run = record()
+    assert run["schema"] == SCHEMA_VERSION
+    assert run["mode"] == "batch"
+    assert "python" in json.dumps(run["environment"]).lower()
+    assert run["results"][1]["break_even"] is None
+
+
+def test_json_export_round_trips(tmp_path):
+    run = record()
+    path = tmp_path / "out" / "run.json"
+    export_record(run, path)
+    assert json.loads(path.read_text(encoding="utf-8")) == run
+
+
+def test_csv_export_has_one_row_per_result(tmp_path):
+    path = tmp_path / "run.csv"
+    export_record(record(), path)
+    with open(path, newline="", encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+
+    assert [row["algorithm"] for row in rows] == ["binary", "hash_index"]
+    assert "samples" not in rows[0]
+    assert rows[1]["dataset_fingerprint"] == "abc"
+
+
+def test_export_rejects_other_formats(tmp_path):
+    with pytest.raises(ValueError):
+        export_record(record(), tmp_path / "run.txt")
+
+
+def test_history_appends_and_skips_torn_lines(tmp_path):
+    path = tmp_path / "history.jsonl"
+    assert load_history(path) == []
+
+    append_history(record("single"), path)
+    with open(path, "a", encoding="utf-8") as file:
+        file.write('{"cut short\n')
+    append_history(record("batch"), path)
+
+    assert [run["mode"] for run in load_history(path)] == ["single", "batch"]
+
+
+def test_baseline_prefers_latest_run_on_same_dataset(tmp_path):
+    path = tmp_path / "history.jsonl"
+    append_history({**record(fingerprint="abc"), "tag": 1}, path)
+    append_history({**record(fingerprint="other"), "tag": 2}, path)
+    append_history({**record("single", "abc"), "tag": 3}, path)
+
+    assert load_baseline(path, "batch", "abc")["tag"] == 1
+    assert load_baseline(path, "batch", "new")["tag"] == 2
+    assert load_baseline(path, "sweep", "abc") is None
+    assert load_baseline(tmp_path / "missing.jsonl", "batch") is None
+
+
+def test_exported_baseline_must_match_mode(tmp_path):
+    path = tmp_path / "run.json"
+    export_record(record("single"), path)
+
+    assert load_baseline(path, "single")["mode"] == "single"
+    with pytest.raises(ValueError):
+        load_baseline(path, "batch")
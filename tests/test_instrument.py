@@ -0,0 +1,57 @@
+"""Tests for the --instrument probe counters."""
+
+import pickle
+
+from bench.instrument import CountingKey, CountingSequence, ProbeCounter, count_probes
+from search.binary import binary_search
+from search.linear import linear_search, sentinel_linear_search
+
+DATA = [f"record-{i:04d}" for i in range(1024)]
+
+
+def test_linear_search_probes_every_record_up_to_the_target():
+    stats = count_probes(linear_search, DATA, ["record-0009", "record-0019"])
+
+    assert stats["accesses"] == 15
+    assert stats["comparisons"] == 15
+    assert stats["probe_distance"] == 1
+
+
+def test_counts_comparisons_on_either_side():
+    counter = ProbeCounter()
+    key = CountingKey("m", counter)
+
+    assert "a" < key and key < "z" and not key == "x" and "m" == key
+    assert counter.comparisons == 4
+
+
+def test_key_pickles_as_plain_string():
+    key = CountingKey("value", ProbeCounter())
+    restored = pickle.loads(pickle.dumps(key))
+
+    assert restored == "value"
+    assert type(restored) is str
+
+
+def test_copy_reports_to_the_same_counter():
+    counter = ProbeCounter()
+    proxy = CountingSequence(["a", "b"], counter)
+    duplicate = proxy.copy()
+    duplicate.append("c")
+
+    assert list(duplicate) == ["a", "b", "c"]
+    assert len(proxy) == 2
+    assert counter.accesses == 3
+
+
+def test_sentinel_search_runs_on_the_proxy():
+    stats = count_probes(sentinel_linear_search, DATA[:10], ["record-0004"])
+    assert stats["accesses"] >= 5
+
+
+def test_rereads_of_the_same_element_are_not_probes():
+    stats = count_probes(binary_search, DATA, DATA[::97])
+
+    assert stats["rereads"] > 0
+    assert stats["accesses"] <= 11
+    assert stats["probe_distance"] > 10
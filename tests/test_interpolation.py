@@ -0,0 +1,67 @@
+"""Tests for string interpolation search and its key encoder."""
+
+import random
+from bisect import bisect_left
+
+import pytest
+
+from search.interpolation import PrefixKeyEncoder, StringInterpolationSearcher
+
+
+def random_words(seed, count=400, alphabet="abcde", longest=12):
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randrange(longest)))
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("alphabet", ["ab", "abcdefghij", "aäb€"])
+def test_keys_preserve_order(alphabet):
+    words = sorted(random_words(1, alphabet=alphabet))
+    encoder = PrefixKeyEncoder(words)
+    # Probe strings may use bytes the dataset does not contain
+    probes = sorted(words + random_words(2, count=200, alphabet=alphabet + "z0"))
+
+    keys = [encoder.key(word) for word in probes]
+    assert keys == sorted(keys)
+    assert all(0 <= key < 2**64 for key in keys)
+
+
+def test_long_shared_prefixes_tie():
+    encoder = PrefixKeyEncoder(["ab"])
+    prefix = "ab" * encoder.width
+    assert encoder.key(prefix + "a") == encoder.key(prefix + "b")
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_finds_every_target(seed):
+    # Long shared prefixes produce runs of equal keys
+    words = ["ababab" * 4 + word for word in random_words(seed)[:150]]
+    words = sorted(words + random_words(seed + 10, alphabet="cdéf"))
+    engine = StringInterpolationSearcher(words)
+    targets = words[::3] + random_words(seed + 20, count=100, alphabet="abcdefgé")
+
+    for target, result in zip(targets, engine.search_many(targets)):
+        if target in words:
+            assert words[result] == target
+        else:
+            assert result == -1
+    assert engine.stats()["probes"] > 0
+
+
+def test_small_arrays():
+    assert StringInterpolationSearcher([]).search("a") == -1
+    engine = StringInterpolationSearcher(["only"])
+    assert engine.search("only") == 0
+    assert engine.search("other") == -1
+    assert engine(["a", "a", "b"], "a") in (0, 1)
+
+
+def test_probe_counts_reset_on_prepare():
+    words = sorted(random_words(3))
+    engine = StringInterpolationSearcher(words)
+    engine.search_many(words[:10])
+    engine.prepare(words)
+    assert engine.total_queries == 0
+    assert bisect_left(words, words[5]) <= engine.search(words[5])
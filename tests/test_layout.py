@@ -0,0 +1,53 @@
+"""Tests for the Eytzinger and static B+-tree layout engines."""
+
+import random
+from bisect import bisect_left
+
+import pytest
+
+from search.layout import BTreeSearcher, EytzingerSearcher
+
+
+def expected(arr, target):
+    index = bisect_left(arr, target)
+    return index if index < len(arr) and arr[index] == target else -1
+
+
+ENGINES = [
+    EytzingerSearcher,
+    lambda: BTreeSearcher(2),
+    lambda: BTreeSearcher(3),
+    BTreeSearcher,
+]
+
+
+@pytest.mark.parametrize("make", ENGINES)
+@pytest.mark.parametrize("size", [0, 1, 2, 15, 16, 17, 100, 257])
+def test_matches_lower_bound(make, size):
+    rng = random.Random(size)
+    arr = sorted(rng.randrange(size * 2 + 1) for _ in range(size))
+    searcher = make()
+    searcher.prepare(arr)
+    targets = list(range(-1, size * 2 + 2))
+
+    assert searcher.search_many(targets) == [expected(arr, t) for t in targets]
+
+
+@pytest.mark.parametrize("make", ENGINES)
+def test_strings_with_duplicates(make):
+    arr = ["apple", "apple", "fig", "kiwi", "kiwi", "kiwi", "pear"]
+    searcher = make()
+    for target in arr + ["", "banana", "zebra"]:
+        assert searcher(arr, target) == expected(arr, target)
+
+
+def test_btree_rejects_narrow_nodes():
+    with pytest.raises(ValueError):
+        BTreeSearcher(1)
+
+
+@pytest.mark.parametrize("make", [EytzingerSearcher, BTreeSearcher])
+def test_reports_index_memory(make):
+    searcher = make()
+    searcher.prepare(list(range(1000)))
+    assert searcher.stats()["index_memory"] > 0
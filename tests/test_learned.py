@@ -0,0 +1,64 @@
+"""Tests for the two-stage learned index engine."""
+
+import random
+
+import pytest
+
+from search.learned import LearnedIndexSearcher
+
+
+def check_lookups(searcher, arr, targets):
+    present = set(arr)
+    for target in targets:
+        index = searcher.search(target)
+        if target in present:
+            assert arr[index] == target
+        else:
+            assert index == -1
+
+
+@pytest.mark.parametrize("records_per_leaf", [1, 4, 64])
+def test_numeric_keys_with_duplicates(records_per_leaf):
+    rng = random.Random(records_per_leaf)
+    arr = sorted(rng.randrange(3000) ** 2 for _ in range(2000))
+    searcher = LearnedIndexSearcher(records_per_leaf, arr)
+
+    check_lookups(searcher, arr, [i**2 for i in range(3000)] + [-1, 2, 3001**2])
+
+
+def test_string_keys_with_shared_prefixes():
+    rng = random.Random(3)
+    arr = sorted(
+        [f"{rng.randrange(1000):03d}" for _ in range(500)]
+        + [f"common-prefix-{i:04d}" for i in range(300)]
+    )
+    searcher = LearnedIndexSearcher(16, arr)
+
+    check_lookups(searcher, arr, arr + ["", "0005x", "common-prefix-9999", "zz"])
+
+
+def test_every_record_lies_in_its_window():
+    arr = sorted(random.Random(4).sample(range(100_000), 5000))
+    searcher = LearnedIndexSearcher(32, arr)
+    max_error = searcher.stats()["max_error"]
+
+    for position, value in enumerate(arr):
+        left, right = searcher.window(value)
+        assert left <= position <= right
+        assert right - left <= 2 * max_error
+
+
+def test_empty_and_single_record():
+    assert LearnedIndexSearcher(arr=[]).search(5) == -1
+    searcher = LearnedIndexSearcher(arr=[7])
+    assert searcher.search(7) == 0
+    assert searcher.search(8) == -1
+
+
+def test_probe_counts_reset_on_prepare():
+    searcher = LearnedIndexSearcher(arr=list(range(1000)))
+    searcher.search_many([1, 2, 3])
+    assert searcher.stats()["probes"] > 0
+
+    searcher.prepare(list(range(10)))
+    assert searcher.stats()["probes"] == 0
@@ -0,0 +1,34 @@
+"""Tests for the prepared sentinel linear search engine."""
+
+import random
+
+from search.linear import SentinelSearcher, linear_search
+
+
+def test_matches_linear_search():
+    rng = random.Random(6)
+    arr = [rng.randrange(50) for _ in range(200)]
+    targets = [rng.randrange(-5, 55) for _ in range(100)]
+    engine = SentinelSearcher(arr)
+
+    expected = [linear_search(arr, target) for target in targets]
+    assert [engine.search(target) for target in targets] == expected
+    assert engine.search_many(targets) == expected
+    assert engine.batch(arr, targets) == expected
+
+
+def test_sentinel_slot_is_restored():
+    arr = ["x", "y"]
+    engine = SentinelSearcher(arr)
+
+    assert engine.search("z") == -1
+    assert engine._buffer == ["x", "y", None]
+    # The caller's list is never modified
+    assert arr == ["x", "y"]
+
+
+def test_rebuilds_for_another_array():
+    engine = SentinelSearcher()
+    assert engine([], "a") == -1
+    assert engine(["b", "a"], "a") == 1
+    assert engine(["a"], "a") == 0
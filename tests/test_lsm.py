@@ -0,0 +1,78 @@
+"""Tests for the updatable sorted index."""
+
+import random
+from bisect import bisect_left, bisect_right
+
+import pytest
+
+from dataset.lsm import LSMSortedIndex
+from search.cache import CachedSearch
+
+
+def test_ranks_match_one_sorted_list():
+    rng = random.Random(7)
+    initial = [rng.randrange(500) for _ in range(300)]
+    inserted = [rng.randrange(500) for _ in range(700)]
+
+    index = LSMSortedIndex(initial, buffer_size=16)
+    index.extend(inserted)
+    expected = sorted(initial + inserted)
+
+    assert list(index) == expected
+    assert len(index) == len(expected)
+    for target in range(-1, 501):
+        rank = index.search(target)
+        if target in expected:
+            # Any copy of a repeated record is a valid answer
+            assert (
+                bisect_left(expected, target) <= rank < bisect_right(expected, target)
+            )
+        else:
+            assert rank == -1
+            assert target not in index
+
+
+def test_search_many_matches_search():
+    index = LSMSortedIndex(["m", "c", "x"], buffer_size=2)
+    index.extend(["a", "q", "c", "z", "b"])
+    targets = ["a", "c", "q", "z", "missing"]
+
+    assert index.search_many(targets) == [index.search(t) for t in targets]
+
+
+def test_runs_stay_logarithmic():
+    index = LSMSortedIndex(buffer_size=4)
+    index.extend(range(4096))
+
+    # Every run is at least GROWTH_FACTOR times its newer neighbour
+    runs = index.components()
+    assert len(runs) <= 8
+    assert all(
+        len(older) >= index.growth * len(newer) for older, newer in zip(runs, runs[1:])
+    )
+    assert index.stats()["merges"] == index.merges > 0
+
+
+def test_version_counts_inserts():
+    index = LSMSortedIndex([3, 1, 2])
+    assert index.version == 0
+    index.insert(5)
+    index.extend([0, 4])
+    assert index.version == 3
+
+
+@pytest.mark.parametrize("buffer_size, growth", [(0, 4), (4, 1)])
+def test_rejects_invalid_parameters(buffer_size, growth):
+    with pytest.raises(ValueError):
+        LSMSortedIndex(buffer_size=buffer_size, growth=growth)
+
+
+def test_cached_search_sees_inserts():
+    index = LSMSortedIndex([1, 3, 5], buffer_size=2)
+    search = CachedSearch(lambda arr, target: arr.search(target), "lru")
+    search.__name__ = "lsm"
+
+    assert search(index, 4) == -1
+    index.insert(4)
+    assert search(index, 4) == 2
+    assert search.misses == 2
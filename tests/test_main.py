@@ -0,0 +1,113 @@
+"""Tests for the shared helpers in main.py."""
+
+import gc
+import json
+import multiprocessing
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import main
+from main import percentile, run_batch_search, run_parallel
+from search.linear import linear_search
+
+
+@pytest.mark.parametrize(
+    "values, pct, expected",
+    [
+        (list(range(1, 11)), 50, 5),
+        (list(range(1, 7)), 50, 3),
+        (list(range(1, 101)), 99, 99),
+        (list(range(1, 101)), 90, 90),
+        (list(range(1, 1001)), 99.9, 999),
+        ([4, 1, 3, 2], 100, 4),
+        ([4, 1, 3, 2], 0, 1),
+        ([7.5], 99, 7.5),
+    ],
+)
+def test_percentile_nearest_rank(values, pct, expected):
+    assert percentile(values, pct) == expected
+
+
+def test_parallel_run_merges_results_in_order():
+    data = [f"record-{i:04d}" for i in range(500)]
+    results = run_parallel(
+        ["linear", "binary", "jump"], data, data, "record-0123", None, runs=1, jobs=2
+    )
+
+    assert [result["algorithm"] for result in results] == [
+        "linear",
+        "binary",
+        "jump",
+    ]
+    assert all(result["found"] for result in results)
+
+
+def test_batch_run_restores_gc_after_failure():
+    def failing_many(arr, targets):
+        raise RuntimeError("search failed")
+
+    assert gc.isenabled()
+    with pytest.raises(RuntimeError):
+        run_batch_search(linear_search, failing_many, ["a"], ["a"], 1, False)
+    assert gc.isenabled()
+
+
+@pytest.fixture
+def spawn_workers():
+    previous = multiprocessing.get_start_method(allow_none=True)
+    multiprocessing.set_start_method("spawn", force=True)
+    yield
+    multiprocessing.set_start_method(previous, force=True)
+
+
+def test_spawned_workers_get_the_run_settings(spawn_workers, monkeypatch):
+    monkeypatch.setattr(main, "CACHES", [])
+    monkeypatch.setattr(main, "CACHE_CAPACITY", main.CACHE_CAPACITY)
+    monkeypatch.setattr(main, "INSTRUMENT", False)
+    main.register_cache(["lru"], 16)
+    main.enable_instrumentation()
+
+    data = [f"record-{i:04d}" for i in range(200)]
+    results = run_parallel(["linear"], data, data, "record-0123", None, runs=1)
+
+    assert [result["algorithm"] for result in results] == [
+        "linear",
+        "linear (lru cache)",
+    ]
+    assert all("accesses" in result for result in results)
+
+
+def test_headless_lookup_skips_unused_subsystems(tmp_path):
+    data_file = tmp_path / "data.txt"
+    data_file.write_text("\n".join(f"record{i}" for i in range(100)) + "\n")
+    script = (
+        "import sys, main; "
+        f"sys.argv = ['main.py', '-f', {str(data_file)!r}, '-a', 'binary', "
+        "'-t', 'record42', '--runs', '1', '--min-time', '0.001', "
+        "'--no-cache', '--format', 'json']; "
+        "main.main(); "
+        "print(' '.join(sys.modules), file=sys.stderr)"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(main.__file__).parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    imported = set(completed.stderr.splitlines()[-1].split())
+    assert json.loads(completed.stdout)["results"][0]["found"]
+    for module in [
+        "rich",
+        "bench.planner",
+        "bench.ranges",
+        "bench.substring",
+        "dataset.mmap_loader",
+        "dataset.snapshot",
+        "search.suffix_array",
+    ]:
+        assert module not in imported
@@ -0,0 +1,62 @@
+"""Tests for the memory-mapped record loader."""
+
+import pytest
+
+from dataset.mmap_loader import open_mapped
+
+TEXT = "  pear \n\napple\n\t\nfig \n äpfel\nlast"
+
+
+def load_lines(path):
+    with open(path, encoding="utf-8") as file:
+        return [line.strip() for line in file if line.strip()]
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_bytes(TEXT.encode("utf-8"))
+    return path
+
+
+def test_records_match_load_data(data_file):
+    with open_mapped(data_file) as records:
+        assert list(records) == load_lines(data_file)
+        assert len(records) == 5
+        assert [records[i] for i in range(len(records))] == list(records)
+
+
+def test_indexing(data_file):
+    with open_mapped(data_file) as records:
+        assert records[-1] == "last"
+        assert records[-5] == "pear"
+        assert records[1:3] == ["apple", "fig"]
+        assert records[::-2] == ["last", "fig", "pear"]
+        for index in (5, -6):
+            with pytest.raises(IndexError):
+                records[index]
+
+
+def test_sorted_view_shares_the_mapping(data_file):
+    with open_mapped(data_file) as records:
+        view = records.sorted_view()
+        assert list(view) == sorted(records)
+        assert view.copy() == sorted(records)
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    with open_mapped(path) as records:
+        assert len(records) == 0
+        assert list(records) == []
+
+
+@pytest.mark.parametrize(
+    "raw", [b"alpha\r\nbeta\r\n", b"gamma\rdelta", b"one\r\rtwo\n\r\nthree\r"]
+)
+def test_line_endings_match_load_data(tmp_path, raw):
+    path = tmp_path / "data.txt"
+    path.write_bytes(raw)
+    with open_mapped(path) as records:
+        assert list(records) == load_lines(path)
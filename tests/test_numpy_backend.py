@@ -0,0 +1,81 @@
+"""Tests for the NumPy search backend against the pure-Python algorithms."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from search.numpy_backend import (  # noqa: E402
+    numpy_binary_search,
+    numpy_binary_search_many,
+    numpy_linear_search,
+    numpy_linear_search_many,
+    to_numpy_array,
+)
+
+RNG = random.Random(2)
+WORDS = [
+    "".join(RNG.choice("abcd") for _ in range(RNG.randrange(1, 5))) for _ in range(120)
+]
+TARGETS = WORDS[::7] + ["", "zz", "abcdabcd", WORDS[0] + "x"]
+
+
+@pytest.mark.parametrize("dtype", [None, "bytes"])
+def test_linear_search_matches_list_index(dtype):
+    arr = to_numpy_array(WORDS, dtype)
+    expected = [WORDS.index(t) if t in WORDS else -1 for t in TARGETS]
+
+    assert [numpy_linear_search(arr, t) for t in TARGETS] == expected
+    assert numpy_linear_search_many(arr, TARGETS) == expected
+
+
+@pytest.mark.parametrize("dtype", [None, "bytes"])
+def test_binary_search_finds_every_target(dtype):
+    data = sorted(WORDS)
+    arr = to_numpy_array(data, dtype)
+
+    for results in (
+        [numpy_binary_search(arr, t) for t in TARGETS],
+        numpy_binary_search_many(arr, TARGETS),
+    ):
+        for target, result in zip(TARGETS, results):
+            if target in data:
+                assert data[result] == target
+            else:
+                assert result == -1
+
+
+def test_targets_wider_than_the_array_do_not_match_a_prefix():
+    arr = to_numpy_array(["ab", "cd"])
+    assert numpy_linear_search(arr, "abc") == -1
+    assert numpy_binary_search(arr, "abc") == -1
+    assert numpy_linear_search_many(arr, ["abc", "cd"]) == [-1, 1]
+
+
+def test_numeric_arrays():
+    data = [3, 9, 9, 14, 20]
+    arr = to_numpy_array(data)
+    assert arr.dtype.kind == "i"
+    assert numpy_binary_search_many(arr, [9, 20, 4, 21]) in (
+        [1, 4, -1, -1],
+        [2, 4, -1, -1],
+    )
+    assert numpy_linear_search_many(arr, [9.0, 3]) == [1, 0]
+
+
+def test_empty_array():
+    arr = to_numpy_array([])
+    assert numpy_linear_search_many(arr, ["a"]) == [-1]
+    assert numpy_binary_search_many(arr, ["a"]) == [-1]
+    assert numpy_binary_search(arr, "a") == -1
+
+
+def test_linear_batch_scans_in_chunks(monkeypatch):
+    import search.numpy_backend as backend
+
+    # A handful of cells per chunk forces one target per scan
+    monkeypatch.setattr(backend, "SCAN_CELLS", 5)
+    arr = to_numpy_array(WORDS)
+    expected = [WORDS.index(t) if t in WORDS else -1 for t in TARGETS]
+    assert numpy_linear_search_many(arr, TARGETS) == expected
@@ -0,0 +1,68 @@
+"""Tests for the multi-core chunked linear search."""
+
+import gc
+
+import pytest
+
+from search.linear import linear_search
+from search.parallel_linear import ParallelLinearSearcher
+
+DATA = [f"record-{i % 300:03d}" for i in range(1000)] + ["tail"]
+
+
+@pytest.fixture
+def searcher():
+    searcher = ParallelLinearSearcher(workers=3)
+    yield searcher
+    searcher.close()
+
+
+def test_returns_lowest_index_across_chunks(searcher):
+    targets = ["record-000", "record-150", "record-299", "tail", "missing", ""]
+    assert searcher.batch(DATA, targets) == [linear_search(DATA, t) for t in targets]
+
+
+def test_rebuilds_for_another_array(searcher):
+    assert searcher(DATA, "tail") == 1000
+    assert searcher(["tail", "x"], "tail") == 0
+
+
+def test_more_workers_than_records():
+    searcher = ParallelLinearSearcher(workers=8)
+    try:
+        assert searcher.batch(["a", "b"], ["b", "a", "c"]) == [1, 0, -1]
+        assert searcher.batch([], ["a"]) == [-1]
+    finally:
+        searcher.close()
+
+
+def test_close_stops_workers(searcher):
+    searcher.prepare(DATA)
+    processes = list(searcher._processes)
+    searcher.close()
+
+    assert all(not process.is_alive() for process in processes)
+    assert searcher(DATA, "record-001") == 1
+
+
+def test_unreferenced_engine_stops_its_workers():
+    searcher = ParallelLinearSearcher(workers=2)
+    searcher.prepare(DATA)
+    processes = list(searcher._processes)
+    finalizer = searcher._finalizer
+
+    del searcher
+    gc.collect()
+
+    assert not finalizer.alive
+    assert all(not process.is_alive() for process in processes)
+
+
+def test_close_unregisters_the_finalizer(searcher):
+    searcher.prepare(DATA)
+    finalizer = searcher._finalizer
+    searcher.prepare(DATA[:10])
+
+    assert not finalizer.alive
+    searcher.close()
+    assert searcher._finalizer is None
@@ -0,0 +1,56 @@
+"""Tests for the --algorithm auto planner."""
+
+import json
+
+from bench.planner import PLAN_FILE, SCAN_LIMIT, plan_algorithm
+from search.binary import binary_search
+from search.linear import linear_search
+
+ALGORITHMS = {"linear": linear_search, "binary": binary_search}
+NEED_SORTED = {"binary"}
+
+
+def test_scans_are_not_calibrated_on_large_data():
+    data = [f"record-{i:06d}" for i in range(SCAN_LIMIT + 1)]
+    plan = plan_algorithm(data, data, ALGORITHMS, NEED_SORTED)
+
+    assert plan.algorithm == "binary"
+    assert list(plan.timings) == ["binary"]
+    assert not plan.cached
+
+
+def test_every_candidate_is_timed_on_small_data():
+    data = [f"record-{i:03d}" for i in range(100)]
+    plan = plan_algorithm(data, data, ALGORITHMS, NEED_SORTED)
+
+    assert set(plan.timings) == {"linear", "binary"}
+    assert plan.algorithm == min(plan.timings, key=plan.timings.get)
+
+
+def test_decision_is_cached_per_fingerprint(tmp_path):
+    data = [f"record-{i:03d}" for i in range(100)]
+    first = plan_algorithm(data, data, ALGORITHMS, NEED_SORTED, "abc", str(tmp_path))
+    second = plan_algorithm(data, data, ALGORITHMS, NEED_SORTED, "abc", str(tmp_path))
+
+    assert not first.cached
+    assert second.cached
+    assert second.algorithm == first.algorithm
+    assert "abc" in json.loads((tmp_path / PLAN_FILE).read_text(encoding="utf-8"))
+
+
+def test_changed_candidates_are_recalibrated(tmp_path):
+    data = [f"record-{i:03d}" for i in range(100)]
+    plan_algorithm(data, data, ALGORITHMS, NEED_SORTED, "abc", str(tmp_path))
+    plan = plan_algorithm(
+        data, data, {"binary": binary_search}, NEED_SORTED, "abc", str(tmp_path)
+    )
+
+    assert not plan.cached
+    assert plan.algorithm == "binary"
+
+
+def test_unreadable_plan_file_is_ignored(tmp_path):
+    (tmp_path / PLAN_FILE).write_text("not json", encoding="utf-8")
+    data = [f"record-{i:03d}" for i in range(100)]
+    plan = plan_algorithm(data, data, ALGORITHMS, NEED_SORTED, "abc", str(tmp_path))
+    assert not plan.cached
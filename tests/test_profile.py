@@ -0,0 +1,54 @@
+"""Tests for the dataset profile used by the algorithm planner."""
+
+import pytest
+
+from dataset.profile import is_sorted, key_uniformity, profile_dataset
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ([], True),
+        (["a"], True),
+        (["a", "a", "b"], True),
+        (["a", "c", "b"], False),
+        (["b", "a"], False),
+    ],
+)
+def test_is_sorted(data, expected):
+    assert is_sorted(data) is expected
+
+
+def test_evenly_spread_keys_are_uniform():
+    data = [f"{i:04d}" for i in range(5000)]
+    assert key_uniformity(data) > 0.9
+
+
+def test_clustered_keys_are_not_uniform():
+    data = sorted([f"a{i:05d}" for i in range(1000)] + ["zzzzzz"])
+    assert key_uniformity(data) < 0.1
+
+
+def test_identical_keys_score_zero():
+    assert key_uniformity(["same"] * 10) == 0.0
+
+
+def test_profile_dataset():
+    data = ["pear", "apple", "fig", "apple"]
+    profile = profile_dataset(data, sorted(data))
+
+    assert profile.size == 4
+    assert not profile.presorted
+    assert profile.duplicate_rate == 0.25
+    assert profile.mean_width == 4.25
+
+
+def test_presorted_when_sorted_copy_is_the_data():
+    data = ["a", "b", "c"]
+    assert profile_dataset(data, data).presorted
+
+
+def test_empty_profile():
+    profile = profile_dataset([], [])
+    assert profile.size == 0
+    assert profile.presorted
@@ -0,0 +1,55 @@
+"""Tests for the --profile and --trace-memory passes."""
+
+import pstats
+
+from bench.profiling import PROFILE_CALLS, collapsed_stacks, profile_calls, trace_memory
+from search.linear import linear_search
+
+DATA = [f"record-{i:03d}" for i in range(200)]
+
+
+def copying_search(arr, target):
+    return list(arr).index(target)
+
+
+def test_profile_writes_dump_and_collapsed_stacks(tmp_path):
+    path = profile_calls("linear (list)", linear_search, DATA, DATA[:7], str(tmp_path))
+
+    assert path == tmp_path / "linear_list.prof"
+    stats = pstats.Stats(str(path))
+    calls = [
+        entry[0] for key, entry in stats.stats.items() if key[2] == "linear_search"
+    ]
+    assert calls and calls[0] >= PROFILE_CALLS
+
+    stacks = path.with_suffix(".collapsed").read_text(encoding="utf-8").splitlines()
+    assert any("linear_search (linear.py:" in line for line in stacks)
+    for line in stacks:
+        stack, _, micros = line.rpartition(" ")
+        assert stack and int(micros) > 0
+
+
+def test_collapsed_stacks_nest_callees_under_callers(tmp_path):
+    path = profile_calls("copy", copying_search, DATA, DATA[-5:], str(tmp_path))
+    stacks = collapsed_stacks(pstats.Stats(str(path)))
+
+    assert any(
+        "copying_search (test_profiling.py:" in line
+        and line.split(";")[-1].startswith("<method 'index' of 'list' objects>")
+        for line in stacks
+    )
+
+
+def test_trace_memory_reports_per_call_peak():
+    stats = trace_memory(copying_search, DATA, DATA[:5])
+    assert stats["peak_memory"] >= 200 * 8
+
+
+def test_trace_memory_reports_only_the_peak():
+    cache = {}
+
+    def caching_search(arr, target):
+        cache[target] = [linear_search(arr, target)]
+        return cache[target][0]
+
+    assert set(trace_memory(caching_search, DATA, DATA[:50])) == {"peak_memory"}
@@ -0,0 +1,97 @@
+"""Tests for the range queries, checked against scans of the sorted list."""
+
+import random
+
+import pytest
+
+from search.ranges import (
+    RangeView,
+    count_equal,
+    count_equal_many,
+    equal_range,
+    equal_range_many,
+    iter_range,
+    prefix_range,
+    prefix_range_many,
+    value_range,
+    value_range_many,
+)
+
+RNG = random.Random(11)
+NUMBERS = sorted(RNG.randrange(60) for _ in range(200))
+WORDS = sorted(
+    "".join(RNG.choice("abc") for _ in range(RNG.randrange(1, 5))) for _ in range(200)
+)
+
+
+def span_of(arr, predicate):
+    """Slice covering the records matching predicate, which must be contiguous."""
+    matches = [i for i, value in enumerate(arr) if predicate(value)]
+    if not matches:
+        return None
+    assert matches == list(range(matches[0], matches[-1] + 1))
+    return slice(matches[0], matches[-1] + 1)
+
+
+@pytest.mark.parametrize("target", range(-1, 62))
+def test_equal_range(target):
+    span = equal_range(NUMBERS, target)
+    expected = span_of(NUMBERS, lambda value: value == target)
+
+    if expected is None:
+        assert span.start == span.stop
+        assert NUMBERS[: span.start] == [v for v in NUMBERS if v < target]
+    else:
+        assert span == expected
+    assert count_equal(NUMBERS, target) == NUMBERS.count(target)
+
+
+@pytest.mark.parametrize("prefix", ["", "a", "ab", "bca", "cc", "ccccc", "d"])
+def test_prefix_range(prefix):
+    span = prefix_range(WORDS, prefix)
+    assert WORDS[span] == [word for word in WORDS if word.startswith(prefix)]
+    assert all(not word.startswith(prefix) for word in WORDS[: span.start])
+    assert all(not word.startswith(prefix) for word in WORDS[span.stop :])
+
+
+@pytest.mark.parametrize("low, high", [(10, 20), (-5, 3), (55, 99), (20, 10), (7, 7)])
+def test_value_range(low, high):
+    span = value_range(NUMBERS, low, high)
+    assert NUMBERS[span] == [value for value in NUMBERS if low <= value <= high]
+
+
+def test_batch_variants_match_single_queries():
+    targets = [RNG.randrange(-2, 62) for _ in range(50)]
+    prefixes = [
+        "".join(RNG.choice("abcd") for _ in range(RNG.randrange(4))) for _ in range(50)
+    ]
+    ranges = [(RNG.randrange(60), RNG.randrange(60)) for _ in range(50)]
+
+    spans = equal_range_many(NUMBERS, targets)
+    assert [NUMBERS[span] for span in spans] == [
+        NUMBERS[equal_range(NUMBERS, target)] for target in targets
+    ]
+    assert count_equal_many(NUMBERS, targets) == [NUMBERS.count(t) for t in targets]
+    assert [WORDS[span] for span in prefix_range_many(WORDS, prefixes)] == [
+        WORDS[prefix_range(WORDS, prefix)] for prefix in prefixes
+    ]
+    assert [NUMBERS[span] for span in value_range_many(NUMBERS, ranges)] == [
+        NUMBERS[value_range(NUMBERS, low, high)] for low, high in ranges
+    ]
+
+
+def test_range_view_reads_through():
+    view = RangeView(NUMBERS, slice(10, 20))
+
+    assert len(view) == 10
+    assert list(view) == NUMBERS[10:20]
+    assert list(iter_range(NUMBERS, slice(10, 20))) == NUMBERS[10:20]
+    assert view[0] == NUMBERS[10] and view[-1] == NUMBERS[19]
+    assert list(view[2:5]) == NUMBERS[12:15]
+    assert view.indices() == range(10, 20)
+
+    for index in (10, -11):
+        with pytest.raises(IndexError):
+            view[index]
+    with pytest.raises(ValueError):
+        view[::2]
@@ -0,0 +1,104 @@
+"""Tests for the lazy algorithm registry."""
+
+import pytest
+
+from search import registry
+from search.registry import (
+    LazyRegistry,
+    batch_function,
+    engine_loader,
+    function_loader,
+    load_plugin,
+)
+
+
+def counting_loader(value, calls):
+    def load():
+        calls.append(value)
+        return value
+
+    return load
+
+
+def test_entries_are_built_once_on_first_access():
+    calls = []
+    algorithms = LazyRegistry(
+        {"a": counting_loader(1, calls), "b": counting_loader(2, calls)}
+    )
+
+    assert list(algorithms) == ["a", "b"] and "b" in algorithms
+    assert calls == []
+    assert algorithms["b"] == algorithms["b"] == 2
+    assert calls == [2]
+
+
+def test_discovery_runs_once_and_never_replaces_entries():
+    calls = []
+
+    def discover():
+        calls.append("discover")
+        return {"a": lambda: "plugin a", "c": lambda: "plugin c"}
+
+    algorithms = LazyRegistry({"a": lambda: "built-in a"}, discover)
+
+    assert algorithms["a"] == "built-in a"
+    assert calls == []
+    assert "c" in algorithms and "missing" not in algorithms
+    assert list(algorithms) == ["a", "c"]
+    assert algorithms["a"] == "built-in a" and algorithms["c"] == "plugin c"
+    assert algorithms.discovered == ["c"]
+    assert calls == ["discover"]
+
+
+def test_loaders_import_on_call():
+    from search.binary import binary_search
+    from search.layout import BTreeSearcher
+
+    assert function_loader("search.binary", "binary_search")() is binary_search
+    engine = engine_loader("search.layout", "BTreeSearcher", 4)()
+    assert isinstance(engine, BTreeSearcher) and engine.width == 4
+
+
+def test_batch_function_prefers_engine_batch():
+    engine = engine_loader("search.layout", "BTreeSearcher")()
+    assert batch_function(engine) == engine.batch
+
+    def plain_search(arr, target):
+        return arr.index(target) if target in arr else -1
+
+    search_many = batch_function(plain_search)
+    assert search_many.__name__ == "plain_search_many"
+    assert search_many(["a", "b"], ["b", "c"]) == [1, -1]
+
+
+class FakeEntryPoint:
+    def __init__(self, value):
+        self.value = value
+
+    def load(self):
+        return self.value
+
+
+class PluginSearcher:
+    def __call__(self, arr, target):
+        return 0
+
+
+@pytest.fixture
+def plugins(monkeypatch):
+    found = {
+        "engine": FakeEntryPoint(PluginSearcher),
+        "broken": FakeEntryPoint(42),
+    }
+    monkeypatch.setattr(registry, "plugin_entry_points", lambda group: found)
+
+
+def test_load_plugin_instantiates_classes(plugins):
+    algorithm = load_plugin("engine")
+    assert isinstance(algorithm, PluginSearcher)
+    assert algorithm.__name__ == "engine"
+
+
+def test_load_plugin_rejects_non_callables(plugins):
+    with pytest.raises(TypeError):
+        load_plugin("broken")
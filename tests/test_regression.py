@@ -0,0 +1,87 @@
+"""
+Tests for the Mann-Whitney U test behind --compare-baseline.
+
+The exact tail and the tie-corrected approximation are checked against
+brute-force counts over every way of splitting the pooled samples.
+"""
+
+from itertools import combinations
+
+import pytest
+
+from bench.regression import _exact_upper_tail, _midranks, mann_whitney_greater
+
+
+def permutation_tail(first, second):
+    """P(U >= observed U) over every split of the pooled samples."""
+    pooled = [*first, *second]
+    m = len(first)
+    ranks = _midranks(pooled)
+    observed = sum(ranks[:m])
+
+    splits = list(combinations(ranks, m))
+    return sum(1 for split in splits if sum(split) >= observed) / len(splits)
+
+
+def u_distribution(m, n):
+    """Number of orderings of m + n distinct values for every U."""
+    counts = [0] * (m * n + 1)
+    for positions in combinations(range(m + n), m):
+        # Each first-sample value beats the second-sample values below it
+        counts[sum(position - i for i, position in enumerate(positions))] += 1
+    return counts
+
+
+@pytest.mark.parametrize("m", range(1, 6))
+@pytest.mark.parametrize("n", range(1, 6))
+def test_exact_upper_tail_matches_enumeration(m, n):
+    counts = u_distribution(m, n)
+    total = sum(counts)
+
+    for u in range(m * n + 1):
+        expected = sum(counts[u:]) / total
+        assert _exact_upper_tail(m, n, u) == pytest.approx(expected)
+        # Fractional U rounds up to the next attainable value
+        assert _exact_upper_tail(m, n, u - 0.5) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ([5.0, 6.0, 7.0], [1.0, 2.0, 3.0]),
+        ([1.0, 2.0, 3.0], [5.0, 6.0, 7.0]),
+        ([1.0, 4.0, 6.0, 9.0], [2.0, 3.0, 5.0, 7.0, 8.0]),
+        ([0.3], [0.1, 0.2, 0.4]),
+    ],
+)
+def test_distinct_samples_use_exact_tail(first, second):
+    assert mann_whitney_greater(first, second) == pytest.approx(
+        permutation_tail(first, second)
+    )
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ([3, 3, 4, 5, 5, 6, 7, 7], [1, 2, 2, 3, 4, 4, 5, 6]),
+        ([5, 5, 6, 6, 7, 7, 8], [5, 6, 6, 7, 7, 8, 8]),
+        ([4, 4, 5, 5, 5, 6, 6, 7], [3, 3, 4, 4, 5, 5, 6, 6]),
+    ],
+)
+def test_tied_samples_approximate_permutation_tail(first, second):
+    assert mann_whitney_greater(first, second) == pytest.approx(
+        permutation_tail(first, second), abs=0.03
+    )
+
+
+def test_identical_samples_are_not_significant():
+    assert mann_whitney_greater([2.0] * 5, [2.0] * 4) == 1.0
+
+
+def test_empty_sample():
+    assert mann_whitney_greater([], [1.0, 2.0]) == 1.0
+    assert mann_whitney_greater([1.0], []) == 1.0
+
+
+def test_midranks_average_ties():
+    assert _midranks([3, 1, 3, 2, 3]) == [4.0, 1.0, 4.0, 2.0, 4.0]
@@ -0,0 +1,112 @@
+"""Tests for the coalescing lookup server and its load generator."""
+
+import asyncio
+import socket
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from search.linear import linear_search_many
+from service.loadgen import run_level
+from service.server import DEFAULT_HOST, ERROR_PREFIX, LookupServer
+
+DATA = [f"record-{i:03d}" for i in range(200)]
+
+
+def free_port():
+    with socket.socket() as probe:
+        probe.bind((DEFAULT_HOST, 0))
+        return probe.getsockname()[1]
+
+
+def serving(server, client):
+    """Run client(port) against the server and return its result."""
+
+    async def run():
+        port = free_port()
+        ready = asyncio.Event()
+        task = asyncio.create_task(server.serve(DEFAULT_HOST, port, ready.set))
+        await asyncio.wait_for(ready.wait(), 10)
+        try:
+            return await client(port)
+        finally:
+            task.cancel()
+
+    return asyncio.run(run())
+
+
+async def lookup(port, lines):
+    reader, writer = await asyncio.open_connection(DEFAULT_HOST, port)
+    responses = []
+    for line in lines:
+        writer.write(line + b"\n")
+        await writer.drain()
+        responses.append(await reader.readline())
+    writer.close()
+    return responses
+
+
+def test_answers_lookups_in_order():
+    server = LookupServer(linear_search_many, DATA)
+    responses = serving(
+        server, lambda port: lookup(port, [b"record-005", b"nope", b" record-199 "])
+    )
+    assert responses == [b"5\n", b"-1\n", b"199\n"]
+
+
+def test_concurrent_lookups_are_coalesced():
+    searched = []
+
+    def batch_search(data, targets):
+        searched.append(list(targets))
+        return linear_search_many(data, targets)
+
+    server = LookupServer(batch_search, DATA, max_delay=0.005)
+    stream = DATA[:50] * 4
+    result = serving(server, lambda port: run_level(DEFAULT_HOST, port, stream, 16))
+    stats = server.stats()
+
+    assert result["requests"] == result["found"] == len(stream)
+    assert stats["requests"] == len(stream)
+    assert stats["batches"] < len(stream)
+    assert stats["mean_batch"] > 1
+    # Identical lookups in a batch are searched once
+    assert all(len(batch) == len(set(batch)) for batch in searched)
+    assert stats["searches"] == sum(map(len, searched))
+
+
+@pytest.mark.parametrize("max_batch, max_delay", [(0, 0.0), (1, -1.0)])
+def test_rejects_bad_settings(max_batch, max_delay):
+    with pytest.raises(ValueError):
+        LookupServer(linear_search_many, DATA, max_batch, max_delay)
+
+
+def test_failed_request_gets_error_line_and_connection_stays_open():
+    def batch_search(data, targets):
+        if "boom" in targets:
+            raise RuntimeError("search failed")
+        return linear_search_many(data, targets)
+
+    server = LookupServer(batch_search, DATA)
+    responses = serving(
+        server, lambda port: lookup(port, [b"\xff\xfe", b"boom", b"record-007"])
+    )
+
+    assert responses[0].startswith(ERROR_PREFIX + b" UnicodeDecodeError")
+    assert responses[1] == ERROR_PREFIX + b" RuntimeError: search failed\n"
+    assert responses[2] == b"7\n"
+
+
+def test_importing_the_load_generator_skips_rich():
+    script = "import sys, service.loadgen; print('rich' in sys.modules)"
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert completed.stdout.strip() == "False"
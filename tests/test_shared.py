@@ -0,0 +1,58 @@
+"""Tests for publishing datasets through shared memory."""
+
+import pytest
+
+from dataset.shared import SharedRecords, SharedRecordsView, attach_records
+
+RECORDS = ["pear", "", "äpfel", "fig", "apple"]
+
+
+def test_attach_reads_back_every_record():
+    with SharedRecords(RECORDS) as shared:
+        assert shared.handle.count == len(RECORDS)
+        assert attach_records(shared.handle) == RECORDS
+
+
+@pytest.mark.parametrize(
+    "start, stop", [(0, 2), (1, 4), (4, 5), (2, 99), (3, 3), (5, None)]
+)
+def test_attach_reads_a_range(start, stop):
+    with SharedRecords(RECORDS) as shared:
+        assert attach_records(shared.handle, start, stop) == RECORDS[start:stop]
+
+
+def test_empty_dataset():
+    with SharedRecords([]) as shared:
+        assert shared.handle.count == 0
+        assert attach_records(shared.handle) == []
+
+
+def test_view_reads_records_in_place():
+    with SharedRecords(RECORDS) as shared:
+        with SharedRecordsView(shared.handle) as view:
+            assert list(view) == RECORDS
+            assert view[-1] == "apple" and view[1:3] == RECORDS[1:3]
+            with pytest.raises(IndexError):
+                view[-len(RECORDS) - 1]
+
+
+@pytest.mark.parametrize("start, stop", [(0, 2), (1, 4), (2, 99), (3, 3), (5, None)])
+def test_view_of_a_range(start, stop):
+    with SharedRecords(RECORDS) as shared:
+        with SharedRecordsView(shared.handle, start, stop) as view:
+            assert list(view) == RECORDS[start:stop]
+
+
+def first_index(records, target, start, stop):
+    return next((i for i in range(start, stop) if records[i] == target), -1)
+
+
+@pytest.mark.parametrize("target", RECORDS + ["missing", "app", "pearfig"])
+def test_find_matches_whole_records(target):
+    records = RECORDS * 2
+    with SharedRecords(records) as shared:
+        with SharedRecordsView(shared.handle, 1) as view:
+            local = records[1:]
+            for start, stop in [(0, None), (5, None), (0, 3), (4, 4)]:
+                expected = first_index(local, target, start, stop or len(local))
+                assert view.find(target, start, stop) == expected
@@ -0,0 +1,119 @@
+"""Tests for the on-disk dataset snapshot cache."""
+
+import pytest
+
+from dataset.snapshot import (
+    HEADER,
+    MAGIC,
+    build_snapshot,
+    file_fingerprint,
+    load_snapshot,
+    read_snapshot,
+    sorted_records,
+    write_snapshot,
+)
+
+RECORDS = ["pear", "apple", "fig", "", "äpfel", "apple"]
+
+
+def load_lines(path):
+    with open(path, encoding="utf-8") as file:
+        return [line.strip() for line in file]
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_text("\n".join(RECORDS) + "\n", encoding="utf-8")
+    return path
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "one.snap"
+    write_snapshot(path, build_snapshot(RECORDS))
+    snapshot = read_snapshot(path)
+
+    assert snapshot.records == RECORDS
+    assert sorted_records(snapshot) == sorted(RECORDS)
+
+
+def test_empty_dataset(tmp_path):
+    path = tmp_path / "empty.snap"
+    write_snapshot(path, build_snapshot([]))
+    snapshot = read_snapshot(path)
+
+    assert snapshot.records == []
+    assert sorted_records(snapshot) == []
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "bogus.snap"
+    path.write_bytes(b"not a snapshot at all, but long enough")
+    with pytest.raises(ValueError):
+        read_snapshot(path)
+
+
+def test_second_load_hits_the_cache(tmp_path, data_file):
+    cache_dir = tmp_path / "cache"
+    calls = []
+
+    def loader(path):
+        calls.append(path)
+        return load_lines(path)
+
+    first, hit = load_snapshot(data_file, cache_dir, loader)
+    assert not hit
+    second, hit = load_snapshot(data_file, cache_dir, loader)
+    assert hit
+    assert len(calls) == 1
+    assert second.records == first.records == RECORDS
+
+
+def test_changed_content_misses(tmp_path, data_file):
+    cache_dir = tmp_path / "cache"
+    before = file_fingerprint(data_file, cache_dir)
+    load_snapshot(data_file, cache_dir, load_lines)
+
+    data_file.write_text("kiwi\nbanana\n", encoding="utf-8")
+    assert file_fingerprint(data_file, cache_dir) != before
+    snapshot, hit = load_snapshot(data_file, cache_dir, load_lines)
+    assert not hit
+    assert sorted_records(snapshot) == ["banana", "kiwi"]
+
+
+def test_corrupt_snapshot_is_rebuilt(tmp_path, data_file):
+    cache_dir = tmp_path / "cache"
+    load_snapshot(data_file, cache_dir, load_lines)
+    for path in cache_dir.glob("*.snap"):
+        path.write_bytes(path.read_bytes()[:30])
+
+    snapshot, hit = load_snapshot(data_file, cache_dir, load_lines)
+    assert not hit
+    assert snapshot.records == RECORDS
+
+
+def test_sort_time_is_reported_only_when_sorting(tmp_path):
+    path = tmp_path / "timed.snap"
+    built = build_snapshot(RECORDS)
+    assert built.sort_time > 0
+    write_snapshot(path, built)
+    assert read_snapshot(path).sort_time == 0.0
+
+
+def test_stores_only_the_order_next_to_the_records(tmp_path):
+    path = tmp_path / "small.snap"
+    write_snapshot(path, build_snapshot(RECORDS))
+    blob = "\n".join(RECORDS).encode("utf-8")
+
+    assert path.stat().st_size == HEADER.size + 8 * len(RECORDS) + len(blob)
+
+
+def test_snapshot_of_an_older_format_is_rebuilt(tmp_path, data_file):
+    cache_dir = tmp_path / "cache"
+    load_snapshot(data_file, cache_dir, load_lines)
+    for path in cache_dir.glob("*.snap"):
+        path.write_bytes(b"SABSNAP1" + path.read_bytes()[len(MAGIC) :])
+
+    snapshot, hit = load_snapshot(data_file, cache_dir, load_lines)
+    assert not hit
+    assert snapshot.records == RECORDS
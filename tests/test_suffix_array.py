@@ -0,0 +1,73 @@
+"""Tests for the suffix array substring index."""
+
+import random
+
+import pytest
+
+from search.linear import linear_substring_search
+from search.suffix_array import (
+    SuffixArraySearcher,
+    build_lcp_array,
+    build_suffix_array,
+)
+
+
+def common_prefix(a, b):
+    length = 0
+    while length < min(len(a), len(b)) and a[length] == b[length]:
+        length += 1
+    return length
+
+
+@pytest.mark.parametrize("text", ["", "a", "banana", "aaaaaaa", "abab\x00ab\x00"])
+def test_suffix_and_lcp_arrays(text):
+    suffixes, rank = build_suffix_array(text)
+    assert suffixes == sorted(range(len(text)), key=lambda i: text[i:])
+    assert all(rank[position] == i for i, position in enumerate(suffixes))
+
+    lcp = build_lcp_array(text, suffixes, rank)
+    assert lcp == [0] * bool(text) + [
+        common_prefix(text[a:], text[b:]) for a, b in zip(suffixes, suffixes[1:])
+    ]
+
+
+def test_find_all_matches_linear_scan():
+    rng = random.Random(3)
+    records = [
+        "".join(rng.choice("abc") for _ in range(rng.randrange(0, 8)))
+        for _ in range(150)
+    ]
+    patterns = {
+        "".join(rng.choice("abcd") for _ in range(rng.randrange(1, 5)))
+        for _ in range(80)
+    }
+
+    engine = SuffixArraySearcher(records)
+    for pattern in sorted(patterns):
+        expected = linear_substring_search(records, pattern)
+        assert engine.find_all(pattern) == expected
+        assert engine(records, pattern) == expected
+        assert engine.search(pattern) == (expected[0] if expected else -1)
+
+
+def test_special_patterns():
+    records = ["apple", "banana", "cherry"]
+    engine = SuffixArraySearcher(records)
+
+    assert engine.find_all("") == [0, 1, 2]
+    assert engine.find_all("\x00") == []
+    # Matches never run across the boundary between two records
+    assert engine.find_all("eb") == []
+    assert engine.batch(records, ["an", "rr", "x"]) == [1, 2, -1]
+
+
+def test_rebuilds_for_a_new_array():
+    engine = SuffixArraySearcher()
+    assert engine(["one", "two"], "o") == [0, 1]
+    assert engine(["three"], "o") == []
+    assert engine([], "o") == []
+
+
+def test_rejects_separator_in_records():
+    with pytest.raises(ValueError):
+        SuffixArraySearcher(["ok", "not\x00ok"])
@@ -0,0 +1,74 @@
+"""Tests for the scaling sweep: sizes, sampling, complexity fits and crossovers."""
+
+import math
+
+import pytest
+
+from bench.sweep import (
+    claimed_complexity,
+    find_crossovers,
+    fit_complexity,
+    subsample,
+    sweep_sizes,
+    sweep_targets,
+)
+from search.binary import binary_search
+
+SIZES = [1000, 2000, 5000, 10000, 20000, 50000, 100000, 200000]
+
+
+def test_sweep_sizes_follow_the_1_2_5_series():
+    assert sweep_sizes(25000) == [1000, 2000, 5000, 10000, 20000, 25000]
+    assert sweep_sizes(1000) == [1000]
+    assert sweep_sizes(500) == [500]
+
+
+def test_subsample_stays_sorted_and_spread():
+    data = [f"{i:05d}" for i in range(1000)]
+    sample = subsample(data, 10)
+
+    assert sample == sorted(sample)
+    assert sample[0] == data[0] and sample[-1] == data[900]
+    assert subsample(data, 5000) == data
+
+
+def test_sweep_targets_are_seeded():
+    sample = [str(i) for i in range(100)]
+    assert sweep_targets(sample, 20, seed=4) == sweep_targets(sample, 20, seed=4)
+    assert set(sweep_targets(sample, 50)) <= set(sample)
+
+
+@pytest.mark.parametrize(
+    "model, curve",
+    [
+        ("O(1)", lambda n: 1.0),
+        ("O(log n)", math.log2),
+        ("O(sqrt n)", math.sqrt),
+        ("O(n)", lambda n: n),
+    ],
+)
+def test_fit_recovers_the_generating_curve(model, curve):
+    times = [2e-7 + 3e-8 * curve(n) for n in SIZES]
+    assert fit_complexity(SIZES, times).model == model
+
+
+def test_crossover_is_interpolated_between_sizes():
+    sizes = [100, 1000, 10000]
+    # linear overtakes constant between 1000 and 10000, where 3e-9 n = 1e-5
+    series = {"constant": [1e-5] * 3, "linear": [3e-9 * n for n in sizes]}
+    (crossover,) = find_crossovers(sizes, series)
+
+    assert crossover.faster == "constant"
+    assert crossover.slower == "linear"
+    assert 1000 < crossover.size < 10000
+    assert crossover.size == pytest.approx(1e-5 / 3e-9, rel=1e-6)
+
+
+def test_close_series_have_no_crossover():
+    series = {"a": [1.0, 1.05, 0.97], "b": [1.02, 1.0, 1.01]}
+    assert find_crossovers([10, 100, 1000], series) == []
+
+
+def test_claimed_complexity_reads_the_docstring():
+    assert claimed_complexity(binary_search) == "O(log n)"
+    assert claimed_complexity(lambda arr, target: -1) == "-"
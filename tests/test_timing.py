@@ -0,0 +1,62 @@
+"""Tests for the calibrated timing harness."""
+
+import gc
+import time
+
+import pytest
+
+from bench.timing import autorange, calibrated_timing, query_latencies
+
+
+def test_autorange_reaches_min_time():
+    calls = []
+
+    def slow(x):
+        calls.append(x)
+        time.sleep(0.001)
+
+    number = autorange(slow, (1,), min_time=0.01)
+    assert number in (1, 2, 5, 10, 20, 50)
+    assert number * 0.001 >= 0.005
+
+
+def test_autorange_is_capped(monkeypatch):
+    import bench.timing
+
+    monkeypatch.setattr(bench.timing, "MAX_NUMBER", 50)
+    assert autorange(lambda: None, (), min_time=3600) == 50
+
+
+def test_calibrated_timing_reports_the_result():
+    batches = []
+    timing = calibrated_timing(
+        sorted, ([3, 1, 2],), repeat=4, min_time=0.001, on_batch=batches.append
+    )
+
+    assert timing.result == [1, 2, 3]
+    assert len(timing.per_call_times) == 4
+    assert all(t >= 0 for t in timing.per_call_times)
+    assert timing.number >= 1
+    assert batches == [0, 1, 2, 3]
+
+
+def test_calibrated_timing_restores_the_collector():
+    def failing():
+        raise RuntimeError("boom")
+
+    assert gc.isenabled()
+    with pytest.raises(RuntimeError):
+        calibrated_timing(failing, (), min_time=0.001)
+    assert gc.isenabled()
+
+
+def test_query_latencies_time_each_query():
+    data = ["a", "b", "c"]
+    latencies, found = query_latencies(
+        lambda arr, t: arr.index(t) if t in arr else -1, data, ["a", "x", "c", "c"]
+    )
+
+    assert len(latencies) == 4
+    assert found == 3
+    assert all(latency >= 0 for latency in latencies)
+    assert gc.isenabled()
@@ -0,0 +1,75 @@
+"""Tests for the synthetic query workload generator."""
+
+from bisect import bisect_left
+
+import pytest
+
+from bench.workload import PRESETS, WorkloadProfile, generate_workload, parse_profile
+
+DATA = sorted(f"key-{i:05d}" for i in range(2000))
+
+
+def test_same_seed_gives_same_stream():
+    profile = PRESETS["misses"]
+    assert generate_workload(DATA, profile, 300, seed=5) == generate_workload(
+        DATA, profile, 300, seed=5
+    )
+    assert generate_workload(DATA, profile, 300, seed=5) != generate_workload(
+        DATA, profile, 300, seed=6
+    )
+
+
+@pytest.mark.parametrize("hit_ratio", [0.0, 0.25, 1.0])
+def test_hit_ratio_is_exact(hit_ratio):
+    profile = WorkloadProfile("test", hit_ratio=hit_ratio)
+    queries = generate_workload(DATA, profile, 400)
+    present = set(DATA)
+
+    assert len(queries) == 400
+    assert sum(query in present for query in queries) == round(400 * hit_ratio)
+
+
+def test_in_range_misses_fall_between_keys():
+    queries = generate_workload(DATA, WorkloadProfile("test", hit_ratio=0.0), 200)
+
+    for query in queries:
+        position = bisect_left(DATA, query)
+        assert 0 < position < len(DATA)
+        assert DATA[position] != query
+
+
+def test_out_of_range_misses_fall_outside_keys():
+    queries = generate_workload(DATA, PRESETS["out_of_range"], 200)
+    assert all(query < DATA[0] or query > DATA[-1] for query in queries)
+
+
+def test_front_position_favours_low_keys():
+    queries = generate_workload(DATA, PRESETS["front"], 1000)
+    front = sum(DATA.index(query) < len(DATA) // 2 for query in queries)
+    assert front > 750
+
+
+def test_zipf_concentrates_on_few_keys():
+    uniform = generate_workload(DATA, PRESETS["uniform"], 2000)
+    skewed = generate_workload(DATA, PRESETS["zipf"], 2000)
+    assert len(set(skewed)) < len(set(uniform)) / 2
+
+
+def test_empty_dataset_gives_empty_stream():
+    assert generate_workload([], PRESETS["uniform"], 10) == []
+
+
+def test_parse_profile():
+    assert parse_profile("zipf") is PRESETS["zipf"]
+    profile = parse_profile("hit=0.9,position=back,zipf=1.2,out=0.5")
+    assert profile == WorkloadProfile(
+        "hit=0.9,position=back,zipf=1.2,out=0.5", 0.9, "back", 1.2, 0.5
+    )
+
+
+@pytest.mark.parametrize(
+    "spec", ["nonsense", "speed=2", "position=sideways", "hit=1.5", "zipf=-1"]
+)
+def test_parse_profile_rejects_bad_specs(spec):
+    with pytest.raises(ValueError):
+        parse_profile(spec)